@@ -1,14 +1,99 @@
-import re
 import pandas as pd
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Callable, Awaitable
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import os
+import asyncio
+import random
+import threading
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass
 import logging
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _json_loads(data: Any) -> Any:
+    """Deserialize JSON from str or bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Static parts of the classification prompts, built once at import time
+_PROMPT_CATEGORIES = """Categories:
+- Business Name: Names of businesses, companies, shops, restaurants
+- Phone Number: Phone numbers in any format
+- Email: Email addresses
+- Category: Business types, categories, amenities, services offered
+- Location: Addresses, cities, states, coordinates, geographic locations
+- Social Links: Websites, social media URLs, online links
+- Review: Customer reviews, ratings, feedback, comments
+- Hours: Operating hours, schedules, time information
+- Price: Pricing information, costs, fees, price ranges
+- Unknown / Junk: Unclear or irrelevant data"""
+
+_PROMPT_HEADER = f"""
+You are an expert data analyst. Classify this CSV column into one of these categories:
+
+{_PROMPT_CATEGORIES}
+
+Column Analysis:"""
+
+_PROMPT_FOOTER = """
+
+Instructions:
+1. Analyze the column name and sample values
+2. Choose the MOST APPROPRIATE category
+3. Provide confidence score (0.0 to 1.0)
+4. Give brief reasoning
+
+Respond in this exact JSON format:
+{"category": "Category Name", "confidence": 0.85, "reasoning": "Brief explanation"}
+"""
+
+_BATCH_PROMPT_HEADER = f"""
+You are an expert data analyst. Classify each of these CSV columns into one of these categories:
+
+{_PROMPT_CATEGORIES}
+
+Columns to classify:"""
+
+_BATCH_PROMPT_FOOTER = """
+
+Instructions:
+1. Analyze each column name and its sample values
+2. Choose the MOST APPROPRIATE category for every column
+3. Provide confidence score (0.0 to 1.0)
+4. Give brief reasoning
+
+Respond in this exact JSON format, with one entry per column:
+{"results": [{"index": 1, "category": "Category Name", "confidence": 0.85, "reasoning": "Brief explanation"}]}
+"""
+
 @dataclass
 class AIClassificationResult:
     """Result from AI-based classification."""
@@ -16,13 +101,169 @@ class AIClassificationResult:
     confidence: float
     reasoning: str
 
+class RateLimiter:
+    """
+    Token bucket that refills `capacity` units every `period` seconds.
+    Usable from both threads and coroutines: callers reserve units and
+    sleep for the returned delay themselves.
+    """
+
+    def __init__(self, capacity: float, period: float = 60.0):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, cost: float = 1.0) -> float:
+        """Reserve `cost` units and return the seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= min(cost, self.capacity)
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+class AIResultCache:
+    """
+    Cache of parsed AI classifications keyed by column name, samples and base
+    category. A bounded in-process LRU sits in front of a SQLite table that
+    persists results across runs; pass an empty path to keep it in memory only.
+    """
+
+    def __init__(self, path: Optional[str], memory_size: int = 4096):
+        self.path = os.path.expanduser(path) if path else None
+        self.memory_size = memory_size
+        self._memory = OrderedDict()
+        self._connection = None
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def make_key(column_name: str, sample_values: List[str], base_category: str) -> str:
+        """Build the cache key for a column."""
+        samples = ','.join(str(value) for value in sample_values[:3])
+        return hashlib.blake2b(f"{column_name}|{base_category}|{samples}".encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[AIClassificationResult]:
+        """Look up a cached result, checking memory before disk."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            connection = self._connect()
+            if connection is None:
+                return None
+
+            try:
+                row = connection.execute(
+                    'SELECT category, confidence, reasoning FROM ai_classifications WHERE key = ?', (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                self.logger.warning(f"AI cache read failed: {e}")
+                return None
+
+            if row is None:
+                return None
+
+            result = AIClassificationResult(category=row[0], confidence=row[1], reasoning=row[2])
+            self._remember(key, result)
+            return result
+
+    def set_many(self, results: Dict[str, AIClassificationResult]):
+        """Store several results, writing them to disk in a single transaction."""
+        if not results:
+            return
+
+        with self._lock:
+            for key, result in results.items():
+                self._remember(key, result)
+
+            connection = self._connect()
+            if connection is None:
+                return
+
+            try:
+                with connection:
+                    connection.executemany(
+                        'INSERT OR REPLACE INTO ai_classifications (key, category, confidence, reasoning) VALUES (?, ?, ?, ?)',
+                        [(key, r.category, r.confidence, r.reasoning) for key, r in results.items()]
+                    )
+            except sqlite3.Error as e:
+                self.logger.warning(f"AI cache write failed: {e}")
+
+    def _remember(self, key: str, result: AIClassificationResult):
+        """Insert into the in-process LRU, evicting the oldest entry when full."""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite database on first use; disable the disk layer if that fails."""
+        if self._connection is not None or self.path is None:
+            return self._connection
+
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS ai_classifications '
+                '(key TEXT PRIMARY KEY, category TEXT, confidence REAL, reasoning TEXT)'
+            )
+        except (sqlite3.Error, OSError) as e:
+            self.logger.warning(f"AI cache disabled, cannot open {self.path}: {e}")
+            self._connection = None
+            self.path = None
+
+        return self._connection
+
 class AIEnhancedColumnClassifier:
     """
     Column classifier enhanced with free AI APIs for better accuracy.
     Uses multiple free AI services as fallbacks.
     """
-    
-    def __init__(self):
+
+    # Request timeout (seconds) per API
+    API_TIMEOUTS = {
+        'openrouter': 15,
+        'huggingface': 10,
+        'groq': 15,
+        'openai_compatible': 15
+    }
+
+    # Retry policy for rate limits and transient server errors
+    RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+    MAX_ATTEMPTS = 5
+    BACKOFF_BASE = 0.5  # seconds, doubled on every attempt
+    BACKOFF_JITTER = 0.25
+    MAX_BACKOFF = 30  # seconds, also caps a provider's Retry-After
+
+    # Wall-clock budget for racing the AI APIs, including rate-limit waits and retries
+    RACE_TIMEOUT = 15  # seconds
+
+    # Skip an API for a while after this many consecutive failed requests
+    CIRCUIT_BREAKER_THRESHOLD = 3
+    CIRCUIT_BREAKER_COOLDOWN = 60  # seconds
+
+    # Completion budget per column when several columns share one request
+    BATCH_TOKENS_PER_COLUMN = 60
+
+    # Keep-alive connection pool sizes for the AI endpoints
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 64
+    DNS_CACHE_TTL = 300  # seconds
+
+    # Groq batch API job settings
+    BATCH_COMPLETION_WINDOW = '24h'
+    BATCH_FINAL_STATUSES = {'completed', 'failed', 'expired', 'cancelled'}
+
+    # Upper bound on the wall-clock time of test_ai_connection
+    CONNECTION_TEST_TIMEOUT = 20  # seconds
+
+    def __init__(self, max_requests_per_minute: Optional[int] = 30,
+                 max_tokens_per_minute: Optional[int] = 6000, batch_size: int = 10):
         # Initialize enhanced classifier as fallback
         from enhanced_column_classifier import EnhancedColumnClassifier
         self.enhanced_classifier = EnhancedColumnClassifier()
@@ -67,9 +308,33 @@ class AIEnhancedColumnClassifier:
             'Location', 'Social Links', 'Review', 'Hours', 'Price', 
             'Unknown / Junk'
         ]
+        self._categories_set = frozenset(self.categories)
         
         self.logger = logging.getLogger(__name__)
 
+        # Number of uncertain columns classified by a single AI request
+        self.batch_size = max(1, batch_size)
+
+        # Pooled HTTP session so repeated requests reuse warm connections;
+        # retries are handled by _post_with_retry, not the adapter
+        self._http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE, max_retries=0)
+        self._http.mount('http://', adapter)
+        self._http.mount('https://', adapter)
+
+        # Parsed AI results, reused across runs for identical columns
+        self.cache = AIResultCache(os.getenv('AI_CLASSIFIER_CACHE', '~/.cache/ai_classifier.sqlite'))
+
+        # Per-API pacing (None disables a limit) and circuit breaker state
+        self._request_limiters = {
+            api: RateLimiter(max_requests_per_minute) for api in self.ai_apis
+        } if max_requests_per_minute else {}
+        self._token_limiters = {
+            api: RateLimiter(max_tokens_per_minute) for api in self.ai_apis
+        } if max_tokens_per_minute else {}
+        self._consecutive_failures = {api: 0 for api in self.ai_apis}
+        self._circuit_open_until = {api: 0.0 for api in self.ai_apis}
+
     def classify_columns_with_ai(self, df: pd.DataFrame, use_ai: bool = True) -> Dict[str, Dict[str, Any]]:
         """
         Classify columns using AI enhancement when available.
@@ -89,38 +354,233 @@ class AIEnhancedColumnClassifier:
             return base_results
         
         # Enhance with AI for uncertain classifications
-        enhanced_results = {}
-        
-        for column, result in base_results.items():
-            enhanced_results[column] = result.copy()
-            
-            # Use AI for low-confidence predictions
-            if result['confidence'] < 0.7:
-                ai_result = self._classify_with_ai(
-                    column_name=column,
-                    sample_values=result['sample_values'],
-                    base_category=result['suggested_category'],
-                    base_confidence=result['confidence']
-                )
-                
-                if ai_result and ai_result.confidence > result['confidence']:
-                    enhanced_results[column].update({
-                        'suggested_category': ai_result.category,
-                        'confidence': min(0.95, ai_result.confidence),  # Cap AI confidence
-                        'ai_enhanced': True,
-                        'ai_reasoning': ai_result.reasoning,
-                        'base_suggestion': {
-                            'category': result['suggested_category'],
-                            'confidence': result['confidence']
-                        }
-                    })
-                else:
-                    enhanced_results[column]['ai_enhanced'] = False
-            else:
-                enhanced_results[column]['ai_enhanced'] = False
-        
+        enhanced_results = {column: {**result, 'ai_enhanced': False} for column, result in base_results.items()}
+
+        # Use AI for low-confidence predictions
+        uncertain_columns = self._select_uncertain_columns(base_results, 0.7)
+
+        # Query all uncertain columns concurrently instead of one by one
+        ai_results = self._classify_many_with_ai(uncertain_columns)
+
+        for column, ai_result in ai_results.items():
+            result = base_results[column]
+            if ai_result and ai_result.confidence > result['confidence']:
+                enhanced_results[column].update({
+                    'suggested_category': ai_result.category,
+                    'confidence': min(0.95, ai_result.confidence),  # Cap AI confidence
+                    'ai_enhanced': True,
+                    'ai_reasoning': ai_result.reasoning,
+                    'base_suggestion': {
+                        'category': result['suggested_category'],
+                        'confidence': result['confidence']
+                    }
+                })
+
         return enhanced_results
 
+    def _select_uncertain_columns(self, results: Dict[str, Dict[str, Any]], threshold: float,
+                                  sample_limit: Optional[int] = None) -> List[Tuple[str, List[str], str, float]]:
+        """Pick the columns whose confidence is below threshold with a single array comparison."""
+        if not results:
+            return []
+
+        columns = list(results)
+        confidences = np.fromiter((result['confidence'] for result in results.values()), dtype=np.float64, count=len(columns))
+
+        uncertain = []
+        for index in np.flatnonzero(confidences < threshold):
+            result = results[columns[index]]
+            samples = result['sample_values']
+            uncertain.append((
+                columns[index],
+                samples[:sample_limit] if sample_limit is not None else samples,
+                result['suggested_category'],
+                result['confidence']
+            ))
+
+        return uncertain
+
+    def _classify_many_with_ai(self, columns: List[Tuple[str, List[str], str, float]]) -> Dict[str, Optional[AIClassificationResult]]:
+        """
+        Classify several columns with AI, batching up to `batch_size` columns per
+        request and sending the batches concurrently when aiohttp is available.
+
+        Args:
+            columns: (column_name, sample_values, base_category, base_confidence) tuples
+
+        Returns:
+            Mapping of column name to AI result (None when no API answered)
+        """
+        if not columns:
+            return {}
+
+        if not any(api['enabled'] for api in self.ai_apis.values()):
+            return {column: None for column, _, _, _ in columns}
+
+        # Serve previously classified columns from the cache
+        results, cache_keys, pending = self._lookup_cached(columns)
+
+        if not pending:
+            return results
+
+        # Classify columns with identical signatures once and share the answer
+        unique, groups = self._group_duplicate_columns(pending)
+        batches = [unique[i:i + self.batch_size] for i in range(0, len(unique), self.batch_size)]
+
+        if AIOHTTP_AVAILABLE:
+            fetched = self._run_async(self._classify_many_async(batches))
+        else:
+            # Fallback: sequential blocking requests
+            fetched = {}
+            for batch in batches:
+                fetched.update(self._classify_batch_with_ai(batch))
+
+        fetched = {member: fetched.get(column) for column, members in groups.items() for member in members}
+        self.cache.set_many({cache_keys[column]: result for column, result in fetched.items() if result})
+        results.update(fetched)
+        return {column: results.get(column) for column, _, _, _ in columns}
+
+    def _group_duplicate_columns(self, columns: List[Tuple[str, List[str], str, float]]):
+        """
+        Group columns sharing a lower-cased name and set of samples. Returns the
+        first column of each group and a mapping from it to every group member.
+        """
+        first_by_signature = {}
+        groups = {}
+        for entry in columns:
+            column, sample_values = entry[0], entry[1]
+            samples = ','.join(sorted(str(value) for value in sample_values[:3]))
+            signature = hashlib.blake2b(f"{str(column).lower()}|{samples}".encode(), digest_size=16).hexdigest()
+
+            if signature not in first_by_signature:
+                first_by_signature[signature] = entry
+                groups[column] = []
+            groups[first_by_signature[signature][0]].append(column)
+
+        return list(first_by_signature.values()), groups
+
+    def _lookup_cached(self, columns: List[Tuple[str, List[str], str, float]]):
+        """Split columns into cached results, their cache keys, and columns still to classify."""
+        results = {}
+        cache_keys = {}
+        pending = []
+        for column, sample_values, base_category, base_confidence in columns:
+            cache_keys[column] = AIResultCache.make_key(column, sample_values, base_category)
+            cached = self.cache.get(cache_keys[column])
+            if cached:
+                results[column] = cached
+            else:
+                pending.append((column, sample_values, base_category, base_confidence))
+
+        return results, cache_keys, pending
+
+    async def _classify_many_async(self, batches: List[List[Tuple[str, List[str], str, float]]]) -> Dict[str, Optional[AIClassificationResult]]:
+        """Fan out one AI request per batch of columns over a shared HTTP session."""
+        # The connector is bound to the running event loop, so it lives as long as this fan-out
+        connector = aiohttp.TCPConnector(limit_per_host=self.POOL_CONNECTIONS, ttl_dns_cache=self.DNS_CACHE_TTL)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            tasks = [self._classify_batch_with_ai_async(session, batch) for batch in batches]
+            responses = await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = {}
+        for batch, response in zip(batches, responses):
+            if isinstance(response, Exception):
+                self.logger.warning(f"AI classification failed for columns {[column for column, _, _, _ in batch]}: {response}")
+                response = {column: None for column, _, _, _ in batch}
+            results.update(response)
+
+        return results
+
+    def _classify_batch_with_ai(self, batch: List[Tuple[str, List[str], str, float]]) -> Dict[str, Optional[AIClassificationResult]]:
+        """Classify a batch of columns with a single AI request."""
+        if len(batch) == 1:
+            column, sample_values, base_category, base_confidence = batch[0]
+            return {column: self._classify_with_ai(column, sample_values, base_category, base_confidence)}
+
+        prompt = self._create_batch_classification_prompt([(column, samples, category) for column, samples, category, _ in batch])
+        max_tokens = self._batch_max_tokens(len(batch))
+
+        for api_name, api_config in self.ai_apis.items():
+            if not self._is_api_available(api_name):
+                continue
+
+            try:
+                content = self._request_completion(api_name, api_config, prompt, max_tokens)
+                parsed = self._parse_ai_batch_response(content, len(batch)) if content else {}
+                if parsed:
+                    return {column: parsed.get(index) for index, (column, _, _, _) in enumerate(batch, 1)}
+            except Exception as e:
+                self.logger.warning(f"AI API {api_name} failed: {e}")
+                continue
+
+        return {column: None for column, _, _, _ in batch}
+
+    async def _classify_batch_with_ai_async(self, session: 'aiohttp.ClientSession',
+                                            batch: List[Tuple[str, List[str], str, float]]) -> Dict[str, Optional[AIClassificationResult]]:
+        """Async counterpart of _classify_batch_with_ai."""
+        if len(batch) == 1:
+            column, sample_values, base_category, base_confidence = batch[0]
+            return {column: await self._classify_with_ai_async(session, column, sample_values, base_category, base_confidence)}
+
+        prompt = self._create_batch_classification_prompt([(column, samples, category) for column, samples, category, _ in batch])
+        max_tokens = self._batch_max_tokens(len(batch))
+
+        async def query(api_name: str, api_config: Dict) -> Dict[int, AIClassificationResult]:
+            content = await self._request_completion_async(session, api_name, api_config, prompt, max_tokens)
+            return self._parse_ai_batch_response(content, len(batch)) if content else {}
+
+        parsed = await self._race_apis(query) or {}
+        return {column: parsed.get(index) for index, (column, _, _, _) in enumerate(batch, 1)}
+
+    async def _race_apis(self, query: Callable[[str, Dict], Awaitable[Any]]) -> Any:
+        """
+        Query every available AI API concurrently and return the first usable
+        answer, cancelling the requests that are still in flight. Gives up with
+        None once RACE_TIMEOUT has passed.
+        """
+        tasks = {
+            asyncio.ensure_future(query(api_name, api_config)): api_name
+            for api_name, api_config in self.ai_apis.items()
+            if self._is_api_available(api_name)
+        }
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.RACE_TIMEOUT
+        pending = set(tasks)
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self.logger.warning(f"AI APIs {sorted(tasks[task] for task in pending)} timed out after {self.RACE_TIMEOUT}s")
+                    break
+                done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        self.logger.warning(f"AI API {tasks[task]} failed: {task.exception()}")
+                    elif task.result():
+                        return task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return None
+
+    def _batch_max_tokens(self, batch_length: int) -> int:
+        """Completion budget for a batch request."""
+        return self.BATCH_TOKENS_PER_COLUMN * batch_length + 100
+
+    def _run_async(self, coro):
+        """Run a coroutine to completion from synchronous code."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # Called from inside an event loop (e.g. an async FastAPI handler):
+        # asyncio.run() is not allowed there, so drive the coroutine on a helper thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
     def _classify_with_ai(self, column_name: str, sample_values: List[str], 
                          base_category: str, base_confidence: float) -> Optional[AIClassificationResult]:
         """Classify a column using AI APIs."""
@@ -130,7 +590,7 @@ class AIEnhancedColumnClassifier:
         
         # Try each AI API
         for api_name, api_config in self.ai_apis.items():
-            if not api_config['enabled']:
+            if not self._is_api_available(api_name):
                 continue
                 
             try:
@@ -140,45 +600,42 @@ class AIEnhancedColumnClassifier:
             except Exception as e:
                 self.logger.warning(f"AI API {api_name} failed: {e}")
                 continue
-        
+
         return None
 
+    async def _classify_with_ai_async(self, session: 'aiohttp.ClientSession', column_name: str,
+                                      sample_values: List[str], base_category: str,
+                                      base_confidence: float) -> Optional[AIClassificationResult]:
+        """Async counterpart of _classify_with_ai."""
+
+        prompt = self._create_classification_prompt(column_name, sample_values, base_category)
+
+        return await self._race_apis(
+            lambda api_name, api_config: self._query_ai_api_async(session, api_name, api_config, prompt)
+        )
+
     def _create_classification_prompt(self, column_name: str, sample_values: List[str], 
                                     base_category: str) -> str:
         """Create a detailed prompt for AI classification."""
         
-        sample_text = ", ".join(sample_values[:3]) if sample_values else "No samples"
-        
-        prompt = f"""
-You are an expert data analyst. Classify this CSV column into one of these categories:
-
-Categories:
-- Business Name: Names of businesses, companies, shops, restaurants
-- Phone Number: Phone numbers in any format
-- Email: Email addresses
-- Category: Business types, categories, amenities, services offered
-- Location: Addresses, cities, states, coordinates, geographic locations
-- Social Links: Websites, social media URLs, online links
-- Review: Customer reviews, ratings, feedback, comments
-- Hours: Operating hours, schedules, time information
-- Price: Pricing information, costs, fees, price ranges
-- Unknown / Junk: Unclear or irrelevant data
+        sample_text = ", ".join(islice(sample_values, 3)) if sample_values else "No samples"
 
-Column Analysis:
+        return f"""{_PROMPT_HEADER}
 - Column Name: "{column_name}"
 - Sample Values: {sample_text}
-- Current Classification: {base_category}
+- Current Classification: {base_category}{_PROMPT_FOOTER}"""
 
-Instructions:
-1. Analyze the column name and sample values
-2. Choose the MOST APPROPRIATE category
-3. Provide confidence score (0.0 to 1.0)
-4. Give brief reasoning
+    def _create_batch_classification_prompt(self, columns: List[Tuple[str, List[str], str]]) -> str:
+        """Create one prompt that classifies several columns at once."""
 
-Respond in this exact JSON format:
-{{"category": "Category Name", "confidence": 0.85, "reasoning": "Brief explanation"}}
-"""
-        return prompt
+        column_lines = []
+        for index, (column_name, sample_values, base_category) in enumerate(columns, 1):
+            samples = json.dumps([str(value) for value in islice(sample_values, 3)])
+            column_lines.append(f'{index}. name={json.dumps(str(column_name))} samples={samples} current="{base_category}"')
+        columns_text = "\n".join(column_lines)
+
+        return f"""{_BATCH_PROMPT_HEADER}
+{columns_text}{_BATCH_PROMPT_FOOTER}"""
 
     def _query_ai_api(self, api_name: str, api_config: Dict, prompt: str) -> Optional[AIClassificationResult]:
         """Query a specific AI API."""
@@ -188,43 +645,197 @@ Respond in this exact JSON format:
         elif api_name == 'huggingface':
             return self._query_huggingface(api_config, prompt)
         elif api_name in ['openai_compatible', 'groq']:
-            return self._query_openai_compatible(api_config, prompt)
+            return self._query_openai_compatible(api_config, prompt, api_name)
         
         return None
 
-    def _query_openrouter(self, api_config: Dict, prompt: str) -> Optional[AIClassificationResult]:
-        """Query OpenRouter API."""
+    async def _query_ai_api_async(self, session: 'aiohttp.ClientSession', api_name: str,
+                                  api_config: Dict, prompt: str) -> Optional[AIClassificationResult]:
+        """Query a specific AI API without blocking the event loop."""
+        generated_text = await self._request_completion_async(session, api_name, api_config, prompt)
+        if generated_text is not None:
+            return self._parse_ai_response(generated_text)
+
+        return None
+
+    def _request_completion(self, api_name: str, api_config: Dict, prompt: str,
+                            max_tokens: int = 200) -> Optional[str]:
+        """Send a prompt to an AI API and return the raw generated text."""
+        payload = self._build_payload(api_name, prompt, max_tokens)
+        if payload is None:
+            return None
+        return self._extract_generated_text(api_name, self._post_with_retry(api_name, api_config, payload))
+
+    async def _request_completion_async(self, session: 'aiohttp.ClientSession', api_name: str,
+                                        api_config: Dict, prompt: str, max_tokens: int = 200) -> Optional[str]:
+        """Async counterpart of _request_completion."""
+        payload = self._build_payload(api_name, prompt, max_tokens)
+        if payload is None:
+            return None
+        return self._extract_generated_text(api_name, await self._post_with_retry_async(session, api_name, api_config, payload))
+
+    def _is_api_available(self, api_name: str) -> bool:
+        """Check an API is enabled and not cooling down after repeated failures."""
+        return (self.ai_apis[api_name]['enabled'] and
+                time.monotonic() >= self._circuit_open_until.get(api_name, 0.0))
+
+    def _record_api_outcome(self, api_name: str, success: bool):
+        """Update the circuit breaker after a request has finished (including retries)."""
+        if success:
+            self._consecutive_failures[api_name] = 0
+            return
+
+        self._consecutive_failures[api_name] = self._consecutive_failures.get(api_name, 0) + 1
+        if self._consecutive_failures[api_name] >= self.CIRCUIT_BREAKER_THRESHOLD:
+            self._circuit_open_until[api_name] = time.monotonic() + self.CIRCUIT_BREAKER_COOLDOWN
+            self._consecutive_failures[api_name] = 0
+            self.logger.warning(
+                f"AI API {api_name} failed {self.CIRCUIT_BREAKER_THRESHOLD} times in a row, "
+                f"skipping it for {self.CIRCUIT_BREAKER_COOLDOWN}s"
+            )
+
+    def _rate_limit_delay(self, api_name: str, payload: Dict[str, Any]) -> float:
+        """Reserve request/token budget for a call and return how long to wait first."""
+        delay = 0.0
+        if api_name in self._request_limiters:
+            delay = self._request_limiters[api_name].reserve(1)
+        if api_name in self._token_limiters:
+            delay = max(delay, self._token_limiters[api_name].reserve(self._estimate_tokens(payload)))
+        return delay
+
+    def _estimate_tokens(self, payload: Dict[str, Any]) -> int:
+        """Rough token cost of a request: ~4 characters per prompt token plus the completion budget."""
+        completion_tokens = payload.get('max_tokens', payload.get('parameters', {}).get('max_new_tokens', 0))
+        return len(_json_dumps(payload)) // 4 + completion_tokens
+
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Exponential backoff with jitter, honouring a numeric Retry-After header up to MAX_BACKOFF."""
+        delay = self.BACKOFF_BASE * 2 ** attempt + random.uniform(0, self.BACKOFF_JITTER)
         try:
-            payload = {
+            if retry_after:
+                delay = max(float(retry_after), delay)
+        except ValueError:
+            pass
+        return min(delay, self.MAX_BACKOFF)
+
+    def _post_with_retry(self, api_name: str, api_config: Dict, payload: Dict[str, Any]) -> Optional[Any]:
+        """POST a payload, pacing under rate limits and retrying transient failures."""
+        for attempt in range(self.MAX_ATTEMPTS):
+            time.sleep(self._rate_limit_delay(api_name, payload))
+
+            try:
+                response = self._http.post(
+                    api_config['url'],
+                    headers={**api_config['headers'], **_JSON_HEADERS},
+                    data=_json_dumps(payload),
+                    timeout=self.API_TIMEOUTS[api_name]
+                )
+            except requests.ConnectionError as e:
+                self.logger.warning(f"{api_name} API connection error: {e}")
+                if attempt < self.MAX_ATTEMPTS - 1:
+                    time.sleep(self._backoff_delay(attempt))
+                continue
+            except Exception as e:
+                self.logger.error(f"{api_name} API request failed: {e}")
+                break
+
+            if response.status_code == 200:
+                self._record_api_outcome(api_name, True)
+                return _json_loads(response.content)
+
+            self.logger.warning(f"{api_name} API error: {response.status_code} - {response.text}")
+            if response.status_code not in self.RETRY_STATUS_CODES:
+                break
+            if attempt < self.MAX_ATTEMPTS - 1:
+                time.sleep(self._backoff_delay(attempt, response.headers.get('Retry-After')))
+
+        self._record_api_outcome(api_name, False)
+        return None
+
+    async def _post_with_retry_async(self, session: 'aiohttp.ClientSession', api_name: str,
+                                     api_config: Dict, payload: Dict[str, Any]) -> Optional[Any]:
+        """Async counterpart of _post_with_retry."""
+        for attempt in range(self.MAX_ATTEMPTS):
+            await asyncio.sleep(self._rate_limit_delay(api_name, payload))
+
+            try:
+                async with session.post(
+                    api_config['url'],
+                    headers={**api_config['headers'], **_JSON_HEADERS},
+                    data=_json_dumps(payload),
+                    timeout=aiohttp.ClientTimeout(total=self.API_TIMEOUTS[api_name])
+                ) as response:
+                    if response.status == 200:
+                        result = _json_loads(await response.read())
+                        self._record_api_outcome(api_name, True)
+                        return result
+
+                    self.logger.warning(f"{api_name} API error: {response.status} - {await response.text()}")
+                    if response.status not in self.RETRY_STATUS_CODES:
+                        break
+                    retry_after = response.headers.get('Retry-After')
+            except aiohttp.ClientConnectionError as e:
+                self.logger.warning(f"{api_name} API connection error: {e}")
+                retry_after = None
+            except Exception as e:
+                self.logger.error(f"{api_name} API request failed: {e}")
+                break
+
+            if attempt < self.MAX_ATTEMPTS - 1:
+                await asyncio.sleep(self._backoff_delay(attempt, retry_after))
+
+        self._record_api_outcome(api_name, False)
+        return None
+
+    def _build_payload(self, api_name: str, prompt: str, max_tokens: int = 200) -> Optional[Dict[str, Any]]:
+        """Build the request body for a specific AI API."""
+        system_message = {
+            "role": "system",
+            "content": "You are an expert data analyst specializing in CSV column classification. Always respond with valid JSON."
+        }
+
+        if api_name == 'openrouter':
+            return {
                 "model": "meta-llama/llama-3.1-8b-instruct:free",  # Use free model
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are an expert data analyst specializing in CSV column classification. Always respond with valid JSON."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
+                "messages": [system_message, {"role": "user", "content": prompt}],
                 "temperature": 0.1,
-                "max_tokens": 200
+                "max_tokens": max_tokens
             }
-            
-            response = requests.post(
-                api_config['url'],
-                headers=api_config['headers'],
-                json=payload,
-                timeout=15
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'choices' in result and len(result['choices']) > 0:
-                    content = result['choices'][0]['message']['content']
-                    return self._parse_ai_response(content)
-            else:
-                self.logger.warning(f"OpenRouter API error: {response.status_code} - {response.text}")
+        elif api_name == 'huggingface':
+            return {
+                "inputs": prompt,
+                "parameters": {
+                    "max_new_tokens": max_tokens,
+                    "temperature": 0.1,
+                    "return_full_text": False
+                }
+            }
+        elif api_name in ['openai_compatible', 'groq']:
+            return {
+                "model": "llama3-8b-8192",  # For Groq, adjust for other APIs
+                "messages": [system_message, {"role": "user", "content": prompt}],
+                "temperature": 0.1,
+                "max_tokens": max_tokens
+            }
+
+        return None
+
+    def _extract_generated_text(self, api_name: str, result: Any) -> Optional[str]:
+        """Pull the generated text out of an API response body."""
+        if api_name == 'huggingface':
+            if isinstance(result, list) and len(result) > 0:
+                return result[0].get('generated_text', '')
+        elif isinstance(result, dict) and 'choices' in result and len(result['choices']) > 0:
+            return result['choices'][0]['message']['content']
+
+        return None
+
+    def _query_openrouter(self, api_config: Dict, prompt: str) -> Optional[AIClassificationResult]:
+        """Query OpenRouter API."""
+        try:
+            content = self._request_completion('openrouter', api_config, prompt)
+            if content is not None:
+                return self._parse_ai_response(content)
                 
         except Exception as e:
             self.logger.error(f"OpenRouter API request failed: {e}")
@@ -234,64 +845,21 @@ Respond in this exact JSON format:
     def _query_huggingface(self, api_config: Dict, prompt: str) -> Optional[AIClassificationResult]:
         """Query Hugging Face Inference API."""
         try:
-            payload = {
-                "inputs": prompt,
-                "parameters": {
-                    "max_new_tokens": 200,
-                    "temperature": 0.1,
-                    "return_full_text": False
-                }
-            }
-            
-            response = requests.post(
-                api_config['url'],
-                headers=api_config['headers'],
-                json=payload,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if isinstance(result, list) and len(result) > 0:
-                    generated_text = result[0].get('generated_text', '')
-                    return self._parse_ai_response(generated_text)
+            generated_text = self._request_completion('huggingface', api_config, prompt)
+            if generated_text is not None:
+                return self._parse_ai_response(generated_text)
             
         except Exception as e:
             self.logger.error(f"Hugging Face API error: {e}")
         
         return None
 
-    def _query_openai_compatible(self, api_config: Dict, prompt: str) -> Optional[AIClassificationResult]:
+    def _query_openai_compatible(self, api_config: Dict, prompt: str, api_name: str = 'groq') -> Optional[AIClassificationResult]:
         """Query OpenAI-compatible APIs (OpenAI, Groq, etc.)."""
         try:
-            payload = {
-                "model": "llama3-8b-8192",  # For Groq, adjust for other APIs
-                "messages": [
-                    {
-                        "role": "system",
-                        "content": "You are an expert data analyst specializing in CSV column classification. Always respond with valid JSON."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                "temperature": 0.1,
-                "max_tokens": 200
-            }
-            
-            response = requests.post(
-                api_config['url'],
-                headers=api_config['headers'],
-                json=payload,
-                timeout=15
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'choices' in result and len(result['choices']) > 0:
-                    content = result['choices'][0]['message']['content']
-                    return self._parse_ai_response(content)
+            content = self._request_completion(api_name, api_config, prompt)
+            if content is not None:
+                return self._parse_ai_response(content)
             
         except Exception as e:
             self.logger.error(f"OpenAI-compatible API error: {e}")
@@ -302,28 +870,95 @@ Respond in this exact JSON format:
         """Parse AI response and extract classification result."""
         try:
             # Try to extract JSON from the response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                result = json.loads(json_str)
-                
-                category = result.get('category', '').strip()
-                confidence = float(result.get('confidence', 0))
-                reasoning = result.get('reasoning', '').strip()
-                
-                # Validate category
-                if category in self.categories and 0 <= confidence <= 1:
-                    return AIClassificationResult(
-                        category=category,
-                        confidence=confidence,
-                        reasoning=reasoning
-                    )
+            json_str = self._find_json_object(response_text)
+            if json_str:
+                return self._to_classification_result(_json_loads(json_str))
             
         except (json.JSONDecodeError, ValueError, KeyError) as e:
             self.logger.warning(f"Failed to parse AI response: {e}")
         
         return None
 
+    def _parse_ai_batch_response(self, response_text: str, expected_count: int) -> Dict[int, AIClassificationResult]:
+        """Parse a batch AI response into a mapping of 1-based column index to result."""
+        parsed = {}
+        try:
+            json_str = self._find_json_object(response_text)
+            if not json_str:
+                return parsed
+
+            results = _json_loads(json_str).get('results', [])
+            if not isinstance(results, list):
+                return parsed
+
+            if len(results) != expected_count:
+                self.logger.warning(f"AI batch response has {len(results)} results, expected {expected_count}")
+
+        except (json.JSONDecodeError, ValueError, KeyError, AttributeError, TypeError) as e:
+            self.logger.warning(f"Failed to parse AI batch response: {e}")
+            return parsed
+
+        # A malformed item only loses its own column
+        for item in results:
+            if not isinstance(item, dict):
+                continue
+            try:
+                index = int(item.get('index', 0))
+                result = self._to_classification_result(item)
+            except (ValueError, AttributeError, TypeError) as e:
+                self.logger.warning(f"Skipping malformed AI batch result {item}: {e}")
+                continue
+            if result and 1 <= index <= expected_count:
+                parsed[index] = result
+
+        return parsed
+
+    @staticmethod
+    def _find_json_object(text: str) -> Optional[str]:
+        """Return the first balanced {...} span in text using a single linear scan."""
+        start = text.find('{')
+        if start == -1:
+            return None
+
+        depth = 0
+        in_string = False
+        escape = False
+        for i in range(start, len(text)):
+            char = text[i]
+            if in_string:
+                if escape:
+                    escape = False
+                elif char == '\\':
+                    escape = True
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    return text[start:i + 1]
+
+        return None
+
+    def _to_classification_result(self, result: Dict[str, Any]) -> Optional[AIClassificationResult]:
+        """Validate a decoded JSON classification and convert it to a result."""
+        category = result.get('category', '').strip()
+        confidence = float(result.get('confidence', 0))
+        reasoning = result.get('reasoning', '').strip()
+
+        # Validate category
+        if category in self._categories_set and 0 <= confidence <= 1:
+            return AIClassificationResult(
+                category=category,
+                confidence=confidence,
+                reasoning=reasoning
+            )
+
+        return None
+
     def setup_api_key(self, api_name: str, api_key: str) -> bool:
         """
         Setup API key for a specific AI service.
@@ -348,21 +983,31 @@ Respond in this exact JSON format:
 
     def test_ai_connection(self) -> Dict[str, bool]:
         """Test connection to all enabled AI APIs."""
-        results = {}
-        
-        for api_name, api_config in self.ai_apis.items():
-            if not api_config['enabled']:
-                results[api_name] = False
-                continue
-            
-            try:
-                # Simple test prompt
-                test_prompt = "Classify this column: 'email' with sample 'john@example.com'"
-                result = self._query_ai_api(api_name, api_config, test_prompt)
-                results[api_name] = result is not None
-            except:
-                results[api_name] = False
-        
+        results = {api_name: False for api_name in self.ai_apis}
+        enabled_apis = {api_name: api_config for api_name, api_config in self.ai_apis.items() if api_config['enabled']}
+        if not enabled_apis:
+            return results
+
+        # Simple test prompt
+        test_prompt = "Classify this column: 'email' with sample 'john@example.com'"
+
+        # Probe all APIs at once so the total wait is the slowest probe, not the sum
+        executor = ThreadPoolExecutor(max_workers=len(enabled_apis))
+        futures = {
+            executor.submit(self._query_ai_api, api_name, api_config, test_prompt): api_name
+            for api_name, api_config in enabled_apis.items()
+        }
+        try:
+            for future in as_completed(futures, timeout=self.CONNECTION_TEST_TIMEOUT):
+                try:
+                    results[futures[future]] = future.result() is not None
+                except Exception:
+                    results[futures[future]] = False
+        except FuturesTimeoutError:
+            self.logger.warning("AI connection test timed out")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
         return results
 
     # Additional utility methods
@@ -412,41 +1057,217 @@ Respond in this exact JSON format:
         # Get enhanced classification
         enhanced_results = self.enhanced_classifier.classify_columns(df)
         
-        # Use AI for uncertain cases
-        final_results = {}
-        
-        for column, result in enhanced_results.items():
-            final_results[column] = result.copy()
-            
-            # Use AI enhancement for low confidence predictions
-            if result['confidence'] < confidence_threshold:
-                ai_result = self._classify_with_ai(
-                    column_name=column,
-                    sample_values=result['sample_values'][:3],  # Limit samples for API
-                    base_category=result['suggested_category'],
-                    base_confidence=result['confidence']
+        # Use AI enhancement for low confidence predictions, limiting samples for the API
+        uncertain_columns = self._select_uncertain_columns(enhanced_results, confidence_threshold, sample_limit=3)
+
+        ai_results = self._classify_many_with_ai(uncertain_columns)
+
+        return self._combine_ensemble_results(enhanced_results, ai_results)
+
+    def _combine_ensemble_results(self, enhanced_results: Dict[str, Dict[str, Any]],
+                                  ai_results: Dict[str, Optional[AIClassificationResult]]) -> Dict[str, Dict[str, Any]]:
+        """Blend enhanced classifier results with AI results for the uncertain columns."""
+        final_results = {column: result.copy() for column, result in enhanced_results.items()}
+
+        for column, ai_result in ai_results.items():
+            result = enhanced_results[column]
+            if ai_result:
+                # Ensemble: Average the confidences with weights
+                enhanced_confidence = (
+                    result['confidence'] * 0.4 +  # Enhanced classifier weight
+                    ai_result.confidence * 0.6     # AI weight (higher for uncertain cases)
                 )
-                
-                if ai_result:
-                    # Ensemble: Average the confidences with weights
-                    enhanced_confidence = (
-                        result['confidence'] * 0.4 +  # Enhanced classifier weight
-                        ai_result.confidence * 0.6     # AI weight (higher for uncertain cases)
-                    )
-                    
-                    final_results[column].update({
-                        'suggested_category': ai_result.category,
-                        'confidence': min(0.95, enhanced_confidence),
-                        'ensemble_method': True,
-                        'ai_reasoning': ai_result.reasoning,
-                        'base_method': {
-                            'category': result['suggested_category'],
-                            'confidence': result['confidence']
-                        },
-                        'ai_method': {
-                            'category': ai_result.category,
-                            'confidence': ai_result.confidence
-                        }
-                    })
-        
+
+                final_results[column].update({
+                    'suggested_category': ai_result.category,
+                    'confidence': min(0.95, enhanced_confidence),
+                    'ensemble_method': True,
+                    'ai_reasoning': ai_result.reasoning,
+                    'base_method': {
+                        'category': result['suggested_category'],
+                        'confidence': result['confidence']
+                    },
+                    'ai_method': {
+                        'category': ai_result.category,
+                        'confidence': ai_result.confidence
+                    }
+                })
+
         return final_results
+
+    def classify_with_batch(self, df: pd.DataFrame, confidence_threshold: float = 0.8,
+                            job_id_path: str = './batch.json', max_wait: float = 3600,
+                            poll_interval: float = 30) -> Dict[str, Dict[str, Any]]:
+        """
+        Ensemble classification through the Groq batch API, for offline bulk jobs
+        where cost and rate limits matter more than latency.
+
+        Args:
+            df: DataFrame to analyze
+            confidence_threshold: Threshold for using AI enhancement
+            job_id_path: File recording the submitted job so an interrupted run resumes it
+            max_wait: Seconds to wait for the job before cancelling it and using live requests
+            poll_interval: Seconds between job status checks
+
+        Returns:
+            Same structure as classify_with_ensemble
+        """
+        enhanced_results = self.enhanced_classifier.classify_columns(df)
+        uncertain_columns = self._select_uncertain_columns(enhanced_results, confidence_threshold, sample_limit=3)
+
+        ai_results, cache_keys, pending = self._lookup_cached(uncertain_columns)
+
+        if pending:
+            fetched = None
+            if self.ai_apis['groq']['enabled']:
+                unique, groups = self._group_duplicate_columns(pending)
+                fetched = self._run_batch_job(unique, job_id_path, max_wait, poll_interval)
+
+            if fetched is None:
+                # Batch API unavailable, failed or too slow: fall back to live requests
+                fetched = self._classify_many_with_ai(pending)
+            else:
+                fetched = {member: fetched.get(column) for column, members in groups.items() for member in members}
+                self.cache.set_many({cache_keys[column]: result for column, result in fetched.items() if result})
+
+            ai_results.update(fetched)
+
+        return self._combine_ensemble_results(enhanced_results, ai_results)
+
+    def _run_batch_job(self, columns: List[Tuple[str, List[str], str, float]], job_id_path: str,
+                       max_wait: float, poll_interval: float) -> Optional[Dict[str, Optional[AIClassificationResult]]]:
+        """Submit (or resume) a Groq batch job for the columns and collect its results."""
+        api_config = self.ai_apis['groq']
+        base_url = api_config['url'].rsplit('/chat/completions', 1)[0]
+        column_names = [column for column, _, _, _ in columns]
+        # A saved job is only resumed for the same names, samples and base categories
+        column_keys = [AIResultCache.make_key(column, samples, category) for column, samples, category, _ in columns]
+
+        try:
+            batch_id = self._load_batch_job(job_id_path, column_keys)
+            if batch_id is None:
+                batch_id = self._submit_batch_job(base_url, api_config, columns)
+                with open(job_id_path, 'w') as f:
+                    json.dump({'batch_id': batch_id, 'column_keys': column_keys}, f)
+
+            batch = self._wait_for_batch_job(base_url, api_config, batch_id, max_wait, poll_interval)
+            status = batch.get('status')
+
+            if status != 'completed':
+                if status not in self.BATCH_FINAL_STATUSES:
+                    self.logger.warning(f"Groq batch {batch_id} not finished after {max_wait}s, cancelling")
+                    self._batch_api_request('post', f"{base_url}/batches/{batch_id}/cancel", api_config)
+                else:
+                    self.logger.warning(f"Groq batch {batch_id} ended with status {status}")
+                self._remove_batch_job(job_id_path)
+                return None
+
+            results = self._download_batch_results(base_url, api_config, batch['output_file_id'], column_names)
+
+        except (requests.RequestException, OSError, ValueError, KeyError, TypeError) as e:
+            # Keep the job file so the next run can resume polling the same job
+            self.logger.warning(f"Groq batch job failed: {e}")
+            return None
+
+        self._remove_batch_job(job_id_path)
+        return results
+
+    def _batch_api_request(self, method: str, url: str, api_config: Dict, **kwargs) -> Any:
+        """Call a Groq batch/files endpoint and return the decoded JSON body."""
+        response = self._http.request(
+            method, url, headers=api_config['headers'], timeout=self.API_TIMEOUTS['groq'], **kwargs
+        )
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def _submit_batch_job(self, base_url: str, api_config: Dict,
+                          columns: List[Tuple[str, List[str], str, float]]) -> str:
+        """Upload one chat completion request per column and start a batch job."""
+        lines = []
+        for index, (column, sample_values, base_category, _) in enumerate(columns):
+            prompt = self._create_classification_prompt(column, sample_values, base_category)
+            lines.append(_json_dumps({
+                'custom_id': f'column-{index}',
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': self._build_payload('groq', prompt)
+            }))
+
+        uploaded = self._batch_api_request(
+            'post', f"{base_url}/files", api_config,
+            files={'file': ('batch.jsonl', b'\n'.join(lines), 'application/jsonl')},
+            data={'purpose': 'batch'}
+        )
+        batch = self._batch_api_request(
+            'post', f"{base_url}/batches", api_config,
+            json={
+                'input_file_id': uploaded['id'],
+                'endpoint': '/v1/chat/completions',
+                'completion_window': self.BATCH_COMPLETION_WINDOW
+            }
+        )
+        return batch['id']
+
+    def _wait_for_batch_job(self, base_url: str, api_config: Dict, batch_id: str,
+                            max_wait: float, poll_interval: float) -> Dict[str, Any]:
+        """Poll a batch job until it reaches a final status or max_wait elapses."""
+        deadline = time.monotonic() + max_wait
+        while True:
+            batch = self._batch_api_request('get', f"{base_url}/batches/{batch_id}", api_config)
+            remaining = deadline - time.monotonic()
+            if batch.get('status') in self.BATCH_FINAL_STATUSES or remaining <= 0:
+                return batch
+            time.sleep(min(poll_interval, remaining))
+
+    def _download_batch_results(self, base_url: str, api_config: Dict, output_file_id: str,
+                                column_names: List[str]) -> Dict[str, Optional[AIClassificationResult]]:
+        """Download a finished job's output file and parse one result per column."""
+        response = self._http.get(
+            f"{base_url}/files/{output_file_id}/content",
+            headers=api_config['headers'],
+            timeout=self.API_TIMEOUTS['groq']
+        )
+        response.raise_for_status()
+
+        results = {column: None for column in column_names}
+        for line in response.content.splitlines():
+            if not line.strip():
+                continue
+
+            item = _json_loads(line)
+            index = int(str(item.get('custom_id', '')).rsplit('-', 1)[-1])
+            body = (item.get('response') or {}).get('body')
+            if item.get('error') or not body or not 0 <= index < len(column_names):
+                continue
+
+            generated_text = self._extract_generated_text('groq', body)
+            if generated_text is not None:
+                results[column_names[index]] = self._parse_ai_response(generated_text)
+
+        return results
+
+    def _load_batch_job(self, job_id_path: str, column_keys: List[str]) -> Optional[str]:
+        """Return the saved batch id if it was submitted for the same column cache keys."""
+        try:
+            with open(job_id_path) as f:
+                job = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable batch job file {job_id_path}: {e}")
+            return None
+
+        if job.get('column_keys') != column_keys:
+            self.logger.warning(f"Batch job file {job_id_path} is for different columns, submitting a new job")
+            return None
+
+        return job.get('batch_id')
+
+    def _remove_batch_job(self, job_id_path: str):
+        """Forget a finished or abandoned batch job."""
+        try:
+            os.remove(job_id_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Could not remove batch job file {job_id_path}: {e}")
@@ -1,8 +1,152 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Optional, Iterable
 import numpy as np
 
+# Column name words that hint at each category
+BUSINESS_NAME_WORDS = frozenset(['business_name', 'company_name', 'name', 'business', 'company', 'establishment'])
+BUSINESS_NAME_EXCLUDE_WORDS = frozenset(['type', 'category', 'kind'])
+PHONE_WORDS = frozenset(['phone', 'mobile', 'contact_phone', 'tel', 'telephone', 'cell', 'contact_number'])
+PHONE_EXCLUDE_WORDS = frozenset(['rating', 'score', 'count', 'id', 'fax'])
+EMAIL_WORDS = frozenset(['email', 'mail', 'e_mail', 'email_address', 'contact_email'])
+CATEGORY_WORDS = frozenset(['type', 'category', 'kind', 'business_type', 'amenity', 'amenities',
+                            'service', 'feature', 'classification', 'genre', 'tag', 'tags'])
+LOCATION_WORDS = frozenset(['address', 'location', 'city', 'state', 'country', 'zip', 'postal',
+                            'full_address', 'street', 'coordinates', 'lat', 'lng', 'longitude', 'latitude'])
+SOCIAL_WORDS = frozenset(['website', 'url', 'link', 'social', 'facebook', 'instagram', 'twitter',
+                          'website_url', 'homepage', 'web', 'site'])
+REVIEW_WORDS = frozenset(['review', 'rating', 'feedback', 'comment', 'score', 'customer_review',
+                          'rating_score', 'stars', 'satisfaction'])
+HOURS_WORDS = frozenset(['hours', 'time', 'schedule', 'operating_hours', 'business_hours', 'open', 'close'])
+PRICE_WORDS = frozenset(['price', 'cost', 'fee', 'charge', 'rate', 'pricing', 'budget', 'expense'])
+
+# Column name keyword -> (category, bonus)
+NAME_BONUS_MAP = {
+    word: (category, weight)
+    for category, weight, words in (
+        ('Business Name', 0.8, BUSINESS_NAME_WORDS),
+        ('Phone Number', 0.8, PHONE_WORDS),
+        ('Email', 0.9, EMAIL_WORDS),
+        ('Category', 0.9, CATEGORY_WORDS),
+        ('Location', 0.8, LOCATION_WORDS),
+        ('Social Links', 0.8, SOCIAL_WORDS),
+        ('Review', 0.8, REVIEW_WORDS),
+        ('Hours', 0.8, HOURS_WORDS),
+        ('Price', 0.8, PRICE_WORDS),
+    )
+    for word in words
+}
+
+# Column name keyword -> category whose bonus it cancels
+NAME_BONUS_EXCLUSIONS = {
+    word: category
+    for category, words in (
+        ('Business Name', BUSINESS_NAME_EXCLUDE_WORDS),
+        ('Phone Number', PHONE_EXCLUDE_WORDS),
+    )
+    for word in words
+}
+
+# Generic values that are not distinctive enough to be business names
+GENERIC_BUSINESS_WORDS = frozenset(['restaurant', 'store', 'shop', 'cafe', 'bar', 'hotel'])
+
+NAME_TOKEN_SPLIT = re.compile(r'[_\s]+')
+
+# Value keyword vocabularies, matched as substrings of lowercased values
+
+# Common location keywords
+LOCATION_KEYWORDS = frozenset([
+    'delhi', 'mumbai', 'bangalore', 'hyderabad', 'chennai', 'kolkata',
+    'pune', 'ahmedabad', 'surat', 'jaipur', 'lucknow', 'kanpur',
+    'nagpur', 'indore', 'thane', 'bhopal', 'visakhapatnam', 'pimpri',
+    'street', 'road', 'avenue', 'boulevard', 'lane', 'drive',
+    'address', 'city', 'state', 'country', 'zipcode', 'pincode'
+])
+
+# Expanded business category keywords
+CATEGORY_KEYWORDS = frozenset([
+    # Food & Dining
+    'restaurant', 'cafe', 'bar', 'bakery', 'pizzeria', 'bistro', 'diner', 'buffet',
+    'fast food', 'food truck', 'catering', 'brewery', 'winery', 'steakhouse',
+    'sushi', 'chinese', 'italian', 'mexican', 'indian', 'thai', 'japanese',
+    
+    # Retail
+    'shop', 'store', 'boutique', 'mall', 'outlet', 'supermarket', 'grocery',
+    'convenience store', 'department store', 'electronics', 'clothing', 'shoes',
+    'jewelry', 'books', 'music', 'sports goods', 'toys', 'furniture', 'hardware',
+    
+    # Services
+    'salon', 'spa', 'barber', 'beauty', 'wellness', 'massage', 'nails',
+    'dry cleaning', 'laundry', 'repair', 'maintenance', 'plumbing', 'electrical',
+    'cleaning service', 'pest control', 'security', 'moving', 'storage',
+    
+    # Healthcare
+    'hospital', 'clinic', 'pharmacy', 'dental', 'veterinary', 'medical',
+    'doctor', 'dentist', 'optometry', 'physical therapy', 'mental health',
+    
+    # Education
+    'school', 'college', 'university', 'daycare', 'preschool', 'tutoring',
+    'training center', 'library', 'museum',
+    
+    # Professional Services
+    'office', 'bank', 'insurance', 'legal', 'accounting', 'consulting',
+    'real estate', 'marketing', 'advertising', 'it services', 'technology',
+    
+    # Entertainment & Recreation
+    'gym', 'fitness', 'yoga', 'dance', 'theater', 'cinema', 'bowling',
+    'golf', 'swimming', 'park', 'recreation', 'entertainment',
+    
+    # Automotive
+    'gas station', 'auto repair', 'car wash', 'dealership', 'automotive',
+    'tire shop', 'oil change', 'parking',
+    
+    # Accommodation
+    'hotel', 'motel', 'hostel', 'bed and breakfast', 'resort', 'lodge'
+])
+
+# Common amenities keywords
+AMENITY_KEYWORDS = frozenset([
+    'wifi', 'parking', 'wheelchair accessible', 'air conditioning', 'heating',
+    'pet friendly', 'outdoor seating', 'delivery', 'takeout', 'drive through',
+    'credit cards accepted', 'cash only', 'reservations', 'walk-ins welcome',
+    'valet parking', 'free parking', 'paid parking', 'restrooms', 'family friendly',
+    'live music', 'happy hour', 'breakfast', 'lunch', 'dinner', 'late night',
+    'open 24 hours', 'weekend hours', 'appointment only', 'online booking'
+])
+
+# Keywords that, besides categories and amenities, indicate a value is NOT a business name
+NON_BUSINESS_KEYWORDS = frozenset([
+    'email', 'phone', 'address', 'location', 'city', 'state', 'zip',
+    'review', 'rating', 'comment', 'feedback', 'description',
+    'hours', 'open', 'closed', 'schedule', 'time',
+    'price', 'cost', 'fee', 'rate', 'charge', '$', 'dollar',
+    'website', 'url', 'link', 'http', 'www', '.com', '.org', '.net'
+])
+
+REVIEW_KEYWORDS = frozenset([
+    'review', 'rating', 'feedback', 'comment', 'opinion',
+    'good', 'bad', 'excellent', 'poor', 'great', 'terrible',
+    'recommend', 'satisfied', 'disappointed', 'star', 'amazing',
+    'awesome', 'fantastic', 'horrible', 'love', 'hate'
+])
+
+# Common email domains for additional validation
+COMMON_EMAIL_DOMAINS = frozenset([
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com',
+    'icloud.com', 'mail.com', 'protonmail.com', 'zoho.com', 'yandex.com',
+    'msn.com', 'live.com', 'comcast.net', 'verizon.net', 'sbcglobal.net'
+])
+
+# 10, 100, ... 10**18: searchsorted against these gives an integer's digit count
+POWERS_OF_TEN = 10 ** np.arange(1, 19, dtype=np.int64)
+
+# Upper bound on threads classifying columns concurrently
+MAX_CLASSIFY_WORKERS = 8
+
+# Non-null values scored per column; enough for stable averages on any column length
+DEFAULT_SAMPLE_SIZE = 5000
+
 class ColumnClassifier:
     """
     A class to classify columns in a dataset based on their content patterns.
@@ -19,496 +163,505 @@ class ColumnClassifier:
             'Review': self._classify_review,
             'Hours': self._classify_hours,
             'Price': self._classify_price,
-            'Unknown / Junk': lambda col: 0.0  # Default fallback
+            'Unknown / Junk': lambda col, codes=None, lowered=None: 0.0  # Default fallback
         }
         
-        # Common location keywords
-        self.location_keywords = [
-            'delhi', 'mumbai', 'bangalore', 'hyderabad', 'chennai', 'kolkata',
-            'pune', 'ahmedabad', 'surat', 'jaipur', 'lucknow', 'kanpur',
-            'nagpur', 'indore', 'thane', 'bhopal', 'visakhapatnam', 'pimpri',
-            'street', 'road', 'avenue', 'boulevard', 'lane', 'drive',
-            'address', 'city', 'state', 'country', 'zipcode', 'pincode'
-        ]
-        
-        # Expanded business category keywords
-        self.category_keywords = [
-            # Food & Dining
-            'restaurant', 'cafe', 'bar', 'bakery', 'pizzeria', 'bistro', 'diner', 'buffet',
-            'fast food', 'food truck', 'catering', 'brewery', 'winery', 'steakhouse',
-            'sushi', 'chinese', 'italian', 'mexican', 'indian', 'thai', 'japanese',
-            
-            # Retail
-            'shop', 'store', 'boutique', 'mall', 'outlet', 'supermarket', 'grocery',
-            'convenience store', 'department store', 'electronics', 'clothing', 'shoes',
-            'jewelry', 'books', 'music', 'sports goods', 'toys', 'furniture', 'hardware',
-            
-            # Services
-            'salon', 'spa', 'barber', 'beauty', 'wellness', 'massage', 'nails',
-            'dry cleaning', 'laundry', 'repair', 'maintenance', 'plumbing', 'electrical',
-            'cleaning service', 'pest control', 'security', 'moving', 'storage',
-            
-            # Healthcare
-            'hospital', 'clinic', 'pharmacy', 'dental', 'veterinary', 'medical',
-            'doctor', 'dentist', 'optometry', 'physical therapy', 'mental health',
-            
-            # Education
-            'school', 'college', 'university', 'daycare', 'preschool', 'tutoring',
-            'training center', 'library', 'museum',
-            
-            # Professional Services
-            'office', 'bank', 'insurance', 'legal', 'accounting', 'consulting',
-            'real estate', 'marketing', 'advertising', 'it services', 'technology',
-            
-            # Entertainment & Recreation
-            'gym', 'fitness', 'yoga', 'dance', 'theater', 'cinema', 'bowling',
-            'golf', 'swimming', 'park', 'recreation', 'entertainment',
-            
-            # Automotive
-            'gas station', 'auto repair', 'car wash', 'dealership', 'automotive',
-            'tire shop', 'oil change', 'parking',
-            
-            # Accommodation
-            'hotel', 'motel', 'hostel', 'bed and breakfast', 'resort', 'lodge'
-        ]
-        
-        # Common amenities keywords
-        self.amenity_keywords = [
-            'wifi', 'parking', 'wheelchair accessible', 'air conditioning', 'heating',
-            'pet friendly', 'outdoor seating', 'delivery', 'takeout', 'drive through',
-            'credit cards accepted', 'cash only', 'reservations', 'walk-ins welcome',
-            'valet parking', 'free parking', 'paid parking', 'restrooms', 'family friendly',
-            'live music', 'happy hour', 'breakfast', 'lunch', 'dinner', 'late night',
-            'open 24 hours', 'weekend hours', 'appointment only', 'online booking'
-        ]
-    
-    def classify_columns(self, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        # Keyword vocabularies are shared module constants
+        self.location_keywords = LOCATION_KEYWORDS
+        self.category_keywords = CATEGORY_KEYWORDS
+        self.amenity_keywords = AMENITY_KEYWORDS
+        self.review_keywords = REVIEW_KEYWORDS
+        self.common_email_domains = COMMON_EMAIL_DOMAINS
+        
+        # Regex patterns are compiled once here; each list is joined into a single
+        # alternation so a value is scanned once instead of once per pattern
+        self._business_name_pattern = self._compile_union([
+            r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b',  # Title Case Names
+            r'\b[A-Z][a-z]+\'s\b',  # Possessive names (Joe's, Mary's)
+            r'\b(LLC|Inc|Corp|Ltd|Company)\b',  # Business suffixes
+            r'\b(The\s+[A-Z][a-z]+)\b',  # "The Something"
+            r'\b[A-Z]+\s+[A-Z]+\b'  # All caps business names
+        ])
+        
+        self._phone_pattern = self._compile_union([
+            r'^\+?1[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}$',  # US format
+            r'^\+?91[-.\s]?[0-9]{10}$',  # Indian format
+            r'^\+?44[-.\s]?[0-9]{10,11}$',  # UK format
+            r'^\+?49[-.\s]?[0-9]{10,12}$',  # German format
+            r'^\+?33[-.\s]?[0-9]{9,10}$',  # French format
+            r'^\+?86[-.\s]?[0-9]{11}$',  # Chinese format
+            r'^[0-9]{10}$',  # Simple 10 digit
+            r'^\([0-9]{3}\)\s?[0-9]{3}-[0-9]{4}$',  # (123) 456-7890
+            r'^[0-9]{3}-[0-9]{3}-[0-9]{4}$',  # 123-456-7890
+            r'^[0-9]{3}\.[0-9]{3}\.[0-9]{4}$',  # 123.456.7890
+            r'^\+?[0-9]{1,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}$'  # International
+        ])
+        self._phone_separated_pattern = re.compile(r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b')
+        self._phone_loose_pattern = re.compile(r'^\+?[\d\s\-\.\(\)]{7,15}$')
+        self._phone_digit_pattern = re.compile(r'[\d+]')
+        
+        # One scan tells apart a full email match from a single '@' followed by a
+        # common or merely plausible domain; whichever group is set is the tier
+        self._email_pattern = re.compile(
+            r'^(?:(?P<email>[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})'
+            r'|[^@]+@\s*(?:(?P<common_domain>' + '|'.join(map(re.escape, sorted(COMMON_EMAIL_DOMAINS))) + r')'
+            r'|(?P<plausible_domain>[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}))\s*)$'
+        )
+        
+        self._hours_pattern = self._compile_union([
+            r'\b\d{1,2}:\d{2}\s?(?:am|pm|AM|PM)\b',  # 9:00 AM, 5:30 PM
+            r'\b\d{1,2}(?:am|pm|AM|PM)\b',  # 9AM, 5PM
+            r'\b\d{1,2}:\d{2}\s?-\s?\d{1,2}:\d{2}\b',  # 9:00 - 17:00
+            r'\b(?:mon|tue|wed|thu|fri|sat|sun|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b',
+            r'\b(?:open|closed|hours?|schedule)\b',
+            r'\b24/7\b',
+            r'\b\d{1,2}-\d{1,2}\b'  # 9-5
+        ], re.IGNORECASE)
+        
+        self._price_pattern = self._compile_union([
+            r'\$\d+(?:\.\d{2})?',  # $10, $10.99
+            r'\b\d+\.\d{2}\b',  # 10.99
+            r'\b(?:free|cheap|expensive|affordable|budget|premium|luxury)\b',
+            r'\$+',  # $, $$, $$$, $$$$
+            r'\b(?:price|cost|fee|rate|charge)\b'
+        ], re.IGNORECASE)
+        
+        self._location_keyword_pattern = self._compile_keywords(LOCATION_KEYWORDS)
+        self._street_address_pattern = re.compile(r'\d+.*(?:street|road|avenue|lane|drive)')
+        self._postal_code_pattern = re.compile(r'\b\d{5,6}\b')
+        
+        self._social_pattern = self._compile_union([
+            r'facebook\.com',
+            r'instagram\.com',
+            r'twitter\.com',
+            r'linkedin\.com',
+            r'youtube\.com',
+            r'tiktok\.com',
+            r'@[a-zA-Z0-9_]+',  # Handle format
+            r'https?://',  # General URL pattern
+        ])
+        
+        # Keyword lists are matched as escaped alternations: one scan per value
+        # finds whether any keyword occurs as a substring
+        self._category_keyword_pattern = self._compile_keywords(CATEGORY_KEYWORDS)
+        self._amenity_keyword_pattern = self._compile_keywords(AMENITY_KEYWORDS)
+        self._category_indicator_pattern = self._compile_keywords(['type', 'service', 'cuisine', 'style', 'category'])
+        self._business_descriptor_pattern = self._compile_keywords(['local', 'chain', 'franchise', 'independent', 'organic', 'premium'])
+        
+        # Keywords that strongly indicate a value is NOT a business name
+        self._business_exclude_pattern = self._compile_keywords(CATEGORY_KEYWORDS | AMENITY_KEYWORDS | NON_BUSINESS_KEYWORDS)
+        self._generic_word_pattern = self._compile_keywords(['type', 'category', 'service'])
+        
+        self._review_keyword_pattern = self._compile_keywords(REVIEW_KEYWORDS)
+        self._star_rating_pattern = re.compile(r'\b[1-5]\s*(?:star|out of)')
+        self._decimal_rating_pattern = re.compile(r'\b[0-5]\.[0-9]\b')
+    
+    @staticmethod
+    def _compile_union(patterns: List[str], flags: int = 0) -> re.Pattern:
+        """Compile several patterns into one alternation that matches if any of them does."""
+        return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), flags)
+    
+    @staticmethod
+    def _compile_keywords(keywords: Iterable[str]) -> re.Pattern:
+        """
+        Compile keywords into one pattern that finds any of them as a substring.
+        The keywords are merged into a trie first, so the pattern branches on one
+        character at a time instead of trying every keyword at every position.
+        """
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}  # end of a keyword
+        return re.compile(ColumnClassifier._trie_to_regex(trie))
+    
+    @staticmethod
+    def _trie_to_regex(node: Dict[str, Dict]) -> str:
+        """Render a keyword trie node as a regex that matches any keyword below it."""
+        branches = []
+        single_chars = []
+        for char in sorted(key for key in node if key):
+            rest = ColumnClassifier._trie_to_regex(node[char])
+            if rest:
+                branches.append(re.escape(char) + rest)
+            else:
+                single_chars.append(re.escape(char))
+        
+        if len(single_chars) == 1:
+            branches.append(single_chars[0])
+        elif single_chars:
+            branches.append('[' + ''.join(single_chars) + ']')
+        
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A keyword ending here makes the rest optional
+        return f'(?:{pattern})?' if '' in node else pattern
+    
+    def classify_columns(self, df: pd.DataFrame, sample_size: Optional[int] = DEFAULT_SAMPLE_SIZE) -> Dict[str, Dict[str, Any]]:
         """
         Classify all columns in the dataframe and return suggestions.
         
         Args:
             df: pandas DataFrame to analyze
+            sample_size: Columns with more non-null values are scored on a fixed
+                random sample of this size (None scores every value)
             
         Returns:
             Dictionary with column analysis results
         """
-        results = {}
+        columns = list(df.columns)
+        # Columns with the same values (duplicated or placeholder copies) are scored once per call
+        content_scores = {}
+        if len(columns) <= 1:
+            return {column: self._classify_one_column(column, df[column], sample_size, content_scores) for column in columns}
+        
+        # Columns are independent; the regex and string work runs in a pool of threads
+        with ThreadPoolExecutor(max_workers=min(MAX_CLASSIFY_WORKERS, len(columns))) as executor:
+            classified = executor.map(
+                lambda column: self._classify_one_column(column, df[column], sample_size, content_scores), columns
+            )
+            return dict(zip(columns, classified))
+    
+    def _classify_one_column(self, column: str, series: pd.Series, sample_size: Optional[int],
+                             content_scores: Dict[Tuple, 'ContentScores']) -> Dict[str, Any]:
+        """Classify a single column, sharing content scores with identical columns of the same call."""
+        # Get non-null values for analysis
+        non_null_values = series.dropna()
+        
+        if len(non_null_values) == 0:
+            return {
+                'original_name': column,
+                'suggested_category': 'Unknown / Junk',
+                'confidence': 0.0,
+                'sample_values': [],
+                'total_values': 0,
+                'non_null_values': 0
+            }
         
-        for column in df.columns:
-            # Get non-null values for analysis
-            non_null_values = df[column].dropna()
-            
-            if len(non_null_values) == 0:
-                results[column] = {
-                    'original_name': column,
-                    'suggested_category': 'Unknown / Junk',
-                    'confidence': 0.0,
-                    'sample_values': [],
-                    'total_values': 0,
-                    'non_null_values': 0
-                }
-                continue
-            
-            # Check column name for hints first
-            column_name_lower = column.lower()
-            column_name_bonus = self._get_column_name_bonus(column_name_lower)
-            
-            # Calculate confidence scores for each category
-            scores = {}
-            for category, classifier_func in self.categories.items():
+        # Check column name for hints first
+        column_name_lower = column.lower()
+        column_name_bonus = self._get_column_name_bonus(column_name_lower)
+        
+        # Large columns are scored on a sample; counts below still use every value
+        scored_values = non_null_values
+        if sample_size is not None and len(non_null_values) > sample_size:
+            scored_values = non_null_values.sample(n=sample_size, random_state=0)
+        
+        # Score each distinct value once; codes map the rows back to them
+        unique_values, codes = self._factorize(scored_values)
+        key = (unique_values.dtype, tuple(unique_values.tolist()), codes.tobytes())
+        base_scores = content_scores.get(key)
+        if base_scores is None:
+            base_scores = content_scores.setdefault(key, self._content_scores(*key))
+        
+        # Calculate confidence scores for each category
+        scores = {}
+        
+        # Fast path: the category the column name hints at most strongly is scored
+        # first, and taken outright if its content lifts it to the 1.0 cap
+        if column_name_bonus:
+            hinted_category = max(column_name_bonus, key=column_name_bonus.get)
+            hinted_score = min(1.0, base_scores[hinted_category] + column_name_bonus[hinted_category])
+            if hinted_score >= 1.0:
+                scores[hinted_category] = hinted_score
+        
+        if not scores:
+            for category in self.categories:
                 if category != 'Unknown / Junk':
-                    base_score = classifier_func(non_null_values)
                     # Add bonus from column name
-                    scores[category] = min(1.0, base_score + column_name_bonus.get(category, 0))
-            
-            # Find the best category
-            best_category = max(scores.items(), key=lambda x: x[1])
-            
-            # If no category has sufficient confidence, mark as Unknown
-            if best_category[1] < 0.3:
-                suggested_category = 'Unknown / Junk'
-                confidence = 0.0
-            else:
-                suggested_category = best_category[0]
-                confidence = best_category[1]
-            
-            # Get sample values (first 5 non-null values)
-            sample_values = non_null_values.head(5).tolist()
-            
-            results[column] = {
-                'original_name': column,
-                'suggested_category': suggested_category,
-                'confidence': round(confidence, 2),
-                'sample_values': sample_values,
-                'total_values': len(df[column]),
-                'non_null_values': len(non_null_values),
-                'all_scores': {k: round(v, 2) for k, v in scores.items()}
+                    scores[category] = min(1.0, base_scores[category] + column_name_bonus.get(category, 0))
+                    # Ties go to the earlier category, so nothing after a capped score can win
+                    if scores[category] >= 1.0:
+                        break
+        
+        # Find the best category
+        best_category = max(scores.items(), key=lambda x: x[1])
+        
+        # If no category has sufficient confidence, mark as Unknown
+        if best_category[1] < 0.3:
+            suggested_category = 'Unknown / Junk'
+            confidence = 0.0
+        else:
+            suggested_category = best_category[0]
+            confidence = best_category[1]
+        
+        # Get sample values (first 5 non-null values)
+        sample_values = non_null_values.head(5).tolist()
+        
+        return {
+            'original_name': column,
+            'suggested_category': suggested_category,
+            'confidence': round(confidence, 2),
+            'sample_values': sample_values,
+            'total_values': len(series),
+            'non_null_values': len(non_null_values),
+            # Every category is listed; ones skipped after the early exit are None
+            'all_scores': {
+                category: round(scores[category], 2) if category in scores else None
+                for category in self.categories
+                if category != 'Unknown / Junk'
             }
+        }
+    
+    def _content_scores(self, dtype: Any, values: Tuple, codes_bytes: bytes) -> 'ContentScores':
+        """Content scores of a column, from its distinct values and row codes."""
+        unique_values = pd.Series(list(values), dtype=dtype)
+        codes = np.frombuffer(codes_bytes, dtype=np.intp)
+        return ContentScores(self, unique_values, codes)
+    
+    @staticmethod
+    def _factorize(series: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+        """Split a column into its distinct values and the code of each row's value."""
+        if series.dtype == 'object':
+            # Classifiers compare object values by their string form
+            series = series.astype(str)
+        
+        codes, uniques = pd.factorize(series, sort=False)
+        return pd.Series(uniques, dtype=series.dtype), codes
+    
+    @staticmethod
+    def _average(scores: Any, counted: Any, codes: Optional[np.ndarray] = None, all_rows: bool = False) -> float:
+        """
+        Average per-value scores over the rows they stand for. Only `counted`
+        values add to the denominator unless `all_rows` is set. Scores are added
+        in row order (np.cumsum is sequential) so the result is exactly what a
+        per-row `matches += score` loop gives.
+        """
+        scores = np.asarray(scores, dtype=np.float64)
+        counted = np.asarray(counted, dtype=bool)
+        if codes is not None:
+            scores, counted = scores[codes], counted[codes]
         
-        return results
+        total_count = len(scores) if all_rows else int(counted.sum())
+        if total_count == 0:
+            return 0.0
+        return float(np.cumsum(scores)[-1] / total_count)
+    
+    @staticmethod
+    def _score_values(score_func: Any, values: pd.Series, counted: np.ndarray) -> np.ndarray:
+        """Apply a per-value scorer to the counted values; the others score 0."""
+        scores = np.zeros(len(values))
+        # Plain list iteration avoids boxing each element through Series.__iter__
+        scores[counted] = [score_func(value) for value in values[counted].tolist()]
+        return scores
+    
+    @staticmethod
+    def _lowercase(series: pd.Series, lowered: Optional[pd.Series] = None) -> pd.Series:
+        """Lowercased string form of a column, reusing `lowered` when the caller already has it."""
+        return lowered if lowered is not None else series.astype(str).str.lower()
     
     def _get_column_name_bonus(self, column_name: str) -> Dict[str, float]:
         """Get bonus scores based on column name patterns."""
         bonuses = {}
         
-        # Business Name indicators
-        business_name_words = ['business_name', 'company_name', 'name', 'business', 'company', 'establishment']
-        if any(word in column_name for word in business_name_words):
-            if not any(word in column_name for word in ['type', 'category', 'kind']):
-                bonuses['Business Name'] = 0.8
-        
-        # Phone indicators
-        phone_words = ['phone', 'mobile', 'contact_phone', 'tel', 'telephone', 'cell', 'contact_number']
-        if any(word in column_name for word in phone_words):
-            if not any(word in column_name for word in ['rating', 'score', 'count', 'id', 'fax']):
-                bonuses['Phone Number'] = 0.8
-        
-        # Email indicators
-        email_words = ['email', 'mail', 'e_mail', 'email_address', 'contact_email']
-        if any(word in column_name for word in email_words):
-            bonuses['Email'] = 0.9
-        
-        # Category indicators
-        category_words = ['type', 'category', 'kind', 'business_type', 'amenity', 'amenities', 
-                         'service', 'feature', 'classification', 'genre', 'tag', 'tags']
-        if any(word in column_name for word in category_words):
-            bonuses['Category'] = 0.9
-        
-        # Location indicators
-        location_words = ['address', 'location', 'city', 'state', 'country', 'zip', 'postal', 
-                         'full_address', 'street', 'coordinates', 'lat', 'lng', 'longitude', 'latitude']
-        if any(word in column_name for word in location_words):
-            bonuses['Location'] = 0.8
-        
-        # Social Links indicators
-        social_words = ['website', 'url', 'link', 'social', 'facebook', 'instagram', 'twitter', 
-                       'website_url', 'homepage', 'web', 'site']
-        if any(word in column_name for word in social_words):
-            bonuses['Social Links'] = 0.8
-        
-        # Review indicators
-        review_words = ['review', 'rating', 'feedback', 'comment', 'score', 'customer_review', 
-                       'rating_score', 'stars', 'satisfaction']
-        if any(word in column_name for word in review_words):
-            bonuses['Review'] = 0.8
-        
-        # Hours indicators
-        hours_words = ['hours', 'time', 'schedule', 'operating_hours', 'business_hours', 'open', 'close']
-        if any(word in column_name for word in hours_words):
-            bonuses['Hours'] = 0.8
-        
-        # Price indicators
-        price_words = ['price', 'cost', 'fee', 'charge', 'rate', 'pricing', 'budget', 'expense']
-        if any(word in column_name for word in price_words):
-            bonuses['Price'] = 0.8
+        # Whole tokens are plain dict lookups; the substring scan then only
+        # checks keywords of categories that have not matched yet
+        for token in NAME_TOKEN_SPLIT.split(column_name):
+            if token in NAME_BONUS_MAP:
+                category, weight = NAME_BONUS_MAP[token]
+                bonuses[category] = weight
+        
+        for keyword, (category, weight) in NAME_BONUS_MAP.items():
+            if category not in bonuses and keyword in column_name:
+                bonuses[category] = weight
+        
+        # Drop bonuses cancelled by words such as 'type' or 'fax'
+        for keyword, category in NAME_BONUS_EXCLUSIONS.items():
+            if category in bonuses and keyword in column_name:
+                del bonuses[category]
         
         return bonuses
     
-    def _classify_business_name(self, series: pd.Series) -> float:
+    def _classify_business_name(self, series: pd.Series, codes: Optional[np.ndarray] = None, lowered: Optional[pd.Series] = None) -> float:
         """Classify if column contains business names."""
         if series.dtype != 'object':
             return 0.0
         
         str_series = series.astype(str)
+        counted = (str_series != 'nan').to_numpy()
+        scores = self._score_values(self._business_name_score, str_series.str.strip(), counted)
         
-        # Keywords that strongly indicate it's NOT a business name
-        exclude_keywords = set(self.category_keywords + self.amenity_keywords + [
-            'email', 'phone', 'address', 'location', 'city', 'state', 'zip',
-            'review', 'rating', 'comment', 'feedback', 'description',
-            'hours', 'open', 'closed', 'schedule', 'time',
-            'price', 'cost', 'fee', 'rate', 'charge', '$', 'dollar',
-            'website', 'url', 'link', 'http', 'www', '.com', '.org', '.net'
-        ])
-        
-        # Business name indicators (proper nouns, specific patterns)
-        business_patterns = [
-            r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b',  # Title Case Names
-            r'\b[A-Z][a-z]+\'s\b',  # Possessive names (Joe's, Mary's)
-            r'\b(LLC|Inc|Corp|Ltd|Company)\b',  # Business suffixes
-            r'\b(The\s+[A-Z][a-z]+)\b',  # "The Something"
-            r'\b[A-Z]+\s+[A-Z]+\b'  # All caps business names
-        ]
-        
-        matches = 0
-        total_count = 0
+        return self._average(scores, counted, codes)
+    
+    def _business_name_score(self, value_str: str) -> float:
+        """Business name score of a single stripped value."""
+        value_lower = value_str.lower()
         
-        for value in str_series:
-            if pd.isna(value) or value == 'nan':
-                continue
-                
-            total_count += 1
-            value_str = str(value).strip()
-            value_lower = value_str.lower()
-            
-            # Exclude if it contains category/amenity keywords
-            if any(keyword in value_lower for keyword in exclude_keywords):
-                continue
-            
-            # Check for business name patterns
-            if any(re.search(pattern, value_str) for pattern in business_patterns):
-                matches += 1
-            # Check for proper noun characteristics
-            elif (len(value_str.split()) >= 2 and 
-                  value_str[0].isupper() and 
-                  not value_lower in self.category_keywords and
-                  not any(amenity in value_lower for amenity in self.amenity_keywords)):
-                matches += 0.8
-            # Check for unique names (not common words)
-            elif (len(value_str) > 3 and 
-                  not value_lower in ['restaurant', 'store', 'shop', 'cafe', 'bar', 'hotel'] and
-                  not any(keyword in value_lower for keyword in ['type', 'category', 'service'])):
-                matches += 0.6
-        
-        return matches / total_count if total_count > 0 else 0.0
-    
-    def _classify_phone(self, series: pd.Series) -> float:
+        # Exclude if it contains category/amenity keywords
+        if self._business_exclude_pattern.search(value_lower):
+            return 0.0
+        # Check for business name patterns
+        if self._business_name_pattern.search(value_str):
+            return 1.0
+        # Check for proper noun characteristics
+        # (split stops after the first break: two pieces already mean two words)
+        if (len(value_str.split(None, 1)) >= 2 and 
+            value_str[0].isupper() and 
+            not value_lower in CATEGORY_KEYWORDS and
+            not self._amenity_keyword_pattern.search(value_lower)):
+            return 0.8
+        # Check for unique names (not common words)
+        if (len(value_str) > 3 and 
+            not value_lower in GENERIC_BUSINESS_WORDS and
+            not self._generic_word_pattern.search(value_lower)):
+            return 0.6
+        return 0.0
+    
+    def _classify_phone(self, series: pd.Series, codes: Optional[np.ndarray] = None, lowered: Optional[pd.Series] = None) -> float:
         """Classify if column contains phone numbers."""
+        if pd.api.types.is_integer_dtype(series.dtype):
+            return self._classify_integer_phone(series, codes)
+        
         if series.dtype == 'object':
             str_series = series.astype(str)
         else:
-            str_series = series
+            str_series = series.map(str)
         
-        phone_patterns = [
-            r'^\+?1[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}$',  # US format
-            r'^\+?91[-.\s]?[0-9]{10}$',  # Indian format
-            r'^\+?44[-.\s]?[0-9]{10,11}$',  # UK format
-            r'^\+?49[-.\s]?[0-9]{10,12}$',  # German format
-            r'^\+?33[-.\s]?[0-9]{9,10}$',  # French format
-            r'^\+?86[-.\s]?[0-9]{11}$',  # Chinese format
-            r'^[0-9]{10}$',  # Simple 10 digit
-            r'^\([0-9]{3}\)\s?[0-9]{3}-[0-9]{4}$',  # (123) 456-7890
-            r'^[0-9]{3}-[0-9]{3}-[0-9]{4}$',  # 123-456-7890
-            r'^[0-9]{3}\.[0-9]{3}\.[0-9]{4}$',  # 123.456.7890
-            r'^\+?[0-9]{1,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}$'  # International
-        ]
+        valid = str_series != 'nan'
+        values = str_series.str.strip()
         
-        matches = 0
-        total_count = 0
+        # Known formats and common separated layouts count fully, loose digit runs partially
+        formatted = values.str.match(self._phone_pattern) | values.str.contains(self._phone_separated_pattern)
+        loose = ~formatted & values.str.match(self._phone_loose_pattern)
         
-        for value in str_series:
-            if pd.isna(value) or value == 'nan':
-                continue
-                
-            total_count += 1
-            value_str = str(value).strip()
-            
-            # Clean the value for digit counting
-            cleaned_value = re.sub(r'[^\d+]', '', value_str)
-            
-            # Check if it's in valid phone number length range
-            if 7 <= len(cleaned_value) <= 15:
-                # Check against patterns
-                if any(re.match(pattern, value_str) for pattern in phone_patterns):
-                    matches += 1
-                # Check for common phone indicators
-                elif re.search(r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b', value_str):
-                    matches += 1
-                # Simple digit check with common separators
-                elif re.search(r'^\+?[\d\s\-\.\(\)]{7,15}$', value_str) and len(cleaned_value) >= 7:
-                    matches += 0.8
-        
-        return matches / total_count if total_count > 0 else 0.0
-    
-    def _classify_email(self, series: pd.Series) -> float:
+        # Only values with a valid phone number length of digits are considered.
+        # Digits are counted in place, and only for values whose shape already fits
+        shaped = (valid & (formatted | loose)).to_numpy()
+        in_range = np.zeros(len(values), dtype=bool)
+        in_range[shaped] = values[shaped].str.count(self._phone_digit_pattern).between(7, 15).to_numpy()
+        
+        return self._average(np.select([formatted & in_range, loose & in_range], [1.0, 0.8], 0.0), valid, codes)
+    
+    def _classify_integer_phone(self, series: pd.Series, codes: Optional[np.ndarray] = None, lowered: Optional[pd.Series] = None) -> float:
+        """Phone score for an integer column, computed from digit counts without building strings."""
+        if pd.api.types.is_unsigned_integer_dtype(series.dtype):
+            # Unsigned values may not fit int64; compare them as uint64 throughout
+            values = series.to_numpy(dtype=np.uint64)
+            digits = np.searchsorted(POWERS_OF_TEN.astype(np.uint64), values, side='right') + 1
+            negative = np.zeros(len(values), dtype=bool)
+        else:
+            values = series.to_numpy(dtype=np.int64)
+            digits = np.searchsorted(POWERS_OF_TEN, np.abs(values), side='right') + 1
+            negative = values < 0
+        
+        # 10-15 digits always fit one of the known formats; shorter runs (and
+        # negative numbers, whose leading '-' fits no format) only match loosely
+        strong = ~negative & (digits >= 10) & (digits <= 15)
+        weak = ~strong & (digits >= 7) & (digits + negative <= 15)
+        
+        return self._average(np.select([strong, weak], [1.0, 0.8], 0.0), np.ones(len(values), dtype=bool), codes)
+    
+    def _classify_email(self, series: pd.Series, codes: Optional[np.ndarray] = None, lowered: Optional[pd.Series] = None) -> float:
         """Classify if column contains email addresses."""
         if series.dtype != 'object':
             return 0.0
         
         str_series = series.astype(str)
         
-        # Comprehensive email pattern
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        valid = str_series != 'nan'
+        if not valid.any():
+            return 0.0
         
-        # Common email domains for additional validation
-        common_domains = [
-            'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com',
-            'icloud.com', 'mail.com', 'protonmail.com', 'zoho.com', 'yandex.com',
-            'msn.com', 'live.com', 'comcast.net', 'verizon.net', 'sbcglobal.net'
-        ]
+        values = self._lowercase(series, lowered).str.strip()
+        tiers = values.str.extract(self._email_pattern).notna().to_numpy() & valid.to_numpy()[:, None]
         
-        matches = 0
-        total_count = 0
+        # Full pattern match, then partial matches with bonus points for common domains
+        primary, common, plausible = tiers.T
         
-        for value in str_series:
-            if pd.isna(value) or value == 'nan':
-                continue
-                
-            total_count += 1
-            value_str = str(value).strip().lower()
-            
-            # Primary email pattern match
-            if re.match(email_pattern, value_str):
-                matches += 1
-            # Check for @ symbol and basic structure
-            elif '@' in value_str and '.' in value_str:
-                # Additional validation for partial matches
-                parts = value_str.split('@')
-                if len(parts) == 2 and len(parts[0]) > 0 and '.' in parts[1]:
-                    domain = parts[1].strip()
-                    # Bonus points for common domains
-                    if domain in common_domains:
-                        matches += 0.9
-                    elif re.match(r'^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', domain):
-                        matches += 0.7
-        
-        return matches / total_count if total_count > 0 else 0.0
-    
-    def _classify_category(self, series: pd.Series) -> float:
+        return self._average(np.select([primary, common, plausible], [1.0, 0.9, 0.7], 0.0), valid, codes)
+    
+    def _classify_category(self, series: pd.Series, codes: Optional[np.ndarray] = None, lowered: Optional[pd.Series] = None) -> float:
         """Classify if column contains business categories."""
         if series.dtype != 'object':
             return 0.0
         
-        str_series = series.astype(str).str.lower()
+        str_series = self._lowercase(series, lowered)
+        counted = (str_series != 'nan').to_numpy()
+        scores = self._score_values(self._category_score, str_series.str.strip(), counted)
         
-        matches = 0
-        total_count = 0
-        
-        for value in str_series:
-            if pd.isna(value) or value == 'nan':
-                continue
-                
-            total_count += 1
-            value_str = str(value).strip()
-            
-            # Direct keyword match
-            if any(keyword in value_str for keyword in self.category_keywords):
-                matches += 1
-            # Check for amenity keywords (strong indicator of category)
-            elif any(amenity in value_str for amenity in self.amenity_keywords):
-                matches += 0.9
-            # Check for category indicators
-            elif any(indicator in value_str for indicator in ['type', 'service', 'cuisine', 'style', 'category']):
-                matches += 0.7
-            # Check for common business descriptors
-            elif any(descriptor in value_str for descriptor in ['local', 'chain', 'franchise', 'independent', 'organic', 'premium']):
-                matches += 0.5
-        
-        return matches / total_count if total_count > 0 else 0.0
+        return self._average(scores, counted, codes)
+    
+    def _category_score(self, value_str: str) -> float:
+        """Category score of a single lowercased, stripped value."""
+        # Direct keyword match
+        if self._category_keyword_pattern.search(value_str):
+            return 1.0
+        # Check for amenity keywords (strong indicator of category)
+        if self._amenity_keyword_pattern.search(value_str):
+            return 0.9
+        # Check for category indicators
+        if self._category_indicator_pattern.search(value_str):
+            return 0.7
+        # Check for common business descriptors
+        if self._business_descriptor_pattern.search(value_str):
+            return 0.5
+        return 0.0
 
-    def _classify_hours(self, series: pd.Series) -> float:
+    def _classify_hours(self, series: pd.Series, codes: Optional[np.ndarray] = None, lowered: Optional[pd.Series] = None) -> float:
         """Classify if column contains business hours."""
         if series.dtype != 'object':
             return 0.0
         
-        str_series = series.astype(str).str.lower()
-        
-        hour_patterns = [
-            r'\b\d{1,2}:\d{2}\s?(am|pm|AM|PM)\b',  # 9:00 AM, 5:30 PM
-            r'\b\d{1,2}(am|pm|AM|PM)\b',  # 9AM, 5PM
-            r'\b\d{1,2}:\d{2}\s?-\s?\d{1,2}:\d{2}\b',  # 9:00 - 17:00
-            r'\b(mon|tue|wed|thu|fri|sat|sun|monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b',
-            r'\b(open|closed|hours?|schedule)\b',
-            r'\b24/7\b',
-            r'\b\d{1,2}-\d{1,2}\b'  # 9-5
-        ]
+        str_series = self._lowercase(series, lowered)
         
-        matches = 0
-        total_count = 0
-        
-        for value in str_series:
-            if pd.isna(value) or value == 'nan':
-                continue
-                
-            total_count += 1
-            value_str = str(value)
-            
-            if any(re.search(pattern, value_str, re.IGNORECASE) for pattern in hour_patterns):
-                matches += 1
-        
-        return matches / total_count if total_count > 0 else 0.0
+        valid = str_series != 'nan'
+        matches = valid & str_series.str.contains(self._hours_pattern)
+        return self._average(matches, valid, codes)
 
-    def _classify_price(self, series: pd.Series) -> float:
+    def _classify_price(self, series: pd.Series, codes: Optional[np.ndarray] = None, lowered: Optional[pd.Series] = None) -> float:
         """Classify if column contains price information."""
+        # Integers and booleans never render with a currency sign, decimals or price words
+        if pd.api.types.is_integer_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype):
+            return 0.0
+        
         if series.dtype == 'object':
-            str_series = series.astype(str).str.lower()
+            str_series = self._lowercase(series, lowered)
         else:
             str_series = series.astype(str)
         
-        price_patterns = [
-            r'\$\d+(\.\d{2})?',  # $10, $10.99
-            r'\b\d+\.\d{2}\b',  # 10.99
-            r'\b(free|cheap|expensive|affordable|budget|premium|luxury)\b',
-            r'\$+',  # $, $$, $$$, $$$$
-            r'\b(price|cost|fee|rate|charge)\b'
-        ]
-        
-        matches = 0
-        total_count = 0
-        
-        for value in str_series:
-            if pd.isna(value) or value == 'nan':
-                continue
-                
-            total_count += 1
-            value_str = str(value)
-            
-            if any(re.search(pattern, value_str, re.IGNORECASE) for pattern in price_patterns):
-                matches += 1
-        
-        return matches / total_count if total_count > 0 else 0.0
+        valid = str_series != 'nan'
+        matches = valid & str_series.str.contains(self._price_pattern)
+        return self._average(matches, valid, codes)
     
-    def _classify_location(self, series: pd.Series) -> float:
+    def _classify_location(self, series: pd.Series, codes: Optional[np.ndarray] = None, lowered: Optional[pd.Series] = None) -> float:
         """Classify if column contains location information."""
         if series.dtype != 'object':
             return 0.0
         
-        str_series = series.astype(str).str.lower()
+        str_series = self._lowercase(series, lowered)
+        valid = str_series != 'nan'
         
-        matches = 0
-        for value in str_series:
-            if pd.isna(value) or value == 'nan':
-                continue
-            
-            # Check for location keywords
-            if any(keyword in str(value) for keyword in self.location_keywords):
-                matches += 1
-            # Check for address patterns
-            elif re.search(r'\d+.*(?:street|road|avenue|lane|drive)', str(value)):
-                matches += 1
-            # Check for postal code patterns
-            elif re.search(r'\b\d{5,6}\b', str(value)):
-                matches += 0.5
-        
-        return matches / len(str_series) if len(str_series) > 0 else 0.0
-    
-    def _classify_social_links(self, series: pd.Series) -> float:
+        # Location keywords and address patterns count fully, postal codes partially
+        strong = valid & (str_series.str.contains(self._location_keyword_pattern) |
+                          str_series.str.contains(self._street_address_pattern))
+        postal = valid & ~strong & str_series.str.contains(self._postal_code_pattern)
+        
+        return self._average(np.select([strong, postal], [1.0, 0.5], 0.0), valid, codes, all_rows=True)
+    
+    def _classify_social_links(self, series: pd.Series, codes: Optional[np.ndarray] = None, lowered: Optional[pd.Series] = None) -> float:
         """Classify if column contains social media links."""
         if series.dtype != 'object':
             return 0.0
         
-        str_series = series.astype(str).str.lower()
-        
-        social_patterns = [
-            r'facebook\.com',
-            r'instagram\.com',
-            r'twitter\.com',
-            r'linkedin\.com',
-            r'youtube\.com',
-            r'tiktok\.com',
-            r'@[a-zA-Z0-9_]+',  # Handle format
-            r'https?://',  # General URL pattern
-        ]
-        
-        matches = 0
-        for value in str_series:
-            if pd.isna(value) or value == 'nan':
-                continue
-            
-            if any(re.search(pattern, str(value)) for pattern in social_patterns):
-                matches += 1
+        str_series = self._lowercase(series, lowered)
+        valid = str_series != 'nan'
         
-        return matches / len(str_series) if len(str_series) > 0 else 0.0
+        matches = valid & str_series.str.contains(self._social_pattern)
+        return self._average(matches, valid, codes, all_rows=True)
     
-    def _classify_review(self, series: pd.Series) -> float:
+    def _classify_review(self, series: pd.Series, codes: Optional[np.ndarray] = None, lowered: Optional[pd.Series] = None) -> float:
         """Classify if column contains reviews or ratings."""
         # Check for numeric ratings first
-        if pd.api.types.is_numeric_dtype(series):
+        if series.dtype.kind in 'biuf':
             # Check if values are in typical rating ranges
-            numeric_series = pd.to_numeric(series, errors='coerce').dropna()
-            if len(numeric_series) == 0:
+            numeric_values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            numeric_values = numeric_values[~np.isnan(numeric_values)]
+            if numeric_values.size == 0:
                 return 0.0
                 
-            min_val, max_val = numeric_series.min(), numeric_series.max()
+            min_val, max_val = numeric_values.min(), numeric_values.max()
             
             # Common rating scales
             if (0 <= min_val <= 5 and 0 <= max_val <= 5):
@@ -520,38 +673,77 @@ class ColumnClassifier:
         
         # Text-based reviews
         elif series.dtype == 'object':
-            str_series = series.astype(str).str.lower()
-            
-            review_keywords = [
-                'review', 'rating', 'feedback', 'comment', 'opinion',
-                'good', 'bad', 'excellent', 'poor', 'great', 'terrible',
-                'recommend', 'satisfied', 'disappointed', 'star', 'amazing',
-                'awesome', 'fantastic', 'horrible', 'love', 'hate'
-            ]
-            
-            matches = 0
-            total_count = 0
-            
-            for value in str_series:
-                if pd.isna(value) or value == 'nan':
-                    continue
-                
-                total_count += 1
-                value_str = str(value)
-                
-                # Check for review keywords
-                if any(keyword in value_str for keyword in review_keywords):
-                    matches += 1
-                # Check for rating patterns (1-5 stars, 1-10 ratings)
-                elif re.search(r'\b[1-5]\s*(?:star|out of)', value_str):
-                    matches += 1
-                # Long text might be reviews (more than 6 words)
-                elif len(value_str.split()) > 6:
-                    matches += 0.8
-                # Check for numeric ratings in text
-                elif re.search(r'\b[0-5]\.[0-9]\b', value_str):
-                    matches += 0.9
+            str_series = self._lowercase(series, lowered)
+            counted = (str_series != 'nan').to_numpy()
+            scores = self._score_values(self._review_text_score, str_series, counted)
             
-            return matches / total_count if total_count > 0 else 0.0
+            return self._average(scores, counted, codes)
         
         return 0.0
+    
+    def _review_text_score(self, value_str: str) -> float:
+        """Review score of a single lowercased text value."""
+        # Check for review keywords
+        if self._review_keyword_pattern.search(value_str):
+            return 1.0
+        # Check for rating patterns (1-5 stars, 1-10 ratings)
+        if self._star_rating_pattern.search(value_str):
+            return 1.0
+        # Long text might be reviews (more than 6 words; splitting stops once 7 are found)
+        if len(value_str.split(None, 7)) > 6:
+            return 0.8
+        # Check for numeric ratings in text
+        if self._decimal_rating_pattern.search(value_str):
+            return 0.9
+        return 0.0
+    
+    def _classify_text_values(self, series: pd.Series, codes: Optional[np.ndarray] = None, lowered: Optional[pd.Series] = None) -> Dict[str, float]:
+        """
+        Business name, category and review scores of a text column. These three
+        classifiers look at values one at a time, so they share the string
+        conversions and 'nan' masks instead of each building their own.
+        """
+        str_series = series.astype(str)
+        lowered = self._lowercase(series, lowered)
+        lowered_stripped = lowered.str.strip()
+        
+        counted = (str_series != 'nan').to_numpy()
+        # Category and review compare the lowercased value, so 'NaN' is skipped there too
+        counted_lower = (lowered != 'nan').to_numpy()
+        
+        business_scores = self._score_values(self._business_name_score, str_series.str.strip(), counted)
+        category_scores = self._score_values(self._category_score, lowered_stripped, counted_lower)
+        review_scores = self._score_values(self._review_text_score, lowered, counted_lower)
+        
+        return {
+            'Business Name': self._average(business_scores, counted, codes),
+            'Category': self._average(category_scores, counted_lower, codes),
+            'Review': self._average(review_scores, counted_lower, codes),
+        }
+
+
+class ContentScores:
+    """
+    Per-category content scores of one column, each computed the first time it
+    is looked up so classify_columns can stop once the winner is settled.
+    """
+    
+    # Classifiers that score text value by value and share one fused pass
+    TEXT_CATEGORIES = frozenset(['Business Name', 'Category', 'Review'])
+    
+    def __init__(self, classifier: ColumnClassifier, unique_values: pd.Series, codes: np.ndarray):
+        self.classifier = classifier
+        self.unique_values = unique_values
+        self.codes = codes
+        # One lowercased copy of the values serves every classifier
+        self.lowered = unique_values.str.lower() if unique_values.dtype == 'object' else None
+        self.scores: Dict[str, float] = {}
+    
+    def __getitem__(self, category: str) -> float:
+        if category not in self.scores:
+            if category in self.TEXT_CATEGORIES and self.lowered is not None:
+                self.scores.update(self.classifier._classify_text_values(self.unique_values, self.codes, self.lowered))
+            else:
+                classifier_func = self.classifier.categories[category]
+                self.scores[category] = classifier_func(self.unique_values, self.codes, self.lowered)
+        return self.scores[category]
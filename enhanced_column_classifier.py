@@ -1,16 +1,98 @@
 import re
+import functools
 import pandas as pd
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Callable, Optional
 import numpy as np
-from collections import Counter
-import string
+from concurrent.futures import ThreadPoolExecutor
+
+from column_classifier import ColumnClassifier, DEFAULT_SAMPLE_SIZE, MAX_CLASSIFY_WORKERS
+
+
+class DistinctValues:
+    """
+    The distinct str values of a column and the codes mapping its rows back to
+    them. Stripped and lowercased forms are built on first use and shared by
+    every scorer of the column.
+    """
+    
+    def __init__(self, str_series: pd.Series):
+        self.codes, uniques = pd.factorize(str_series)
+        self.values = pd.Series(uniques, dtype=object)
+        # 'nan' strings never count towards a score
+        self.counted = (self.values != 'nan').to_numpy()
+    
+    @functools.cached_property
+    def stripped(self) -> pd.Series:
+        return self.values.str.strip()
+    
+    @functools.cached_property
+    def lowered(self) -> pd.Series:
+        # Stripped then lowercased; lowercasing never adds or removes whitespace,
+        # so this equals lowercasing first
+        return self.stripped.str.lower()
+
 
 class EnhancedColumnClassifier:
     """
     Enhanced column classifier with improved pattern recognition and machine learning-like features.
     """
     
-    def __init__(self):
+    COMMON_EMAIL_DOMAINS = frozenset([
+        'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com',
+        'icloud.com', 'mail.com', 'protonmail.com', 'zoho.com', 'yandex.com',
+        'msn.com', 'live.com', 'comcast.net', 'verizon.net', 'sbcglobal.net',
+        'rediffmail.com', 'indiatimes.com', 'sify.com'  # Indian domains
+    ])
+    
+    # Enhanced location keywords
+    LOCATION_KEYWORDS = frozenset([
+        # Indian cities
+        'delhi', 'mumbai', 'bangalore', 'hyderabad', 'chennai', 'kolkata',
+        'pune', 'ahmedabad', 'surat', 'jaipur', 'lucknow', 'kanpur',
+        'nagpur', 'indore', 'thane', 'bhopal', 'visakhapatnam', 'pimpri',
+        'vadodara', 'nashik', 'rajkot', 'varanasi', 'agra', 'gurgaon',
+        # Global cities
+        'new york', 'london', 'paris', 'tokyo', 'sydney', 'toronto',
+        'los angeles', 'chicago', 'berlin', 'madrid', 'rome', 'moscow',
+        # Address components
+        'street', 'road', 'avenue', 'boulevard', 'lane', 'drive', 'circle',
+        'plaza', 'square', 'court', 'way', 'place', 'terrace', 'park',
+        'address', 'city', 'state', 'country', 'zipcode', 'pincode',
+        'zip', 'postal', 'area', 'sector', 'block', 'plot', 'house',
+        # Indian address terms
+        'nagar', 'colony', 'society', 'apartment', 'complex', 'tower',
+        'phase', 'extension', 'main road', 'cross', 'layout'
+    ])
+    
+    # Review indicators
+    REVIEW_INDICATORS = frozenset([
+        'good', 'bad', 'excellent', 'poor', 'great', 'terrible',
+        'recommend', 'satisfied', 'disappointed', 'amazing',
+        'awful', 'fantastic', 'horrible', 'wonderful', 'disgusting',
+        'stars', 'rating', 'review', 'feedback', 'comment'
+    ])
+    
+    # Categories whose content classifier is the pattern scorer on text columns
+    PATTERN_SCORED_CATEGORIES = frozenset(['Phone Number', 'Email', 'Social Links'])
+    
+    # First characters a value in any of the phone formats can start with
+    PHONE_LEADING_CHARS = ('+', '(', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9')
+    
+    # Leading rows searched for sample values before falling back to the whole column
+    SAMPLE_SCAN_ROWS = 1000
+    
+    # A strong column name match is trusted once this many values, spread
+    # across the column, score at least NAME_CHECK_MIN_SCORE for the named category
+    NAME_MATCH_THRESHOLD = 0.9
+    NAME_CHECK_SIZE = 32
+    NAME_CHECK_MIN_SCORE = 0.9
+    
+    # Weights of the column name, content, pattern and statistical scores
+    ANALYSIS_WEIGHTS = np.array([0.4, 0.3, 0.2, 0.1])
+    
+    def __init__(self, max_sample_size: Optional[int] = DEFAULT_SAMPLE_SIZE):
+        # Larger columns are scored on a random sample of this many values (None scores every value)
+        self.max_sample_size = max_sample_size
         self.categories = {
             'Business Name': self._classify_business_name,
             'Phone Number': self._classify_phone,
@@ -21,8 +103,10 @@ class EnhancedColumnClassifier:
             'Review': self._classify_review,
             'Hours': self._classify_hours,
             'Price': self._classify_price,
-            'Unknown / Junk': lambda col: 0.0
+            'Unknown / Junk': lambda col, distinct=None: 0.0
         }
+        # Fixed order of the scored categories in the combined score matrix
+        self._cats = [category for category in self.categories if category != 'Unknown / Junk']
         
         # Enhanced patterns and keywords
         self._load_enhanced_patterns()
@@ -31,7 +115,7 @@ class EnhancedColumnClassifier:
         """Load enhanced patterns and keywords for better classification."""
         
         # Business name patterns
-        self.business_name_patterns = [
+        self.business_name_patterns = [re.compile(p) for p in [
             r'\b[A-Z][a-z]+\s+[A-Z][a-z]+\b',  # Title Case Names
             r'\b[A-Z][a-z]+\'s\b',  # Possessive names
             r'\b(LLC|Inc|Corp|Ltd|Company|Co\.)\b',  # Business suffixes
@@ -39,10 +123,10 @@ class EnhancedColumnClassifier:
             r'\b[A-Z]{2,}\s+[A-Z][a-z]+\b',  # ACME Corp
             r'\b[A-Z][a-z]+\s+(Restaurant|Cafe|Bar|Store|Shop|Hotel)\b',  # Name + Type
             r'\b[A-Z][a-z]+\s+(& Co|and Co|Bros|Brothers)\b',  # Business partnerships
-        ]
+        ]]
         
         # Enhanced phone patterns
-        self.phone_patterns = [
+        self.phone_patterns = [re.compile(p) for p in [
             r'^\+?1[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}$',  # US
             r'^\+?91[-.\s]?[6-9][0-9]{9}$',  # Indian mobile
             r'^\+?44[-.\s]?[0-9]{10,11}$',  # UK
@@ -54,36 +138,13 @@ class EnhancedColumnClassifier:
             r'^[0-9]{3}-[0-9]{3}-[0-9]{4}$',  # 123-456-7890
             r'^[0-9]{3}\.[0-9]{3}\.[0-9]{4}$',  # 123.456.7890
             r'^\+?[0-9]{1,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}[-.\s]?[0-9]{3,4}$'
-        ]
+        ]]
         
         # Enhanced email patterns
-        self.email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        self.common_email_domains = [
-            'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com', 'aol.com',
-            'icloud.com', 'mail.com', 'protonmail.com', 'zoho.com', 'yandex.com',
-            'msn.com', 'live.com', 'comcast.net', 'verizon.net', 'sbcglobal.net',
-            'rediffmail.com', 'indiatimes.com', 'sify.com'  # Indian domains
-        ]
-        
-        # Enhanced location keywords
-        self.location_keywords = [
-            # Indian cities
-            'delhi', 'mumbai', 'bangalore', 'hyderabad', 'chennai', 'kolkata',
-            'pune', 'ahmedabad', 'surat', 'jaipur', 'lucknow', 'kanpur',
-            'nagpur', 'indore', 'thane', 'bhopal', 'visakhapatnam', 'pimpri',
-            'vadodara', 'nashik', 'rajkot', 'varanasi', 'agra', 'gurgaon',
-            # Global cities
-            'new york', 'london', 'paris', 'tokyo', 'sydney', 'toronto',
-            'los angeles', 'chicago', 'berlin', 'madrid', 'rome', 'moscow',
-            # Address components
-            'street', 'road', 'avenue', 'boulevard', 'lane', 'drive', 'circle',
-            'plaza', 'square', 'court', 'way', 'place', 'terrace', 'park',
-            'address', 'city', 'state', 'country', 'zipcode', 'pincode',
-            'zip', 'postal', 'area', 'sector', 'block', 'plot', 'house',
-            # Indian address terms
-            'nagar', 'colony', 'society', 'apartment', 'complex', 'tower',
-            'phase', 'extension', 'main road', 'cross', 'layout'
-        ]
+        self.email_pattern = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+        self.common_email_domains = self.COMMON_EMAIL_DOMAINS
+        self.location_keywords = self.LOCATION_KEYWORDS
+        self.review_indicators = self.REVIEW_INDICATORS
         
         # Enhanced category keywords with weights
         self.category_keywords = {
@@ -129,7 +190,7 @@ class EnhancedColumnClassifier:
         }
         
         # Social media patterns
-        self.social_patterns = [
+        self.social_patterns = [re.compile(p, re.IGNORECASE) for p in [
             r'https?://(?:www\.)?facebook\.com/[a-zA-Z0-9._-]+',
             r'https?://(?:www\.)?instagram\.com/[a-zA-Z0-9._-]+',
             r'https?://(?:www\.)?twitter\.com/[a-zA-Z0-9._-]+',
@@ -138,7 +199,37 @@ class EnhancedColumnClassifier:
             r'https?://[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}[/a-zA-Z0-9._-]*',
             r'www\.[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
             r'[a-zA-Z0-9.-]+\.(com|org|net|in|co\.in|edu|gov)'
-        ]
+        ]]
+
+        # Hours and price patterns
+        self.time_patterns = [re.compile(p, re.IGNORECASE) for p in [
+            r'\b\d{1,2}:\d{2}\s*(AM|PM|am|pm)\b',  # 9:00 AM
+            r'\b\d{1,2}(:\d{2})?\s*(AM|PM|am|pm)\s*-\s*\d{1,2}(:\d{2})?\s*(AM|PM|am|pm)\b',  # 9 AM - 5 PM
+            r'\b(Mon|Tue|Wed|Thu|Fri|Sat|Sun|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\b',
+            r'\b(Open|Closed|24/7|24 hours)\b',
+            r'\b\d{1,2}-\d{1,2}\b'  # 9-5
+        ]]
+        self.price_patterns = [re.compile(p, re.IGNORECASE) for p in [
+            r'\$\d+(\.\d{2})?',  # $10.99
+            r'₹\d+(\.\d{2})?',   # ₹100.50
+            r'\b\d+\s*dollars?\b',
+            r'\b\d+\s*rupees?\b',
+            r'\b(cheap|expensive|affordable|budget|premium|luxury)\b',
+            r'\b\$+\b'  # $ symbols
+        ]]
+
+        # Location and rating fallbacks
+        self._zip_re = re.compile(r'\b\d{5,6}\b')
+        self._coord_re = re.compile(r'-?\d+\.\d+')
+        self._star_re = re.compile(r'\b[1-5]\s*star')
+        self._out_of_ten_re = re.compile(r'\b[1-9]\.?\d*/10\b')
+        self._non_phone_re = re.compile(r'[^\d+]')
+        
+        # Keywords that rule out a business name
+        self._biz_exclude = frozenset(self.category_keywords) | {
+            'email', 'phone', 'address', 'location', 'review', 'rating',
+            'website', 'url', 'hours', 'price', 'cost'
+        }
         
         # Column name indicators (enhanced)
         self.column_name_indicators = {
@@ -178,125 +269,186 @@ class EnhancedColumnClassifier:
                 'weak': ['satisfaction']
             }
         }
+        
+        self._compile_column_patterns()
+
+    def _compile_column_patterns(self):
+        """Fuse each pattern and keyword list into one regex so a column is scanned once per list."""
+        self._phone_union = self._union(self.phone_patterns)
+        self._social_union = self._union(self.social_patterns, re.IGNORECASE)
+        self._business_name_union = self._union(self.business_name_patterns)
+        self._time_union = self._union(self.time_patterns, re.IGNORECASE)
+        self._price_union = self._union(self.price_patterns, re.IGNORECASE)
+        
+        # Keyword lists become tries, so each position is checked one character
+        # at a time instead of once per keyword
+        compile_keywords = ColumnClassifier._compile_keywords
+        self._location_keyword_re = compile_keywords(self.location_keywords)
+        self._category_keyword_re = compile_keywords(self.category_keywords)
+        self._biz_exclude_re = compile_keywords(self._biz_exclude)
+        self._review_re = re.compile('|'.join([
+            compile_keywords(self.review_indicators).pattern,
+            self._star_re.pattern,
+            self._out_of_ten_re.pattern
+        ]))
+        
+        # The heaviest category keyword in a value sets its weight. There is one
+        # alternative per weight, heaviest first, and each scans the whole value
+        # for any keyword of that weight.
+        tiers = {}
+        for keyword, weight in self.category_keywords.items():
+            tiers.setdefault(weight, []).append(keyword)
+        tier_order = sorted(tiers, reverse=True)
+        self._category_tier_re = re.compile(
+            '^(?:' + '|'.join(f'.*?({compile_keywords(tiers[weight]).pattern})' for weight in tier_order) + ')',
+            re.DOTALL
+        )
+        self._category_tier_weights = np.array(tier_order)
+        
+        # Column name indicators as one (indicator, category, weight) table, strongest tier first
+        tier_weights = {'strong': 0.9, 'medium': 0.6, 'weak': 0.3}
+        self._column_name_table = [
+            (indicator, category, tier_weights[tier])
+            for category, tiers in self.column_name_indicators.items()
+            for tier, indicators in tiers.items()
+            for indicator in indicators
+        ]
 
     def classify_columns(self, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
         """Enhanced column classification with improved accuracy."""
-        results = {}
+        columns = list(df.columns)
+        if len(columns) <= 1:
+            return {column: self._classify_one_column(column, df[column]) for column in columns}
+        
+        # Columns are independent; the regex and string work runs in a pool of threads
+        with ThreadPoolExecutor(max_workers=min(MAX_CLASSIFY_WORKERS, len(columns))) as executor:
+            classified = executor.map(lambda column: self._classify_one_column(column, df[column]), columns)
+            return dict(zip(columns, classified))
+
+    def _classify_one_column(self, column: str, series: pd.Series) -> Dict[str, Any]:
+        """Classify a single column."""
+        non_null_values = series.dropna()
+        
+        if len(non_null_values) == 0:
+            return self._create_empty_result(column, len(series))
+        
+        # Large columns are scored on a sample; counts and sample values still use every value
+        scored_values = non_null_values
+        if self.max_sample_size is not None and len(non_null_values) > self.max_sample_size:
+            scored_values = non_null_values.sample(n=self.max_sample_size, random_state=0)
+        
+        # Multi-factor analysis
+        column_name_score = self._analyze_column_name(column.lower())
+        
+        # A strongly named column skips the full analysis if nearly all of a few values agree
+        named_category, name_score = max(column_name_score.items(), key=lambda x: x[1])
+        if name_score >= self.NAME_MATCH_THRESHOLD:
+            check_values = non_null_values.iloc[
+                np.unique(np.linspace(0, len(non_null_values) - 1, self.NAME_CHECK_SIZE, dtype=int))
+            ]
+            check_score = self.categories[named_category](check_values)
+            if check_score >= self.NAME_CHECK_MIN_SCORE:
+                return self._create_name_match_result(column, series, non_null_values, named_category,
+                                                      column_name_score, check_score)
+        
+        # Text columns are converted to their distinct str values once and shared
+        # by every analysis. 'nan' strings never count, so they are dropped here too.
+        distinct = None
+        if scored_values.dtype == 'object':
+            str_series = scored_values.astype(str)
+            distinct = DistinctValues(str_series[str_series != 'nan'])
+        pattern_scores = self._analyze_patterns(scored_values, distinct)
+        content_scores = self._analyze_column_content(scored_values, distinct, pattern_scores)
+        statistical_scores = self._analyze_statistics(scored_values, distinct)
+        
+        # Combine scores with weights: one row per analysis, one column per category.
+        # Rows are added in order, matching a term-by-term weighted sum.
+        score_matrix = np.array([
+            [scores.get(category, 0) for category in self._cats]
+            for scores in (column_name_score, content_scores, pattern_scores, statistical_scores)
+        ], dtype=np.float64)
+        combined = (self.ANALYSIS_WEIGHTS[:, None] * score_matrix).sum(axis=0)
+        final_scores = dict(zip(self._cats, combined.tolist()))
+        
+        # Find best category with confidence threshold
+        best_index = int(np.argmax(combined))
+        best_score = final_scores[self._cats[best_index]]
+        
+        if best_score < 0.25:  # Lower threshold for better sensitivity
+            suggested_category = 'Unknown / Junk'
+            confidence = 0.0
+        else:
+            suggested_category = self._cats[best_index]
+            confidence = min(1.0, best_score)
+        
+        # Enhanced sample values
+        sample_values = self._get_enhanced_samples(non_null_values, suggested_category)
         
-        for column in df.columns:
-            non_null_values = df[column].dropna()
-            
-            if len(non_null_values) == 0:
-                results[column] = self._create_empty_result(column, len(df[column]))
-                continue
-            
-            # Multi-factor analysis
-            column_name_score = self._analyze_column_name(column.lower())
-            content_scores = self._analyze_column_content(non_null_values)
-            pattern_scores = self._analyze_patterns(non_null_values)
-            statistical_scores = self._analyze_statistics(non_null_values)
-            
-            # Combine scores with weights
-            final_scores = {}
-            for category in self.categories.keys():
-                if category != 'Unknown / Junk':
-                    final_scores[category] = (
-                        column_name_score.get(category, 0) * 0.4 +  # Column name is important
-                        content_scores.get(category, 0) * 0.3 +     # Content analysis
-                        pattern_scores.get(category, 0) * 0.2 +     # Pattern matching
-                        statistical_scores.get(category, 0) * 0.1   # Statistical features
-                    )
-            
-            # Find best category with confidence threshold
-            best_category = max(final_scores.items(), key=lambda x: x[1])
-            
-            if best_category[1] < 0.25:  # Lower threshold for better sensitivity
-                suggested_category = 'Unknown / Junk'
-                confidence = 0.0
-            else:
-                suggested_category = best_category[0]
-                confidence = min(1.0, best_category[1])
-            
-            # Enhanced sample values
-            sample_values = self._get_enhanced_samples(non_null_values, suggested_category)
-            
-            results[column] = {
-                'original_name': column,
-                'suggested_category': suggested_category,
-                'confidence': round(confidence, 3),
-                'sample_values': sample_values,
-                'total_values': len(df[column]),
-                'non_null_values': len(non_null_values),
-                'all_scores': {k: round(v, 3) for k, v in final_scores.items()},
-                'analysis_details': {
-                    'column_name_score': {k: round(v, 3) for k, v in column_name_score.items()},
-                    'content_score': {k: round(v, 3) for k, v in content_scores.items()},
-                    'pattern_score': {k: round(v, 3) for k, v in pattern_scores.items()},
-                    'statistical_score': {k: round(v, 3) for k, v in statistical_scores.items()}
-                }
+        return {
+            'original_name': column,
+            'suggested_category': suggested_category,
+            'confidence': round(confidence, 3),
+            'sample_values': sample_values,
+            'total_values': len(series),
+            'non_null_values': len(non_null_values),
+            'all_scores': {k: round(v, 3) for k, v in final_scores.items()},
+            'analysis_details': {
+                'column_name_score': {k: round(v, 3) for k, v in column_name_score.items()},
+                'content_score': {k: round(v, 3) for k, v in content_scores.items()},
+                'pattern_score': {k: round(v, 3) for k, v in pattern_scores.items()},
+                'statistical_score': {k: round(v, 3) for k, v in statistical_scores.items()}
             }
-        
-        return results
+        }
 
     def _analyze_column_name(self, column_name: str) -> Dict[str, float]:
         """Enhanced column name analysis."""
-        scores = {}
+        scores = dict.fromkeys(self.column_name_indicators, 0.0)
         
-        for category, indicators in self.column_name_indicators.items():
-            score = 0.0
-            
-            # Strong indicators
-            for indicator in indicators['strong']:
-                if indicator in column_name:
-                    score = max(score, 0.9)
-            
-            # Medium indicators
-            for indicator in indicators['medium']:
-                if indicator in column_name:
-                    score = max(score, 0.6)
-            
-            # Weak indicators
-            for indicator in indicators['weak']:
-                if indicator in column_name:
-                    score = max(score, 0.3)
-            
-            scores[category] = score
+        # Each category keeps its strongest matching indicator
+        for indicator, category, weight in self._column_name_table:
+            if weight > scores[category] and indicator in column_name:
+                scores[category] = weight
         
         return scores
 
-    def _analyze_column_content(self, series: pd.Series) -> Dict[str, float]:
+    def _analyze_column_content(self, series: pd.Series, distinct: Optional[DistinctValues] = None,
+                                pattern_scores: Optional[Dict[str, float]] = None) -> Dict[str, float]:
         """Analyze actual content of the column."""
         scores = {}
         
         for category, classifier_func in self.categories.items():
-            if category != 'Unknown / Junk':
-                scores[category] = classifier_func(series)
+            if category == 'Unknown / Junk':
+                continue
+            # On text columns these classifiers are their pattern scorers, so reuse the result
+            if pattern_scores is not None and series.dtype == 'object' and category in self.PATTERN_SCORED_CATEGORIES:
+                scores[category] = pattern_scores[category]
+            else:
+                scores[category] = classifier_func(series, distinct)
         
         return scores
 
-    def _analyze_patterns(self, series: pd.Series) -> Dict[str, float]:
+    def _analyze_patterns(self, series: pd.Series, distinct: Optional[DistinctValues] = None) -> Dict[str, float]:
         """Enhanced pattern analysis."""
         scores = {category: 0.0 for category in self.categories.keys() if category != 'Unknown / Junk'}
         
         if series.dtype != 'object':
             return scores
         
-        str_series = series.astype(str)
-        total_count = len(str_series)
+        distinct = self._distinct(series, distinct)
         
         for category in scores.keys():
             if category == 'Phone Number':
-                scores[category] = self._pattern_score_phone(str_series)
+                scores[category] = self._pattern_score_phone(distinct)
             elif category == 'Email':
-                scores[category] = self._pattern_score_email(str_series)
+                scores[category] = self._pattern_score_email(distinct)
             elif category == 'Social Links':
-                scores[category] = self._pattern_score_social(str_series)
+                scores[category] = self._pattern_score_social(distinct)
             elif category == 'Business Name':
-                scores[category] = self._pattern_score_business_name(str_series)
+                scores[category] = self._pattern_score_business_name(distinct)
         
         return scores
 
-    def _analyze_statistics(self, series: pd.Series) -> Dict[str, float]:
+    def _analyze_statistics(self, series: pd.Series, distinct: Optional[DistinctValues] = None) -> Dict[str, float]:
         """Statistical analysis of column data."""
         scores = {category: 0.0 for category in self.categories.keys() if category != 'Unknown / Junk'}
         
@@ -305,12 +457,13 @@ class EnhancedColumnClassifier:
         
         # Length statistics
         if series.dtype == 'object':
-            str_series = series.astype(str)
-            lengths = [len(str(x)) for x in str_series if str(x) != 'nan']
+            distinct = self._distinct(series, distinct)
+            rows = distinct.codes[distinct.counted[distinct.codes]]
+            lengths = distinct.values.str.len().to_numpy()[rows]
             
-            if lengths:
-                avg_length = np.mean(lengths)
-                std_length = np.std(lengths)
+            if len(lengths):
+                avg_length = lengths.mean()
+                std_length = lengths.std()
                 
                 # Phone numbers typically 10-15 characters
                 if 8 <= avg_length <= 16 and std_length < 5:
@@ -325,7 +478,7 @@ class EnhancedColumnClassifier:
                     scores['Business Name'] += 0.1
         
         # Uniqueness ratio
-        unique_ratio = len(series.unique()) / len(series)
+        unique_ratio = series.nunique(dropna=False) / len(series)
         
         # High uniqueness suggests names, emails, phones
         if unique_ratio > 0.8:
@@ -339,90 +492,127 @@ class EnhancedColumnClassifier:
         
         return scores
 
-    def _pattern_score_phone(self, str_series: pd.Series) -> float:
+    def _pattern_score_phone(self, distinct: DistinctValues) -> float:
         """Enhanced phone number pattern scoring."""
-        matches = 0
-        total_count = 0
-        
-        for value in str_series:
-            if pd.isna(value) or str(value) == 'nan':
-                continue
-                
-            total_count += 1
-            value_str = str(value).strip()
-            
-            # Enhanced phone validation
-            if self._is_valid_phone(value_str):
-                matches += 1
-        
-        return matches / total_count if total_count > 0 else 0.0
+        return self._score_unique(distinct, self._phone_mask)
+
+    def _phone_mask(self, distinct: DistinctValues) -> np.ndarray:
+        """Column-wide _is_valid_phone on the stripped values."""
+        stripped = distinct.stripped
+        
+        # Every phone format starts with '+', '(' or a digit
+        matches = stripped.str.startswith(self.PHONE_LEADING_CHARS).to_numpy(dtype=bool)
+        if matches.any():
+            matches[matches] = stripped[matches].str.match(self._phone_union).to_numpy(dtype=bool)
+        
+        # Only values in a phone format need their digits counted (7-15)
+        if matches.any():
+            digits = stripped[matches].str.count(r'\d').to_numpy()
+            matches[matches] = (digits >= 7) & (digits <= 15)
+        return matches
+
+    def _integer_phone_mask(self, series: pd.Series) -> np.ndarray:
+        """
+        _is_valid_phone for an integer column without building strings. A run
+        of 10-15 digits always fits the general phone format and anything else
+        fits none, while a leading '-' fits no format at all.
+        """
+        values = series.to_numpy()
+        return (values >= 10 ** 9) & (values < 10 ** 15)
 
-    def _pattern_score_email(self, str_series: pd.Series) -> float:
+    def _pattern_score_email(self, distinct: DistinctValues) -> float:
         """Enhanced email pattern scoring."""
-        matches = 0
-        total_count = 0
-        
-        for value in str_series:
-            if pd.isna(value) or str(value) == 'nan':
-                continue
-                
-            total_count += 1
-            value_str = str(value).strip().lower()
-            
-            if self._is_valid_email(value_str):
-                matches += 1
-        
-        return matches / total_count if total_count > 0 else 0.0
+        return self._score_unique(distinct, self._email_mask)
 
-    def _pattern_score_social(self, str_series: pd.Series) -> float:
+    def _email_mask(self, distinct: DistinctValues) -> np.ndarray:
+        """Column-wide _is_valid_email on the stripped, lowercased values."""
+        value_lower = distinct.lowered
+        
+        # Only values with an '@' can match; the pattern then pins exactly one
+        # '@' with a non-empty local part and domain
+        matches = value_lower.str.contains('@', regex=False).to_numpy(dtype=bool)
+        if matches.any():
+            matches[matches] = value_lower[matches].str.match(self.email_pattern).to_numpy(dtype=bool)
+        return matches
+
+    def _pattern_score_social(self, distinct: DistinctValues) -> float:
         """Social media/website pattern scoring."""
-        matches = 0
-        total_count = 0
-        
-        for value in str_series:
-            if pd.isna(value) or str(value) == 'nan':
-                continue
-                
-            total_count += 1
-            value_str = str(value).strip().lower()
-            
-            if any(re.search(pattern, value_str, re.IGNORECASE) for pattern in self.social_patterns):
-                matches += 1
-        
-        return matches / total_count if total_count > 0 else 0.0
+        return self._score_unique(distinct, self._social_mask)
+
+    def _social_mask(self, distinct: DistinctValues) -> np.ndarray:
+        """Values with a social media or website link."""
+        value_lower = distinct.lowered
+        
+        # Every social/website pattern needs a '.', so only dotted values are matched
+        matches = value_lower.str.contains('.', regex=False).to_numpy(dtype=bool)
+        if matches.any():
+            matches[matches] = value_lower[matches].str.contains(self._social_union).to_numpy(dtype=bool)
+        return matches
 
-    def _pattern_score_business_name(self, str_series: pd.Series) -> float:
+    def _pattern_score_business_name(self, distinct: DistinctValues) -> float:
         """Enhanced business name pattern scoring."""
-        matches = 0
-        total_count = 0
-        
-        for value in str_series:
-            if pd.isna(value) or str(value) == 'nan':
-                continue
-                
-            total_count += 1
-            value_str = str(value).strip()
-            
-            if self._is_likely_business_name(value_str):
-                matches += 1
-        
-        return matches / total_count if total_count > 0 else 0.0
+        return self._score_unique(distinct, lambda values: self._business_name_mask(values, values.stripped))
+
+    def _business_name_mask(self, distinct: DistinctValues, names: pd.Series) -> np.ndarray:
+        """
+        Column-wide _is_likely_business_name on `names` (the raw or stripped
+        values). Keywords never start or end with whitespace, so the exclusion
+        scan can use the shared stripped, lowercased form either way.
+        """
+        likely = ~distinct.lowered.str.contains(self._biz_exclude_re).to_numpy(dtype=bool)
+        # Values with an excluded keyword are out regardless of the name patterns
+        if likely.any():
+            likely[likely] = names[likely].str.contains(self._business_name_union).to_numpy(dtype=bool)
+        return likely
+
+    @staticmethod
+    def _distinct(series: pd.Series, distinct: Optional[DistinctValues] = None) -> DistinctValues:
+        """Distinct str values of a column, reusing `distinct` when the caller already has them."""
+        return distinct if distinct is not None else DistinctValues(series.astype(str))
+
+    def _score_unique(self, distinct: DistinctValues, scorer: Callable[[DistinctValues], Any]) -> float:
+        """
+        Score each distinct value once and weight it by how often it occurs.
+        `scorer` maps the distinct values to their scores.
+        """
+        scores = np.asarray(scorer(distinct), dtype=np.float64)
+        return self._average(scores[distinct.codes], distinct.counted[distinct.codes])
+
+    @staticmethod
+    def _average(scores: Any, counted: np.ndarray) -> float:
+        """
+        Average per-row scores over the counted rows. np.cumsum adds in row order,
+        so the total is exactly what a `matches += score` loop gives.
+        """
+        scores = np.asarray(scores, dtype=np.float64)[counted]
+        if len(scores) == 0:
+            return 0.0
+        return float(np.cumsum(scores)[-1] / len(scores))
+
+    @staticmethod
+    def _union(patterns: List[re.Pattern], flags: int = 0) -> re.Pattern:
+        """
+        Fuse a pattern list into one alternation that hits wherever any of them
+        does. Groups are made non-capturing since only the hit matters.
+        """
+        parts = [re.sub(r'(?<!\\)\((?!\?)', '(?:', pattern.pattern) for pattern in patterns]
+        return re.compile('|'.join(f'(?:{part})' for part in parts), flags)
 
     def _is_valid_phone(self, phone_str: str) -> bool:
         """Enhanced phone validation."""
         # Remove all non-digit characters except +
-        cleaned = re.sub(r'[^\d+]', '', phone_str)
+        cleaned = self._non_phone_re.sub('', phone_str)
         
         # Check length
         if not (7 <= len(cleaned.replace('+', '')) <= 15):
             return False
         
         # Check against patterns
-        return any(re.match(pattern, phone_str) for pattern in self.phone_patterns)
+        return self._phone_union.match(phone_str) is not None
 
     def _is_valid_email(self, email_str: str) -> bool:
         """Enhanced email validation."""
-        if not re.match(self.email_pattern, email_str):
+        if not self.email_pattern.match(email_str):
             return False
         
         # Additional validation
@@ -440,21 +630,20 @@ class EnhancedColumnClassifier:
         name_lower = name_str.lower()
         
         # Exclude obvious non-business names
-        exclude_keywords = set(self.category_keywords.keys()) | {
-            'email', 'phone', 'address', 'location', 'review', 'rating',
-            'website', 'url', 'hours', 'price', 'cost'
-        }
-        
-        if any(keyword in name_lower for keyword in exclude_keywords):
+        if self._biz_exclude_re.search(name_lower):
             return False
         
         # Check for business name patterns
-        return any(re.search(pattern, name_str) for pattern in self.business_name_patterns)
+        return self._business_name_union.search(name_str) is not None
 
     def _get_enhanced_samples(self, series: pd.Series, category: str) -> List[str]:
         """Get representative sample values."""
         samples = []
-        unique_values = series.unique()
+        # The first few distinct values nearly always show up early, so only
+        # hash the whole column when the leading rows don't have five
+        unique_values = series.iloc[:self.SAMPLE_SCAN_ROWS].unique()
+        if len(unique_values) < 5:
+            unique_values = series.unique()
         
         # Get diverse samples
         for i, value in enumerate(unique_values[:5]):
@@ -463,6 +652,27 @@ class EnhancedColumnClassifier:
         
         return samples
 
+    def _create_name_match_result(self, column: str, series: pd.Series, non_null_values: pd.Series,
+                                  category: str, column_name_score: Dict[str, float],
+                                  check_score: float) -> Dict[str, Any]:
+        """Create result for a column classified by its name."""
+        # Only the named category was checked against the content; every category reports its name score
+        scores = {category_name: column_name_score.get(category_name, 0.0) for category_name in self._cats}
+        return {
+            'original_name': column,
+            'suggested_category': category,
+            'confidence': round(scores[category], 3),
+            'sample_values': self._get_enhanced_samples(non_null_values, category),
+            'total_values': len(series),
+            'non_null_values': len(non_null_values),
+            'all_scores': {k: round(v, 3) for k, v in scores.items()},
+            'analysis_details': {
+                'column_name_score': {k: round(v, 3) for k, v in column_name_score.items()},
+                'content_score': {category: round(check_score, 3)},
+                'name_check_score': round(check_score, 3)
+            }
+        }
+
     def _create_empty_result(self, column: str, total_values: int) -> Dict[str, Any]:
         """Create result for empty columns."""
         return {
@@ -477,177 +687,95 @@ class EnhancedColumnClassifier:
         }
 
     # Include the original classification methods with enhancements
-    def _classify_business_name(self, series: pd.Series) -> float:
+    def _classify_business_name(self, series: pd.Series, distinct: Optional[DistinctValues] = None) -> float:
         """Enhanced business name classification."""
         if series.dtype != 'object':
             return 0.0
         
-        str_series = series.astype(str)
-        matches = 0
-        total_count = 0
-        
-        for value in str_series:
-            if pd.isna(value) or str(value) == 'nan':
-                continue
-                
-            total_count += 1
-            if self._is_likely_business_name(str(value)):
-                matches += 1
-        
-        return matches / total_count if total_count > 0 else 0.0
+        return self._score_unique(self._distinct(series, distinct), lambda values: self._business_name_mask(values, values.values))
 
-    def _classify_phone(self, series: pd.Series) -> float:
+    def _classify_phone(self, series: pd.Series, distinct: Optional[DistinctValues] = None) -> float:
         """Enhanced phone classification."""
-        return self._pattern_score_phone(series.astype(str) if series.dtype == 'object' else series)
+        # Other dtypes are scored on each value's str() form
+        if distinct is None:
+            if pd.api.types.is_integer_dtype(series.dtype):
+                return self._average(self._integer_phone_mask(series), np.ones(len(series), dtype=bool))
+            distinct = DistinctValues(series.astype(str) if series.dtype == 'object' else series.astype(object).map(str))
+        return self._pattern_score_phone(distinct)
 
-    def _classify_email(self, series: pd.Series) -> float:
+    def _classify_email(self, series: pd.Series, distinct: Optional[DistinctValues] = None) -> float:
         """Enhanced email classification."""
         if series.dtype != 'object':
             return 0.0
-        return self._pattern_score_email(series.astype(str))
+        return self._pattern_score_email(self._distinct(series, distinct))
 
-    def _classify_category(self, series: pd.Series) -> float:
+    def _classify_category(self, series: pd.Series, distinct: Optional[DistinctValues] = None) -> float:
         """Enhanced category classification."""
         if series.dtype != 'object':
             return 0.0
-        
-        str_series = series.astype(str)
-        matches = 0
-        total_count = 0
-        
-        for value in str_series:
-            if pd.isna(value) or str(value) == 'nan':
-                continue
-                
-            total_count += 1
-            value_lower = str(value).lower().strip()
-            
-            # Check against category keywords with weights
-            for keyword, weight in self.category_keywords.items():
-                if keyword in value_lower:
-                    matches += weight
-                    break
-        
-        return min(1.0, matches / total_count) if total_count > 0 else 0.0
+        return min(1.0, self._score_unique(self._distinct(series, distinct), self._category_weights))
 
-    def _classify_location(self, series: pd.Series) -> float:
+    def _category_weights(self, distinct: DistinctValues) -> np.ndarray:
+        """Weight of the heaviest category keyword found in each value."""
+        value_lower = distinct.lowered
+        hits = value_lower.str.contains(self._category_keyword_re).to_numpy(dtype=bool)
+        
+        # One group per weight; the first group that matched is the heaviest
+        weights = np.zeros(len(value_lower))
+        if hits.any():
+            found = value_lower[hits].str.extract(self._category_tier_re).notna().to_numpy()
+            weights[hits] = self._category_tier_weights[found.argmax(axis=1)]
+        return weights
+
+    def _classify_location(self, series: pd.Series, distinct: Optional[DistinctValues] = None) -> float:
         """Enhanced location classification."""
         if series.dtype != 'object':
             return 0.0
-        
-        str_series = series.astype(str)
-        matches = 0
-        total_count = 0
-        
-        for value in str_series:
-            if pd.isna(value) or str(value) == 'nan':
-                continue
-                
-            total_count += 1
-            value_lower = str(value).lower().strip()
-            
-            # Address patterns
-            if any(keyword in value_lower for keyword in self.location_keywords):
-                matches += 1
-            # ZIP/Postal code patterns
-            elif re.search(r'\b\d{5,6}\b', value_lower):
-                matches += 0.8
-            # Coordinate patterns
-            elif re.search(r'-?\d+\.\d+', value_lower):
-                matches += 0.7
-        
-        return matches / total_count if total_count > 0 else 0.0
-
-    def _classify_social_links(self, series: pd.Series) -> float:
+        return self._score_unique(self._distinct(series, distinct), self._location_scores)
+
+    def _location_scores(self, distinct: DistinctValues) -> np.ndarray:
+        """Address keywords score 1, else ZIP/postal codes 0.8, else coordinates 0.7."""
+        value_lower = distinct.lowered
+        return np.select(
+            [value_lower.str.contains(pattern).to_numpy(dtype=bool)
+             for pattern in (self._location_keyword_re, self._zip_re, self._coord_re)],
+            [1.0, 0.8, 0.7],
+            0.0
+        )
+
+    def _classify_social_links(self, series: pd.Series, distinct: Optional[DistinctValues] = None) -> float:
         """Enhanced social links classification."""
         if series.dtype != 'object':
             return 0.0
-        return self._pattern_score_social(series.astype(str))
+        return self._pattern_score_social(self._distinct(series, distinct))
 
-    def _classify_review(self, series: pd.Series) -> float:
+    def _classify_review(self, series: pd.Series, distinct: Optional[DistinctValues] = None) -> float:
         """Enhanced review classification."""
         if series.dtype != 'object':
             return 0.0
-        
-        str_series = series.astype(str)
-        matches = 0
-        total_count = 0
-        
-        review_indicators = [
-            'good', 'bad', 'excellent', 'poor', 'great', 'terrible',
-            'recommend', 'satisfied', 'disappointed', 'amazing',
-            'awful', 'fantastic', 'horrible', 'wonderful', 'disgusting',
-            'stars', 'rating', 'review', 'feedback', 'comment'
-        ]
-        
-        for value in str_series:
-            if pd.isna(value) or str(value) == 'nan':
-                continue
-                
-            total_count += 1
-            value_lower = str(value).lower().strip()
-            
-            # Check for review indicators
-            if any(indicator in value_lower for indicator in review_indicators):
-                matches += 1
-            # Check for rating patterns (1-5 stars, 1-10 ratings)
-            elif re.search(r'\b[1-5]\s*star', value_lower) or re.search(r'\b[1-9]\.?\d*/10\b', value_lower):
-                matches += 1
-        
-        return matches / total_count if total_count > 0 else 0.0
+        return self._score_unique(self._distinct(series, distinct), self._review_mask)
 
-    def _classify_hours(self, series: pd.Series) -> float:
+    def _review_mask(self, distinct: DistinctValues) -> np.ndarray:
+        """Values with review indicators or rating patterns (1-5 stars, 1-10 ratings)."""
+        matches = distinct.lowered.str.contains(self._review_re)
+        return matches.to_numpy(dtype=bool)
+
+    def _classify_hours(self, series: pd.Series, distinct: Optional[DistinctValues] = None) -> float:
         """Enhanced hours classification."""
         if series.dtype != 'object':
             return 0.0
-        
-        str_series = series.astype(str)
-        matches = 0
-        total_count = 0
-        
-        time_patterns = [
-            r'\b\d{1,2}:\d{2}\s*(AM|PM|am|pm)\b',  # 9:00 AM
-            r'\b\d{1,2}(:\d{2})?\s*(AM|PM|am|pm)\s*-\s*\d{1,2}(:\d{2})?\s*(AM|PM|am|pm)\b',  # 9 AM - 5 PM
-            r'\b(Mon|Tue|Wed|Thu|Fri|Sat|Sun|Monday|Tuesday|Wednesday|Thursday|Friday|Saturday|Sunday)\b',
-            r'\b(Open|Closed|24/7|24 hours)\b',
-            r'\b\d{1,2}-\d{1,2}\b'  # 9-5
-        ]
-        
-        for value in str_series:
-            if pd.isna(value) or str(value) == 'nan':
-                continue
-                
-            total_count += 1
-            value_str = str(value).strip()
-            
-            if any(re.search(pattern, value_str, re.IGNORECASE) for pattern in time_patterns):
-                matches += 1
-        
-        return matches / total_count if total_count > 0 else 0.0
+        return self._score_unique(self._distinct(series, distinct), self._hours_mask)
+
+    def _hours_mask(self, distinct: DistinctValues) -> np.ndarray:
+        """Values with a time, weekday or open/closed marker."""
+        matches = distinct.stripped.str.contains(self._time_union)
+        return matches.to_numpy(dtype=bool)
 
-    def _classify_price(self, series: pd.Series) -> float:
+    def _classify_price(self, series: pd.Series, distinct: Optional[DistinctValues] = None) -> float:
         """Enhanced price classification."""
-        str_series = series.astype(str)
-        matches = 0
-        total_count = 0
-        
-        price_patterns = [
-            r'\$\d+(\.\d{2})?',  # $10.99
-            r'₹\d+(\.\d{2})?',   # ₹100.50
-            r'\b\d+\s*dollars?\b',
-            r'\b\d+\s*rupees?\b',
-            r'\b(cheap|expensive|affordable|budget|premium|luxury)\b',
-            r'\b\$+\b'  # $ symbols
-        ]
-        
-        for value in str_series:
-            if pd.isna(value) or str(value) == 'nan':
-                continue
-                
-            total_count += 1
-            value_lower = str(value).lower().strip()
-            
-            if any(re.search(pattern, value_lower, re.IGNORECASE) for pattern in price_patterns):
-                matches += 1
-        
-        return matches / total_count if total_count > 0 else 0.0
+        return self._score_unique(self._distinct(series, distinct), self._price_mask)
+
+    def _price_mask(self, distinct: DistinctValues) -> np.ndarray:
+        """Values with a price amount or price word."""
+        matches = distinct.lowered.str.contains(self._price_union)
+        return matches.to_numpy(dtype=bool)
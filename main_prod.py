@@ -1,16 +1,80 @@
 import os
 from fastapi import FastAPI, File, UploadFile, HTTPException, Form
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 import pandas as pd
+import asyncio
 import json
 import tempfile
-from typing import List, Dict, Any
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel
 import uuid
 from column_classifier import ColumnClassifier
 
-app = FastAPI(title="Data Cleaner API", version="1.0.0")
+try:
+    import pyarrow
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+try:
+    import orjson  # noqa: F401
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xlsxwriter  # noqa: F401
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+# Dtype for text columns of session DataFrames once they are classified
+TEXT_COLUMN_DTYPE = 'string[pyarrow]'
+
+# Sessions untouched for SESSION_TTL_SECONDS are removed by a background sweeper
+SESSION_TTL_SECONDS = 30 * 60
+SESSION_SWEEP_INTERVAL_SECONDS = 60
+
+async def sweep_sessions():
+    """Periodically remove sessions that have not been used within the TTL."""
+    while True:
+        await asyncio.sleep(SESSION_SWEEP_INTERVAL_SECONDS)
+        expired_before = time.monotonic() - SESSION_TTL_SECONDS
+        expired = [session_id for session_id, session_data in sessions.items()
+                   if session_data.last_access < expired_before]
+        for session_id in expired:
+            remove_session(session_id)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    sweeper = asyncio.create_task(sweep_sessions())
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+        # Temporary files do not outlive the server
+        for session_id in list(sessions):
+            remove_session(session_id)
+
+# orjson serializes the preview and classification payloads much faster than json
+app = FastAPI(
+    title="Data Cleaner API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+)
 
 # Configure CORS for production
 allowed_origins = [
@@ -33,10 +97,124 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@dataclass(slots=True)
+class Session:
+    """State kept for one upload; its DataFrame is in loaded_dataframes or dataframe_file."""
+    filename: str
+    column_analysis: Dict[str, Dict[str, Any]]
+    last_access: float
+    dataframe_file: Optional[str] = None
+    output_file: Optional[str] = None
+    output_filename: Optional[str] = None
+
 # Global variables to store session data
-sessions = {}
+sessions: Dict[str, Session] = {}
+
+# Parsed uploads held in memory, least recently used first. Beyond
+# MAX_LOADED_SESSIONS the oldest are spilled to disk and reloaded on use.
+MAX_LOADED_SESSIONS = 32
+loaded_dataframes = OrderedDict()
 classifier = ColumnClassifier()
 
+# Parsing and classification block, so uploads run on these threads instead of the event loop
+upload_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+def read_csv_file(source: BinaryIO) -> pd.DataFrame:
+    """Read a binary CSV file object.
+
+    pandas' parser is used even when pyarrow is installed: pyarrow keeps
+    duplicate column names and turns timestamps into datetimes, and reading
+    every column as text and converting in pandas measured no faster.
+    """
+    return pd.read_csv(source, encoding='utf-8')
+
+def read_excel_file(source: BinaryIO) -> pd.DataFrame:
+    """Read a binary Excel file object, using the calamine engine when it is installed."""
+    if CALAMINE_AVAILABLE:
+        try:
+            return pd.read_excel(source, engine='calamine')
+        except Exception:
+            # pandas before 2.2 has no calamine engine; the default engine also reports bad files
+            source.seek(0)
+    return pd.read_excel(source)
+
+def compact_text_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Store all-text object columns as Arrow-backed strings, which take far less memory than Python objects."""
+    if not PYARROW_AVAILABLE:
+        return df
+    # Mixed columns keep their object dtype so numbers and dates are still written as such
+    text_columns = [name for name, column in df.items()
+                    if column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) == 'string']
+    if not text_columns:
+        return df
+    return df.astype(dict.fromkeys(text_columns, TEXT_COLUMN_DTYPE))
+
+def parse_and_classify(source: BinaryIO, filename: str) -> Tuple[pd.DataFrame, Dict[str, Dict[str, Any]], List[Dict[str, Any]]]:
+    """Parse an upload and classify its columns; returns the DataFrame, column analysis and preview."""
+    # Parse the spooled upload in place: small uploads are in memory, large ones
+    # already on disk, so the body is never copied into one bytes object
+    source.seek(0)
+    if filename.lower().endswith('.csv'):
+        df = read_csv_file(source)
+    else:
+        df = read_excel_file(source)
+    
+    # Validate dataframe
+    if df.empty:
+        raise HTTPException(status_code=400, detail="File is empty")
+    
+    if len(df.columns) == 0:
+        raise HTTPException(status_code=400, detail="No columns found in file")
+    
+    # Classify columns
+    column_analysis = classifier.classify_columns(df)
+    
+    # Create preview data (first 10 rows)
+    preview_data = dataframe_preview(df)
+    
+    # The classifiers work on object columns, so the compact dtype is only used for the stored copy
+    return compact_text_columns(df), column_analysis, preview_data
+
+def touch_session(session_id: str) -> None:
+    """Record that a session was just used, postponing its expiry."""
+    sessions[session_id].last_access = time.monotonic()
+
+def remove_session(session_id: str) -> None:
+    """Remove a session with its temporary files."""
+    session_data = sessions.pop(session_id)
+    loaded_dataframes.pop(session_id, None)
+    for file_path in (session_data.output_file, session_data.dataframe_file):
+        if file_path and os.path.exists(file_path):
+            os.unlink(file_path)
+
+def cache_session_dataframe(session_id: str, df: pd.DataFrame) -> None:
+    """Keep a session's DataFrame in memory, spilling the least recently used ones to disk."""
+    loaded_dataframes[session_id] = df
+    loaded_dataframes.move_to_end(session_id)
+    while len(loaded_dataframes) > MAX_LOADED_SESSIONS:
+        evicted_id, evicted_df = loaded_dataframes.popitem(last=False)
+        session_data = sessions.get(evicted_id)
+        # Session DataFrames are never modified, so a spilled copy stays valid
+        if session_data is not None and session_data.dataframe_file is None:
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.pkl') as tmp_file:
+                evicted_df.to_pickle(tmp_file)
+            session_data.dataframe_file = tmp_file.name
+
+def get_session_dataframe(session_id: str) -> pd.DataFrame:
+    """Return a session's DataFrame, reloading it from disk if it was spilled."""
+    if session_id in loaded_dataframes:
+        loaded_dataframes.move_to_end(session_id)
+        return loaded_dataframes[session_id]
+    df = pd.read_pickle(sessions[session_id].dataframe_file)
+    cache_session_dataframe(session_id, df)
+    return df
+
+def dataframe_preview(df: pd.DataFrame, rows: int = 10) -> List[Dict[str, Any]]:
+    """Convert the first rows to records of str values, with None for missing values."""
+    preview_df = df.head(rows)
+    values = preview_df.astype(object).apply(lambda column: column.map(str))
+    return values.where(preview_df.notna(), None).to_dict(orient='records')
+
 class ColumnSelection(BaseModel):
     session_id: str
     selected_columns: List[str]
@@ -75,53 +253,19 @@ async def upload_file(file: UploadFile = File(...)):
     session_id = str(uuid.uuid4())
     
     try:
-        # Read file content
-        content = await file.read()
-        
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp_file:
-            tmp_file.write(content)
-            tmp_file_path = tmp_file.name
-        
-        # Read data based on file type
-        if file.filename.lower().endswith('.csv'):
-            df = pd.read_csv(tmp_file_path, encoding='utf-8')
-        else:
-            df = pd.read_excel(tmp_file_path)
-        
-        # Clean up temporary file
-        os.unlink(tmp_file_path)
-        
-        # Validate dataframe
-        if df.empty:
-            raise HTTPException(status_code=400, detail="File is empty")
-        
-        if len(df.columns) == 0:
-            raise HTTPException(status_code=400, detail="No columns found in file")
-        
-        # Classify columns
-        column_analysis = classifier.classify_columns(df)
-        
-        # Create preview data (first 10 rows)
-        preview_df = df.head(10)
-        preview_data = []
-        
-        for _, row in preview_df.iterrows():
-            row_dict = {}
-            for col in df.columns:
-                value = row[col]
-                if pd.isna(value):
-                    row_dict[col] = None
-                else:
-                    row_dict[col] = str(value)
-            preview_data.append(row_dict)
+        # Parse and classify off the event loop so other requests keep being served
+        loop = asyncio.get_running_loop()
+        df, column_analysis, preview_data = await loop.run_in_executor(
+            upload_executor, parse_and_classify, file.file, file.filename
+        )
         
         # Store session data
-        sessions[session_id] = {
-            'dataframe': df,
-            'filename': file.filename,
-            'column_analysis': column_analysis
-        }
+        sessions[session_id] = Session(
+            filename=file.filename,
+            column_analysis=column_analysis,
+            last_access=time.monotonic()
+        )
+        cache_session_dataframe(session_id, df)
         
         return AnalysisResult(
             session_id=session_id,
@@ -147,9 +291,10 @@ async def process_columns(selection: ColumnSelection):
     if selection.session_id not in sessions:
         raise HTTPException(status_code=404, detail="Session not found")
     
+    touch_session(selection.session_id)
     session_data = sessions[selection.session_id]
-    df = session_data['dataframe']
-    original_filename = session_data['filename']
+    df = get_session_dataframe(selection.session_id)
+    original_filename = session_data.filename
     
     if not selection.selected_columns:
         raise HTTPException(status_code=400, detail="No columns selected")
@@ -163,22 +308,11 @@ async def process_columns(selection: ColumnSelection):
         )
     
     try:
-        # Filter dataframe to selected columns
-        filtered_df = df[selection.selected_columns].copy()
+        # Filter dataframe to selected columns; it is only read from, so no extra copy is made
+        filtered_df = df[selection.selected_columns]
         
         # Create preview data (first 10 rows of filtered data)
-        preview_df = filtered_df.head(10)
-        preview_data = []
-        
-        for _, row in preview_df.iterrows():
-            row_dict = {}
-            for col in selection.selected_columns:
-                value = row[col]
-                if pd.isna(value):
-                    row_dict[col] = None
-                else:
-                    row_dict[col] = str(value)
-            preview_data.append(row_dict)
+        preview_data = dataframe_preview(filtered_df)
         
         # Generate output filename
         base_name = os.path.splitext(original_filename)[0]
@@ -187,15 +321,21 @@ async def process_columns(selection: ColumnSelection):
         # Create temporary output file
         with tempfile.NamedTemporaryFile(delete=False, suffix=f".{selection.output_format}") as tmp_file:
             if selection.output_format == "csv":
-                filtered_df.to_csv(tmp_file.name, index=False)
+                filtered_df.to_csv(tmp_file.name, index=False, chunksize=10000)
             else:  # xlsx
-                filtered_df.to_excel(tmp_file.name, index=False)
+                # xlsxwriter writes faster than openpyxl. Its constant_memory mode is not
+                # used: pandas writes cells column by column, which that mode would drop.
+                excel_engine = 'xlsxwriter' if XLSXWRITER_AVAILABLE else None
+                filtered_df.to_excel(tmp_file.name, index=False, engine=excel_engine)
             
             output_file_path = tmp_file.name
         
-        # Store output file path in session for download
-        sessions[selection.session_id]['output_file'] = output_file_path
-        sessions[selection.session_id]['output_filename'] = output_filename
+        # Store output file path in session for download, replacing any earlier output
+        previous_output = session_data.output_file
+        if previous_output and os.path.exists(previous_output):
+            os.unlink(previous_output)
+        session_data.output_file = output_file_path
+        session_data.output_filename = output_filename
         
         return {
             "session_id": selection.session_id,
@@ -219,13 +359,14 @@ async def download_file(session_id: str):
     if session_id not in sessions:
         raise HTTPException(status_code=404, detail="Session not found")
     
+    touch_session(session_id)
     session_data = sessions[session_id]
     
-    if 'output_file' not in session_data:
+    if session_data.output_file is None:
         raise HTTPException(status_code=404, detail="No processed file available")
     
-    output_file_path = session_data['output_file']
-    output_filename = session_data['output_filename']
+    output_file_path = session_data.output_file
+    output_filename = session_data.output_filename
     
     if not os.path.exists(output_file_path):
         raise HTTPException(status_code=404, detail="File not found")
@@ -245,14 +386,8 @@ async def cleanup_session(session_id: str):
     if session_id not in sessions:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    session_data = sessions[session_id]
-    
-    # Clean up temporary output file if it exists
-    if 'output_file' in session_data and os.path.exists(session_data['output_file']):
-        os.unlink(session_data['output_file'])
-    
-    # Remove session data
-    del sessions[session_id]
+    # Remove session data with its temporary output and spilled DataFrame files
+    remove_session(session_id)
     
     return {"message": "Session cleaned up successfully"}
 
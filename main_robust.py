@@ -1,12 +1,22 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
+import asyncio
 import csv
+import functools
 import io
+import itertools
 import re
 import uuid
 import os
-from typing import List, Dict, Any
+import pickle
+import tempfile
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import BinaryIO, Iterator, List, Dict, Any, Tuple
+from urllib.parse import quote
 
 # Try to import pandas and enhanced classifier
 try:
@@ -25,6 +35,28 @@ except ImportError:
     EXCEL_SUPPORT = False
     print("⚠️ Excel support not available")
 
+try:
+    import python_calamine  # noqa: F401
+    CALAMINE_AVAILABLE = True
+    print("✅ Calamine Excel reader available")
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
+try:
+    import orjson  # noqa: F401
+    ORJSON_AVAILABLE = True
+    print("✅ orjson responses available")
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+    print("✅ PyArrow CSV parser available")
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 try:
     if PANDAS_AVAILABLE:
         from enhanced_column_classifier import EnhancedColumnClassifier
@@ -55,7 +87,38 @@ except ImportError:
     BASIC_CLASSIFIER_AVAILABLE = False
     print("⚠️ Basic classifier not available")
 
-app = FastAPI(title="Data Cleaner API", version="1.0.0")
+# Sessions untouched for SESSION_TTL_SECONDS are removed by a background sweeper
+SESSION_TTL_SECONDS = 30 * 60
+SESSION_SWEEP_INTERVAL_SECONDS = 60
+
+async def sweep_sessions():
+    """Periodically remove sessions that have not been used within the TTL"""
+    while True:
+        await asyncio.sleep(SESSION_SWEEP_INTERVAL_SECONDS)
+        expired_before = time.monotonic() - SESSION_TTL_SECONDS
+        expired = [session_id for session_id, session_data in sessions.items()
+                   if session_data['last_access'] < expired_before]
+        for session_id in expired:
+            remove_session(session_id)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    sweeper = asyncio.create_task(sweep_sessions())
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+        # Spilled session files do not outlive the server
+        for session_id in list(sessions):
+            remove_session(session_id)
+
+# orjson serializes the preview and classification payloads much faster than json
+app = FastAPI(
+    title="Data Cleaner API",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+)
 
 # CORS configuration
 app.add_middleware(
@@ -69,6 +132,11 @@ app.add_middleware(
 # Simple in-memory storage for sessions
 sessions = {}
 
+# Parsed upload data held in memory, least recently used first. Beyond
+# MAX_LOADED_SESSIONS the oldest are spilled to disk and reloaded on use.
+MAX_LOADED_SESSIONS = 32
+loaded_data = OrderedDict()
+
 # Initialize the column classifier
 classifier = None
 classifier_type = "none"
@@ -115,45 +183,136 @@ NO_LIMITS = {
     "daily_uploads": 1000,    # 1000 uploads per day
 }
 
+def read_excel_file(source: BinaryIO, nrows: int = None) -> "pd.DataFrame":
+    """Read the first sheet of a binary Excel file object with pandas, using the calamine engine when available"""
+    # Only the first sheet is used, and parsing stops after nrows data rows
+    if CALAMINE_AVAILABLE:
+        try:
+            return pd.read_excel(source, sheet_name=0, nrows=nrows, engine='calamine')
+        except Exception:
+            # pandas before 2.2 has no calamine engine; the default engine also reports bad files
+            source.seek(0)
+    return pd.read_excel(source, sheet_name=0, nrows=nrows)
+
+# Enhanced simple patterns
+PHONE_PATTERNS = [
+    r'\b\d{10}\b',  # 1234567890
+    r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b',  # 123-456-7890
+    r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}',  # (123) 456-7890
+    r'\+?1[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # +1-123-456-7890
+]
+
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+
+WEBSITE_PATTERNS = [
+    r'https?://[^\s]+',
+    r'www\.[^\s]+',
+    r'[a-zA-Z0-9.-]+\.(com|org|net|edu|gov|co\.uk|co\.in)\b'
+]
+
+BUSINESS_KEYWORDS = [
+    'restaurant', 'cafe', 'store', 'shop', 'market', 'hotel', 'motel',
+    'hospital', 'clinic', 'pharmacy', 'bank', 'school', 'gym', 'spa',
+    'salon', 'bar', 'pub', 'office', 'company', 'corp', 'inc', 'llc',
+    'pizza', 'bakery', 'auto', 'repair', 'service', 'center'
+]
+
+LOCATION_KEYWORDS = [
+    'street', 'road', 'avenue', 'drive', 'lane', 'boulevard',
+    'address', 'city', 'state', 'zip', 'postal', 'main st',
+    'north', 'south', 'east', 'west', 'ave', 'blvd', 'dr'
+]
+
+# Upper bound on threads classifying columns concurrently
+MAX_CLASSIFY_WORKERS = 8
+
+# Distinct (sample, column name) classifications remembered across uploads
+CLASSIFY_CACHE_SIZE = 4096
+
+# Rows written per chunk of a streamed CSV download
+CSV_CHUNK_ROWS = 1000
+
+# Each list is fused into one precompiled alternation, so a value is scanned once per category.
+# Keywords match anywhere in the value, like a substring test.
+PHONE_RE = re.compile('|'.join(f'(?:{p})' for p in PHONE_PATTERNS))
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+WEBSITE_RE = re.compile('|'.join(f'(?:{p})' for p in WEBSITE_PATTERNS))
+BUSINESS_RE = re.compile('|'.join(map(re.escape, BUSINESS_KEYWORDS)))
+LOCATION_RE = re.compile('|'.join(map(re.escape, LOCATION_KEYWORDS)))
+
+def rows_to_columns(rows: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Transpose row dicts into one list per column, keyed by the first row's columns"""
+    if not rows:
+        return {}
+    return {col: [row.get(col, '') for row in rows] for col in rows[0]}
+
+def columns_to_rows(column_data: Dict[str, List[Any]], limit: int = None) -> List[Dict[str, Any]]:
+    """Rebuild row dicts from column lists, e.g. for a preview"""
+    names = list(column_data)
+    rows = itertools.islice(zip(*column_data.values()), limit)
+    return [dict(zip(names, row)) for row in rows]
+
+def count_rows(column_data: Dict[str, List[Any]]) -> int:
+    """Number of rows in column lists"""
+    return len(next(iter(column_data.values()))) if column_data else 0
+
+def parse_csv_columns(source: BinaryIO, nrows: int = None) -> Dict[str, List[Any]]:
+    """Parse a binary CSV file object into one list of values per column, using pyarrow's parser when available
+
+    Parsing stops after nrows data rows when a bound is given
+    """
+    if PYARROW_AVAILABLE:
+        try:
+            # Every column is read as text so values match what csv.DictReader produces
+            header = next(csv.reader([source.readline().decode('utf-8-sig')]))
+            source.seek(0)
+            reader = pa_csv.open_csv(
+                source,
+                parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                convert_options=pa_csv.ConvertOptions(column_types={name: pa.string() for name in header})
+            )
+            # A quoted header spanning several lines is not all in the first line, so some
+            # columns would have inferred types; such files are left to the csv module
+            if any(field.type != pa.string() for field in reader.schema):
+                raise ValueError("header does not match the first line")
+            batches = []
+            parsed_rows = 0
+            for batch in reader:
+                batches.append(batch)
+                parsed_rows += batch.num_rows
+                if nrows is not None and parsed_rows >= nrows:
+                    break
+            table = pa.Table.from_batches(batches, schema=reader.schema)
+            if nrows is not None:
+                table = table.slice(0, nrows)
+            return {name: column.to_pylist() for name, column in zip(table.column_names, table.columns)}
+        except Exception:
+            # Ragged or unusual files are left to the csv module
+            source.seek(0)
+    text = io.TextIOWrapper(source, encoding='utf-8', newline='')
+    try:
+        return rows_to_columns(list(itertools.islice(csv.DictReader(text), nrows)))
+    finally:
+        # Leave the file open for its owner
+        text.detach()
+
 def classify_column_simple(data: List[str], column_name: str) -> Dict[str, Any]:
     """Simple column classification without external dependencies"""
     if not data:
         return {"type": "Unknown / Junk", "confidence": 0.0}
     
-    # Remove empty/null values
-    clean_data = [str(item).strip() for item in data if item and str(item).strip()]
-    if not clean_data:
+    # Remove empty/null values; only the first 50 are ever scored
+    stripped = (str(item).strip() for item in data if item)
+    sample_data = tuple(itertools.islice((item for item in stripped if item), 50))
+    if not sample_data:
         return {"type": "Unknown / Junk", "confidence": 0.0}
     
-    # Enhanced simple patterns
-    phone_patterns = [
-        r'\b\d{10}\b',  # 1234567890
-        r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b',  # 123-456-7890
-        r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}',  # (123) 456-7890
-        r'\+?1[-.\s]?\d{3}[-.\s]?\d{3}[-.\s]?\d{4}',  # +1-123-456-7890
-    ]
-    
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    
-    website_patterns = [
-        r'https?://[^\s]+',
-        r'www\.[^\s]+',
-        r'[a-zA-Z0-9.-]+\.(com|org|net|edu|gov|co\.uk|co\.in)\b'
-    ]
-    
-    business_keywords = [
-        'restaurant', 'cafe', 'store', 'shop', 'market', 'hotel', 'motel',
-        'hospital', 'clinic', 'pharmacy', 'bank', 'school', 'gym', 'spa',
-        'salon', 'bar', 'pub', 'office', 'company', 'corp', 'inc', 'llc',
-        'pizza', 'bakery', 'auto', 'repair', 'service', 'center'
-    ]
-    
-    location_keywords = [
-        'street', 'road', 'avenue', 'drive', 'lane', 'boulevard',
-        'address', 'city', 'state', 'zip', 'postal', 'main st',
-        'north', 'south', 'east', 'west', 'ave', 'blvd', 'dr'
-    ]
-    
+    # The result depends only on the sample and the name, so repeated columns are classified once
+    return dict(classify_sample(sample_data, column_name))
+
+@functools.lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def classify_sample(sample_data: Tuple[str, ...], column_name: str) -> Dict[str, Any]:
+    """Classify a column from its first non-empty values and its name"""
     # Count matches
     phone_matches = 0
     email_matches = 0
@@ -161,31 +320,34 @@ def classify_column_simple(data: List[str], column_name: str) -> Dict[str, Any]:
     business_matches = 0
     location_matches = 0
     
-    sample_size = min(50, len(clean_data))
-    sample_data = clean_data[:sample_size]
+    sample_size = len(sample_data)
     
-    for item in sample_data:
-        item_lower = item.lower()
-        
+    # Repeated values are matched once and counted by multiplicity
+    for item, count in Counter(sample_data).items():
         # Phone patterns
-        if any(re.search(pattern, item) for pattern in phone_patterns):
-            phone_matches += 1
+        if PHONE_RE.search(item):
+            phone_matches += count
+            continue
         
         # Email
-        elif re.search(email_pattern, item):
-            email_matches += 1
+        if EMAIL_RE.search(item):
+            email_matches += count
+            continue
+        
+        # The remaining checks are case-insensitive
+        item_lower = item.lower()
         
         # Website/Social
-        elif any(re.search(pattern, item_lower) for pattern in website_patterns):
-            website_matches += 1
+        if WEBSITE_RE.search(item_lower):
+            website_matches += count
         
         # Business categories
-        elif any(keyword in item_lower for keyword in business_keywords):
-            business_matches += 1
+        elif BUSINESS_RE.search(item_lower):
+            business_matches += count
         
         # Location
-        elif any(keyword in item_lower for keyword in location_keywords):
-            location_matches += 1
+        elif LOCATION_RE.search(item_lower):
+            location_matches += count
     
     # Calculate percentages
     phone_pct = phone_matches / sample_size
@@ -219,6 +381,72 @@ def classify_column_simple(data: List[str], column_name: str) -> Dict[str, Any]:
     else:
         return {"type": "Unknown / Junk", "confidence": 0.3}
 
+def touch_session(session_id: str) -> None:
+    """Record that a session was just used, postponing its expiry"""
+    sessions[session_id]['last_access'] = time.monotonic()
+
+def remove_session(session_id: str) -> None:
+    """Remove a session with its spilled data file"""
+    session_data = sessions.pop(session_id)
+    loaded_data.pop(session_id, None)
+    if 'data_file' in session_data and os.path.exists(session_data['data_file']):
+        os.unlink(session_data['data_file'])
+
+def cache_session_data(session_id: str, column_data: Dict[str, List[Any]]) -> None:
+    """Keep a session's column data in memory, spilling the least recently used to disk"""
+    loaded_data[session_id] = column_data
+    loaded_data.move_to_end(session_id)
+    while len(loaded_data) > MAX_LOADED_SESSIONS:
+        evicted_id, evicted_data = loaded_data.popitem(last=False)
+        session_data = sessions.get(evicted_id)
+        # Uploaded data is never modified, so a spilled copy stays valid
+        if session_data is not None and 'data_file' not in session_data:
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.pkl') as tmp_file:
+                pickle.dump(evicted_data, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            session_data['data_file'] = tmp_file.name
+
+def get_session_data(session_id: str) -> Dict[str, List[Any]]:
+    """Return a session's column data, reloading it from disk if it was spilled"""
+    if session_id in loaded_data:
+        loaded_data.move_to_end(session_id)
+        return loaded_data[session_id]
+    with open(sessions[session_id]['data_file'], 'rb') as data_file:
+        column_data = pickle.load(data_file)
+    cache_session_data(session_id, column_data)
+    return column_data
+
+def select_columns(column_data: Dict[str, List[Any]], column_headers: Dict[str, str], row_count: int) -> Dict[str, List[Any]]:
+    """Selected columns under their new headers; unknown columns are blank"""
+    return {
+        new_header: column_data.get(original_col, [''] * row_count)
+        for original_col, new_header in column_headers.items()
+    }
+
+def iter_csv(column_data: Dict[str, List[Any]]) -> Iterator[str]:
+    """Yield CSV text for column lists, CSV_CHUNK_ROWS rows at a time"""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(column_data.keys())
+    rows = zip(*column_data.values())
+    while True:
+        writer.writerows(itertools.islice(rows, CSV_CHUNK_ROWS))
+        chunk = output.getvalue()
+        if not chunk:
+            return
+        yield chunk
+        output.seek(0)
+        output.truncate()
+
+def classify_columns_simple(column_data: Dict[str, List[Any]], columns: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Classify every column with classify_column_simple"""
+    if len(columns) <= 1:
+        return {col: classify_column_simple(column_data[col], col) for col in columns}
+    
+    # Columns are independent, so they are classified in a pool of threads
+    with ThreadPoolExecutor(max_workers=min(MAX_CLASSIFY_WORKERS, len(columns))) as executor:
+        classified = executor.map(lambda col: classify_column_simple(column_data[col], col), columns)
+        return dict(zip(columns, classified))
+
 @app.get("/")
 async def root():
     return {
@@ -274,9 +502,15 @@ async def upload_file(file: UploadFile = File(...)):
         if file_ext not in ['csv', 'xlsx', 'xls']:
             raise HTTPException(status_code=400, detail="Only CSV and Excel files are supported")
         
-        # Read file content
-        content = await file.read()
-        file_size_mb = len(content) / (1024 * 1024)
+        # The upload is already spooled (in memory when small, on disk when large), so it is
+        # measured and parsed in place rather than copied into one bytes object
+        source = file.file
+        file_size = file.size
+        if file_size is None:
+            source.seek(0, os.SEEK_END)
+            file_size = source.tell()
+        source.seek(0)
+        file_size_mb = file_size / (1024 * 1024)
         
         # Check file size limits (generous limits for everyone)
         limits = NO_LIMITS
@@ -287,12 +521,14 @@ async def upload_file(file: UploadFile = File(...)):
                 detail=f"File size ({file_size_mb:.1f}MB) exceeds maximum limit of {limits['max_file_size_mb']}MB"
             )
         
-        # Parse file based on type
-        rows = []
+        # Parse file based on type, keeping one list of values per column
+        # Excel is parsed by pandas; that DataFrame is kept for the pandas-based classifiers
+        # One row past the limit is enough to reject an oversized file, so parsing stops there
+        column_data = {}
+        df = None
+        parse_rows = limits["max_rows"] + 1
         if file_ext == 'csv':
-            text_content = content.decode('utf-8')
-            csv_reader = csv.DictReader(io.StringIO(text_content))
-            rows = list(csv_reader)
+            column_data = parse_csv_columns(source, parse_rows)
         elif file_ext in ['xlsx', 'xls']:
             if not EXCEL_SUPPORT:
                 raise HTTPException(status_code=400, detail="Excel support not available. Please convert to CSV.")
@@ -300,24 +536,25 @@ async def upload_file(file: UploadFile = File(...)):
             # Use pandas to read Excel
             if PANDAS_AVAILABLE:
                 try:
-                    df = pd.read_excel(io.BytesIO(content))
-                    rows = df.to_dict('records')
+                    df = read_excel_file(source, parse_rows)
+                    column_data = df.to_dict('list')
                 except Exception as e:
                     raise HTTPException(status_code=400, detail=f"Error reading Excel file: {str(e)}")
             else:
                 raise HTTPException(status_code=400, detail="Excel support requires pandas. Please convert to CSV.")
         
-        if not rows:
+        row_count = count_rows(column_data)
+        if not row_count:
             raise HTTPException(status_code=400, detail="File is empty")
         
         # Check row and column limits
-        if len(rows) > limits["max_rows"]:
+        if row_count > limits["max_rows"]:
             raise HTTPException(
                 status_code=413,
-                detail=f"File has {len(rows)} rows, exceeds maximum limit of {limits['max_rows']} rows"
+                detail=f"File has more than {limits['max_rows']} rows, exceeds maximum limit of {limits['max_rows']} rows"
             )
         
-        columns = list(rows[0].keys())
+        columns = list(column_data)
         if len(columns) > limits["max_columns"]:
             raise HTTPException(
                 status_code=413,
@@ -331,7 +568,8 @@ async def upload_file(file: UploadFile = File(...)):
             try:
                 if classifier_type == "ai_enhanced" and PANDAS_AVAILABLE:
                     # Use AI enhanced classifier with pandas
-                    df = pd.DataFrame(rows)
+                    if df is None:
+                        df = pd.DataFrame(column_data)
                     classification_results = classifier.classify_columns(df)
                     
                     for col_name, result in classification_results.items():
@@ -343,7 +581,8 @@ async def upload_file(file: UploadFile = File(...)):
                         }
                 elif classifier_type == "enhanced" and PANDAS_AVAILABLE:
                     # Use enhanced classifier with pandas
-                    df = pd.DataFrame(rows)
+                    if df is None:
+                        df = pd.DataFrame(column_data)
                     classification_results = classifier.classify_columns(df)
                     
                     for col_name, result in classification_results.items():
@@ -354,44 +593,41 @@ async def upload_file(file: UploadFile = File(...)):
                 else:
                     # Use basic classifier (if available)
                     for col in columns:
-                        col_data = [row.get(col, '') for row in rows]
+                        col_data = column_data[col]
                         result = classifier._classify_business_name(col_data) if hasattr(classifier, '_classify_business_name') else 0.5
                         classifications[col] = {"type": "Business Name", "confidence": result}
             except Exception as e:
                 print(f"Classifier error: {e}, falling back to simple classification")
                 # Fallback to simple classification
-                for col in columns:
-                    col_data = [row.get(col, '') for row in rows]
-                    classifications[col] = classify_column_simple(col_data, col)
+                classifications = classify_columns_simple(column_data, columns)
         else:
             # Use simple built-in classification
-            for col in columns:
-                col_data = [row.get(col, '') for row in rows]
-                classifications[col] = classify_column_simple(col_data, col)
+            classifications = classify_columns_simple(column_data, columns)
         
         # Create session
         session_id = str(uuid.uuid4())
         sessions[session_id] = {
             'filename': file.filename,
             'columns': columns,
-            'data': rows,
             'classifications': classifications,
-            'row_count': len(rows),
-            'file_size_mb': file_size_mb
+            'row_count': row_count,
+            'file_size_mb': file_size_mb,
+            'last_access': time.monotonic()
         }
+        cache_session_data(session_id, column_data)
         
         return {
             "session_id": session_id,
             "filename": file.filename,
             "columns": columns,
             "classifications": classifications,
-            "row_count": len(rows),
+            "row_count": row_count,
             "file_size_mb": round(file_size_mb, 2),
             "classifier_used": classifier_type,
             "message": f"File analyzed successfully using {classifier_type} classifier",
-            "sample_data": rows[:10] if len(rows) > 0 else [],  # First 10 rows for preview
+            "sample_data": columns_to_rows(column_data, 10),  # First 10 rows for preview
             "total_columns": len(columns),
-            "total_rows": len(rows)
+            "total_rows": row_count
         }
         
     except Exception as e:
@@ -407,6 +643,7 @@ async def process_columns(request: dict):
         if not session_id or session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
         
+        touch_session(session_id)
         session_data = sessions[session_id]
         
         # Filter data to only include selected columns
@@ -439,29 +676,24 @@ async def process_columns(request: dict):
             
             column_headers[col_name] = header_mapping.get(detected_type, col_name)
         
-        # Create cleaned data with proper headers
-        cleaned_data = []
-        for row in session_data['data']:
-            cleaned_row = {}
-            for original_col, new_header in column_headers.items():
-                cleaned_row[new_header] = row.get(original_col, '')
-            cleaned_data.append(cleaned_row)
+        # Create cleaned columns with proper headers
+        row_count = session_data['row_count']
+        cleaned_data = select_columns(get_session_data(session_id), column_headers, row_count)
         
-        # Update session with processed data
-        sessions[session_id]['processed_data'] = cleaned_data
+        # Update session with the selection; the download rebuilds the processed columns from it
         sessions[session_id]['selected_columns'] = selected_col_names
         sessions[session_id]['column_headers'] = column_headers
         
         # Return preview of first 10 rows
-        preview_data = cleaned_data[:10] if len(cleaned_data) > 0 else []
+        preview_data = columns_to_rows(cleaned_data, 10)
         
         return {
-            "message": f"Successfully processed {len(cleaned_data)} rows with {len(selected_col_names)} columns",
-            "processed_rows": len(cleaned_data),
+            "message": f"Successfully processed {row_count} rows with {len(selected_col_names)} columns",
+            "processed_rows": row_count,
             "selected_columns": selected_col_names,
             "column_headers": column_headers,
             "preview_data": preview_data,  # First 10 rows of processed data
-            "total_rows": len(cleaned_data),
+            "total_rows": row_count,
             "session_id": session_id
         }
         
@@ -475,34 +707,35 @@ async def download_processed_file(session_id: str):
         if session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
         
+        touch_session(session_id)
         session_data = sessions[session_id]
         
         # Get processed data or fallback to original data
-        data_to_export = session_data.get('processed_data', session_data['data'])
+        data_to_export = get_session_data(session_id)
+        if 'column_headers' in session_data:
+            data_to_export = select_columns(data_to_export, session_data['column_headers'], session_data['row_count'])
         
-        if not data_to_export:
-            raise HTTPException(status_code=400, detail="No data to download")
-        
-        # Create CSV content
-        output = io.StringIO()
-        if data_to_export:
-            writer = csv.DictWriter(output, fieldnames=data_to_export[0].keys())
-            writer.writeheader()
-            writer.writerows(data_to_export)
+        row_count = count_rows(data_to_export)
         
-        csv_content = output.getvalue()
+        if not row_count:
+            raise HTTPException(status_code=400, detail="No data to download")
         
         # Generate filename
         original_filename = session_data['filename']
         base_name = original_filename.rsplit('.', 1)[0]
         cleaned_filename = f"cleaned_{base_name}.csv"
-        
-        return {
-            "csv_data": csv_content,
-            "filename": cleaned_filename,
-            "row_count": len(data_to_export),
-            "message": "File ready for download"
-        }
+        quoted_filename = quote(cleaned_filename)
+        if quoted_filename == cleaned_filename:
+            content_disposition = f'attachment; filename="{cleaned_filename}"'
+        else:
+            content_disposition = f"attachment; filename*=utf-8''{quoted_filename}"
+        
+        # Stream the CSV in chunks rather than building the whole file in memory
+        return StreamingResponse(
+            iter_csv(data_to_export),
+            media_type="text/csv",
+            headers={"Content-Disposition": content_disposition}
+        )
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating download: {str(e)}")
@@ -1,13 +1,30 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+import asyncio
 import csv
-import io
+import hashlib
 import re
-import uuid
+import secrets
+import threading
+import time
 import os
+import zlib
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import BinaryIO, Iterator, List, Dict, Any, Tuple
+from urllib.parse import quote
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 try:
     from enhanced_column_classifier import EnhancedColumnClassifier
     ENHANCED_CLASSIFIER_AVAILABLE = True
@@ -16,7 +33,30 @@ except ImportError:
     ENHANCED_CLASSIFIER_AVAILABLE = False
     print("Enhanced classifier not available, using basic classifier")
 
-app = FastAPI(title="Data Cleaner API", version="1.0.0")
+# Sessions untouched for SESSION_TTL_SECONDS are removed by a background sweeper, and
+# beyond MAX_SESSIONS the least recently used ones are dropped
+SESSION_TTL_SECONDS = 30 * 60
+SESSION_SWEEP_INTERVAL_SECONDS = 60
+MAX_SESSIONS = 256
+
+async def sweep_sessions():
+    """Periodically remove sessions that have not been used within the TTL"""
+    while True:
+        await asyncio.sleep(SESSION_SWEEP_INTERVAL_SECONDS)
+        expired_before = time.monotonic() - SESSION_TTL_SECONDS
+        # Sessions are kept least recently used first, so the expired ones lead
+        while sessions and next(iter(sessions.values()))['last_access'] < expired_before:
+            sessions.popitem(last=False)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    sweeper = asyncio.create_task(sweep_sessions())
+    try:
+        yield
+    finally:
+        sweeper.cancel()
+
+app = FastAPI(title="Data Cleaner API", version="1.0.0", lifespan=lifespan)
 
 # CORS configuration
 app.add_middleware(
@@ -27,8 +67,68 @@ app.add_middleware(
     allow_headers=["*"],  # Allows all headers
 )
 
-# Simple in-memory storage for sessions
-sessions = {}
+class GZipRequestMiddleware:
+    """Decompress request bodies sent with Content-Encoding: gzip, a bounded chunk at a time
+
+    Bodies that inflate past MAX_DECOMPRESSED_BODY_BYTES are refused before the app spools them
+    """
+    
+    CHUNK_SIZE = 1 << 20
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        headers = dict(scope.get('headers', [])) if scope['type'] == 'http' else {}
+        if headers.get(b'content-encoding', b'').strip().lower() != b'gzip':
+            await self.app(scope, receive, send)
+            return
+        
+        # The app sees a plain body of unknown length
+        scope = dict(scope, headers=[(name, value) for name, value in scope['headers']
+                                     if name not in (b'content-encoding', b'content-length')])
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        pending = b''
+        more_body = True
+        finished = False
+        decompressed_size = 0
+        
+        async def receive_decompressed():
+            nonlocal pending, more_body, finished, decompressed_size
+            if finished:
+                # The body is complete; later messages (e.g. http.disconnect) pass through
+                return await receive()
+            if not pending and more_body:
+                message = await receive()
+                if message['type'] != 'http.request':
+                    return message
+                pending = message.get('body', b'')
+                more_body = message.get('more_body', False)
+            try:
+                body = decompressor.decompress(pending, self.CHUNK_SIZE)
+                pending = decompressor.unconsumed_tail
+                finished = not pending and not more_body
+                if finished:
+                    body += decompressor.flush()
+                    # Input ran out before the end of the gzip stream
+                    if not decompressor.eof:
+                        raise zlib.error('truncated gzip stream')
+            except zlib.error:
+                raise HTTPException(status_code=400, detail="Request body is not valid gzip data")
+            decompressed_size += len(body)
+            if decompressed_size > MAX_DECOMPRESSED_BODY_BYTES:
+                raise HTTPException(status_code=413, detail="Decompressed request body is too large")
+            return {'type': 'http.request', 'body': body, 'more_body': not finished}
+        
+        await self.app(scope, receive_decompressed, send)
+
+# Compress responses, chiefly CSV downloads, for clients that accept gzip, and accept
+# gzip-compressed uploads
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+app.add_middleware(GZipRequestMiddleware)
+
+# Simple in-memory storage for sessions, least recently used first
+sessions = OrderedDict()
 
 # Initialize the column classifier
 if ENHANCED_CLASSIFIER_AVAILABLE:
@@ -53,72 +153,143 @@ PREMIUM_TIER_LIMITS = {
     "daily_uploads": 1000,  # 1000 uploads per day for premium users
 }
 
+# Largest upload any tier accepts, plus room for the multipart framing around it
+MAX_DECOMPRESSED_BODY_BYTES = (PREMIUM_TIER_LIMITS["max_file_size_mb"] + 1) * 1024 * 1024
+
 # Track usage (in production, use a proper database)
 user_usage = {}
 
-def classify_column_simple(data: List[str], column_name: str) -> Dict[str, Any]:
-    """Simple column classification without pandas"""
-    if not data:
+# Rows written per chunk of a streamed CSV download
+CSV_CHUNK_ROWS = 10000
+
+# Classifications of recent uploads, keyed by a digest of the file content, so a file
+# uploaded again (e.g. while iterating on it) is not classified again
+CLASSIFY_CACHE_SIZE = 64
+classification_cache = OrderedDict()
+classification_cache_lock = threading.Lock()
+
+# Parsing and classification block, so uploads run on these threads instead of the event loop
+upload_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Phone number patterns
+PHONE_PATTERNS = [
+    r'\b\d{10}\b',  # 1234567890
+    r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b',  # 123-456-7890
+    r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}',  # (123) 456-7890
+]
+
+# Email pattern
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+
+# Business categories
+BUSINESS_KEYWORDS = [
+    'restaurant', 'cafe', 'store', 'shop', 'market', 'hotel', 'motel',
+    'hospital', 'clinic', 'pharmacy', 'bank', 'school', 'gym', 'spa',
+    'salon', 'bar', 'pub', 'office', 'company', 'corp', 'inc', 'llc'
+]
+
+# Shortest value any phone pattern can match (ten digits)
+PHONE_MIN_LENGTH = 10
+
+# Compiled once at import; the phone patterns are fused so each value is searched once
+PHONE_RE = re.compile('|'.join(f'(?:{p})' for p in PHONE_PATTERNS))
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+# Keywords match anywhere in the value, like a substring test, in any letter case
+BUSINESS_RE = re.compile('|'.join(map(re.escape, BUSINESS_KEYWORDS)), re.IGNORECASE)
+
+def read_csv_file(source: BinaryIO, nrows: int) -> pd.DataFrame:
+    """Read a binary CSV file object with every value as text, stopping after nrows rows"""
+    if PYARROW_AVAILABLE:
+        try:
+            header = next(csv.reader([source.readline().decode('utf-8-sig')]))
+            source.seek(0)
+            # pandas renames duplicate column names, so those files are left to it
+            if len(set(header)) == len(header):
+                reader = pa_csv.open_csv(
+                    source,
+                    read_options=pa_csv.ReadOptions(use_threads=True),
+                    parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                    convert_options=pa_csv.ConvertOptions(column_types={name: pa.string() for name in header})
+                )
+                # A quoted header spanning several lines is not all in the first line, so some
+                # columns would have inferred types or repeated names; such files are left to pandas
+                names = reader.schema.names
+                if len(set(names)) != len(names) or any(field.type != pa.string() for field in reader.schema):
+                    raise ValueError("header does not match the first line")
+                batches = []
+                parsed_rows = 0
+                for batch in reader:
+                    batches.append(batch)
+                    parsed_rows += batch.num_rows
+                    if parsed_rows >= nrows:
+                        break
+                return pa.Table.from_batches(batches, schema=reader.schema).slice(0, nrows).to_pandas()
+        except Exception:
+            # Ragged or unusual files are left to pandas, which also reports malformed ones
+            source.seek(0)
+    # index_col=False and usecols keep the header's columns, dropping extra fields on ragged rows
+    try:
+        return pd.read_csv(
+            source,
+            encoding='utf-8',
+            dtype=str,
+            keep_default_na=False,
+            index_col=False,
+            usecols=lambda name: True,
+            nrows=nrows
+        )
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
+
+def add_session(session_id: str, session_data: Dict[str, Any]) -> None:
+    """Store a new session, dropping the least recently used ones beyond MAX_SESSIONS"""
+    session_data['last_access'] = time.monotonic()
+    sessions[session_id] = session_data
+    while len(sessions) > MAX_SESSIONS:
+        sessions.popitem(last=False)
+
+def touch_session(session_id: str) -> None:
+    """Record that a session was just used, postponing its expiry and eviction"""
+    sessions[session_id]['last_access'] = time.monotonic()
+    sessions.move_to_end(session_id)
+
+def match_fraction(values: pd.Series, pattern: re.Pattern, candidates: pd.Series) -> float:
+    """Fraction of values matching pattern, running the regex only on the candidate values"""
+    matches = candidates.to_numpy(dtype=bool)
+    if matches.any():
+        matches[matches] = values[matches].str.contains(pattern).to_numpy(dtype=bool)
+    return float(matches.mean())
+
+def classify_column_simple(series: pd.Series, column_name: str) -> Dict[str, Any]:
+    """Simple column classification using vectorized pandas string methods"""
+    if series.empty:
         return {"type": "Unknown", "confidence": 0.0}
     
     # Remove empty/null values
-    clean_data = [str(item).strip() for item in data if item and str(item).strip()]
-    if not clean_data:
+    clean_data = series.dropna().astype(str).str.strip()
+    clean_data = clean_data[clean_data != '']
+    if clean_data.empty:
         return {"type": "Unknown", "confidence": 0.0}
     
-    # Phone number patterns
-    phone_patterns = [
-        r'\b\d{10}\b',  # 1234567890
-        r'\b\d{3}[-.\s]\d{3}[-.\s]\d{4}\b',  # 123-456-7890
-        r'\(\d{3}\)\s*\d{3}[-.\s]?\d{4}',  # (123) 456-7890
-    ]
-    
-    # Email pattern
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    # Check 100 items spread evenly over the column, so sorted files are not judged by their first rows
+    sample_size = min(100, len(clean_data))
+    sample_data = clean_data.iloc[np.linspace(0, len(clean_data) - 1, sample_size, dtype=int)]
     
-    # Business categories
-    business_keywords = [
-        'restaurant', 'cafe', 'store', 'shop', 'market', 'hotel', 'motel',
-        'hospital', 'clinic', 'pharmacy', 'bank', 'school', 'gym', 'spa',
-        'salon', 'bar', 'pub', 'office', 'company', 'corp', 'inc', 'llc'
-    ]
-    
-    # Count matches
-    phone_matches = 0
-    email_matches = 0
-    business_matches = 0
-    
-    sample_size = min(100, len(clean_data))  # Check first 100 items
-    sample_data = clean_data[:sample_size]
+    # Fraction of the sample matching each category, each scanned over the whole sample at once.
+    # Categories are checked in priority order, so once one is confirmed the rest are not scanned.
+    # Cheap necessary conditions pick the values worth a regex search
+    phone_pct = match_fraction(sample_data, PHONE_RE, sample_data.str.len() >= PHONE_MIN_LENGTH)
+    if phone_pct > 0.7:
+        return {"type": "Phone Number", "confidence": phone_pct}
     
-    for item in sample_data:
-        item_lower = item.lower()
-        
-        # Check phone patterns
-        for pattern in phone_patterns:
-            if re.search(pattern, item):
-                phone_matches += 1
-                break
-        
-        # Check email
-        if re.search(email_pattern, item):
-            email_matches += 1
-        
-        # Check business keywords
-        if any(keyword in item_lower for keyword in business_keywords):
-            business_matches += 1
+    email_pct = match_fraction(sample_data, EMAIL_RE, sample_data.str.contains('@', regex=False))
+    if email_pct > 0.7:
+        return {"type": "Email", "confidence": email_pct}
     
-    # Calculate percentages
-    phone_pct = phone_matches / sample_size
-    email_pct = email_matches / sample_size
-    business_pct = business_matches / sample_size
+    business_pct = float(sample_data.str.contains(BUSINESS_RE).mean())
     
     # Determine type based on highest confidence
-    if phone_pct > 0.7:
-        return {"type": "Phone Number", "confidence": phone_pct}
-    elif email_pct > 0.7:
-        return {"type": "Email", "confidence": email_pct}
-    elif business_pct > 0.5:
+    if business_pct > 0.5:
         return {"type": "Category", "confidence": business_pct}
     elif 'name' in column_name.lower() and business_pct > 0.2:
         return {"type": "Business Name", "confidence": 0.8}
@@ -127,6 +298,83 @@ def classify_column_simple(data: List[str], column_name: str) -> Dict[str, Any]:
     else:
         return {"type": "Unknown", "confidence": 0.3}
 
+def file_digest(source: BinaryIO) -> str:
+    """Hash a binary file object's content, leaving it at the start"""
+    digest = hashlib.blake2b()
+    source.seek(0)
+    for block in iter(lambda: source.read(1 << 20), b''):
+        digest.update(block)
+    source.seek(0)
+    return digest.hexdigest()
+
+def classify_dataframe(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """Classify every column of an upload with the available classifier"""
+    if ENHANCED_CLASSIFIER_AVAILABLE:
+        # Use enhanced classifier
+        classification_results = column_classifier.classify_columns(df)
+        
+        # Convert to the expected format
+        classifications = {}
+        for col_name, result in classification_results.items():
+            classifications[col_name] = {
+                "type": result['suggested_category'],
+                "confidence": result['confidence']
+            }
+    else:
+        # Fallback to simple classification, one column Series at a time
+        classifications = {}
+        for col_name in df.columns:
+            classifications[col_name] = classify_column_simple(df[col_name], col_name)
+    return classifications
+
+def cached_classifications(content_digest: str, df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """Classify an upload, reusing the result for a file with the same content digest"""
+    with classification_cache_lock:
+        classifications = classification_cache.get(content_digest)
+        if classifications is not None:
+            classification_cache.move_to_end(content_digest)
+            return classifications
+    classifications = classify_dataframe(df)
+    with classification_cache_lock:
+        classification_cache[content_digest] = classifications
+        while len(classification_cache) > CLASSIFY_CACHE_SIZE:
+            classification_cache.popitem(last=False)
+    return classifications
+
+def parse_and_classify(source: BinaryIO, limits: Dict[str, int], tier: str) -> Tuple[pd.DataFrame, Dict[str, Dict[str, Any]]]:
+    """Parse an upload, check it against the tier limits and classify its columns"""
+    # The same bytes always parse and classify the same way
+    content_digest = file_digest(source)
+    
+    # Parse CSV, decoding the UTF-8 bytes as they are read and keeping every value as text.
+    # One row past the limit is enough to reject an oversized file, so parsing stops there.
+    df = read_csv_file(source, limits["max_rows"] + 1)
+    
+    if df.empty:
+        raise HTTPException(status_code=400, detail="CSV file is empty")
+    
+    # Check row and column limits
+    if len(df) > limits["max_rows"]:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File has more than {limits['max_rows']} rows, exceeds {tier} tier limit of {limits['max_rows']} rows"
+        )
+    
+    if len(df.columns) > limits["max_columns"]:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File has {len(df.columns)} columns, exceeds {tier} tier limit of {limits['max_columns']} columns"
+        )
+    
+    return df, cached_classifications(content_digest, df)
+
+def iter_csv(df: pd.DataFrame, columns: List[str]) -> Iterator[str]:
+    """Yield CSV text for some columns of a DataFrame, CSV_CHUNK_ROWS rows at a time"""
+    # The csv module's line endings, as the download has always used
+    yield df.head(0).to_csv(columns=columns, index=False, lineterminator='\r\n')
+    for start in range(0, len(df), CSV_CHUNK_ROWS):
+        yield df.iloc[start:start + CSV_CHUNK_ROWS].to_csv(columns=columns, index=False, header=False, lineterminator='\r\n')
+
 @app.get("/")
 async def root():
     return {"message": "Data Cleaner API is running!", "status": "healthy"}
@@ -169,6 +417,7 @@ async def get_pricing():
                 "limits": PREMIUM_TIER_LIMITS
             }
         },
+        "session_ttl_minutes": SESSION_TTL_SECONDS // 60,
         "buymeacoffee": {
             "url": "https://buymeacoffee.com/datacleaner",
             "message": "Support this project! ☕"
@@ -182,9 +431,14 @@ async def upload_file(file: UploadFile = File(...), is_premium: bool = False):
         if not file.filename.endswith('.csv'):
             raise HTTPException(status_code=400, detail="Only CSV files are supported")
         
-        # Read file content
-        content = await file.read()
-        file_size_mb = len(content) / (1024 * 1024)
+        # The upload is already spooled (in memory when small, on disk when large), so it is
+        # measured and parsed in place rather than copied into one bytes object
+        source = file.file
+        file_size = file.size
+        if file_size is None:
+            source.seek(0, os.SEEK_END)
+            file_size = source.tell()
+        file_size_mb = file_size / (1024 * 1024)
         
         # Check freemium limits
         limits = PREMIUM_TIER_LIMITS if is_premium else FREE_TIER_LIMITS
@@ -195,83 +449,42 @@ async def upload_file(file: UploadFile = File(...), is_premium: bool = False):
                 detail=f"File size ({file_size_mb:.1f}MB) exceeds {'premium' if is_premium else 'free'} tier limit of {limits['max_file_size_mb']}MB"
             )
         
-        text_content = content.decode('utf-8')
-        
-        # Parse CSV
-        csv_reader = csv.DictReader(io.StringIO(text_content))
-        rows = list(csv_reader)
-        
-        if not rows:
-            raise HTTPException(status_code=400, detail="CSV file is empty")
-        
-        # Check row and column limits
-        if len(rows) > limits["max_rows"]:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File has {len(rows)} rows, exceeds {'premium' if is_premium else 'free'} tier limit of {limits['max_rows']} rows"
-            )
-        
-        columns = list(rows[0].keys())
-        if len(columns) > limits["max_columns"]:
-            raise HTTPException(
-                status_code=413,
-                detail=f"File has {len(columns)} columns, exceeds {'premium' if is_premium else 'free'} tier limit of {limits['max_columns']} columns"
-            )
-        
-        # Extract column data and create DataFrame for enhanced classification
-        if ENHANCED_CLASSIFIER_AVAILABLE:
-            # Use pandas DataFrame for enhanced classifier
-            df = pd.DataFrame(rows)
-            
-            # Use enhanced classifier
-            classification_results = column_classifier.classify_columns(df)
-            
-            # Convert to the expected format
-            classifications = {}
-            for col_name, result in classification_results.items():
-                classifications[col_name] = {
-                    "type": result['suggested_category'],
-                    "confidence": result['confidence']
-                }
-        else:
-            # Fallback to simple classification
-            column_data = {}
-            for col in columns:
-                column_data[col] = [row.get(col, '') for row in rows]
-            
-            # Classify columns using simple method
-            classifications = {}
-            for col_name, col_data in column_data.items():
-                classifications[col_name] = classify_column_simple(col_data, col_name)
+        # Parse and classify off the event loop so other requests keep being served
+        loop = asyncio.get_running_loop()
+        df, classifications = await loop.run_in_executor(
+            upload_executor, parse_and_classify, source, limits, 'premium' if is_premium else 'free'
+        )
+        columns = df.columns.tolist()
+        row_count = len(df)
         
         # Create session
-        session_id = str(uuid.uuid4())
-        sessions[session_id] = {
+        session_id = secrets.token_urlsafe(16)
+        add_session(session_id, {
             'filename': file.filename,
             'columns': columns,
-            'data': rows,
+            'df': df,
             'classifications': classifications,
-            'row_count': len(rows),
+            'row_count': row_count,
             'file_size_mb': file_size_mb,
             'is_premium': is_premium
-        }
+        })
         
         return {
             "session_id": session_id,
             "filename": file.filename,
             "columns": columns,
             "classifications": classifications,
-            "row_count": len(rows),
+            "row_count": row_count,
             "file_size_mb": round(file_size_mb, 2),
             "tier": "premium" if is_premium else "free",
             "limits_used": {
-                "rows": f"{len(rows)}/{limits['max_rows']}",
+                "rows": f"{row_count}/{limits['max_rows']}",
                 "columns": f"{len(columns)}/{limits['max_columns']}",
                 "file_size": f"{file_size_mb:.1f}MB/{limits['max_file_size_mb']}MB"
             },
-            "sample_data": rows[:10] if len(rows) > 0 else [],  # First 10 rows for preview
+            "sample_data": df.head(10).to_dict('records'),  # First 10 rows for preview
             "total_columns": len(columns),
-            "total_rows": len(rows)
+            "total_rows": row_count
         }
         
     except Exception as e:
@@ -287,25 +500,21 @@ async def process_columns(data: Dict[str, Any]):
         if not session_id or session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
         
+        touch_session(session_id)
         session = sessions[session_id]
         
-        # Filter data based on selected columns
-        filtered_data = []
-        for row in session['data']:
-            filtered_row = {}
-            for col_name, include in selected_columns.items():
-                if include and col_name in row:
-                    filtered_row[col_name] = row[col_name]
-            if filtered_row:  # Only add non-empty rows
-                filtered_data.append(filtered_row)
+        # Keep the selected columns that exist, in the order they were selected. Only the
+        # names are stored; the download writes those columns straight from the DataFrame.
+        df = session['df']
+        processed_columns = [col_name for col_name, include in selected_columns.items() if include and col_name in df.columns]
         
         # Update session with processed data
-        session['processed_data'] = filtered_data
+        session['processed_columns'] = processed_columns
         session['selected_columns'] = selected_columns
         
         return {
             "message": "Columns processed successfully",
-            "processed_rows": len(filtered_data),
+            "processed_rows": len(df) if processed_columns else 0,
             "selected_columns": list(selected_columns.keys())
         }
         
@@ -319,25 +528,25 @@ async def download_processed_file(session_id: str):
         if session_id not in sessions:
             raise HTTPException(status_code=404, detail="Session not found")
         
+        touch_session(session_id)
         session = sessions[session_id]
-        processed_data = session.get('processed_data', [])
+        processed_columns = session.get('processed_columns')
         
-        if not processed_data:
+        if not processed_columns:
             raise HTTPException(status_code=400, detail="No processed data available")
         
-        # Create CSV content
-        output = io.StringIO()
-        if processed_data:
-            fieldnames = processed_data[0].keys()
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(processed_data)
-        
-        csv_content = output.getvalue()
+        cleaned_filename = f"cleaned_{session['filename']}"
+        quoted_filename = quote(cleaned_filename)
+        if quoted_filename == cleaned_filename:
+            content_disposition = f'attachment; filename="{cleaned_filename}"'
+        else:
+            content_disposition = f"attachment; filename*=utf-8''{quoted_filename}"
         
-        return JSONResponse(
-            content={"csv_data": csv_content, "filename": f"cleaned_{session['filename']}"},
-            headers={"Content-Type": "application/json"}
+        # Stream the CSV in chunks rather than building the whole file in memory
+        return StreamingResponse(
+            iter_csv(session['df'], processed_columns),
+            media_type="text/csv",
+            headers={"Content-Disposition": content_disposition}
         )
         
     except Exception as e:
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Tests for the AI Enhanced Column Classifier, with the AI APIs mocked out
+"""
+
+import asyncio
+import json
+import sys
+import os
+
+import pytest
+
+# Add backend directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import ai_enhanced_classifier
+from ai_enhanced_classifier import AIClassificationResult, AIEnhancedColumnClassifier, AIResultCache
+
+GROQ_CONFIG = {'url': 'https://api.groq.test/chat/completions', 'headers': {}}
+PAYLOAD = {'model': 'test', 'max_tokens': 10}
+
+@pytest.fixture
+def classifier(monkeypatch):
+    """A classifier with only Groq enabled, no rate limits and an in-memory result cache."""
+    monkeypatch.setenv('GROQ_API_KEY', 'test-key')
+    monkeypatch.delenv('OPENROUTER_API_KEY', raising=False)
+    monkeypatch.delenv('HUGGINGFACE_API_KEY', raising=False)
+    monkeypatch.setenv('AI_CLASSIFIER_CACHE', '')
+    return AIEnhancedColumnClassifier(max_requests_per_minute=None, max_tokens_per_minute=None)
+
+class FakeResponse:
+    def __init__(self, status_code, body=b'{}', headers=None):
+        self.status_code = status_code
+        self.content = body
+        self.text = body.decode()
+        self.headers = headers or {}
+
+class FakeHTTP:
+    """Stands in for requests.Session, answering POSTs from a list of responses."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def post(self, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record time.sleep calls instead of sleeping."""
+    recorded = []
+    monkeypatch.setattr(ai_enhanced_classifier.time, 'sleep', recorded.append)
+    return recorded
+
+def test_post_with_retry_recovers_from_transient_errors(classifier, sleeps):
+    """A 503 followed by a 200 is retried once, after a backoff."""
+    classifier._http = FakeHTTP([FakeResponse(503), FakeResponse(200, b'{"ok": true}')])
+
+    assert classifier._post_with_retry('groq', GROQ_CONFIG, PAYLOAD) == {'ok': True}
+    assert classifier._http.calls == 2
+    assert len([delay for delay in sleeps if delay > 0]) == 1
+
+def test_post_with_retry_caps_retry_after_and_skips_the_last_sleep(classifier, sleeps):
+    """Retry-After is capped at MAX_BACKOFF, and there is no sleep after the final attempt."""
+    attempts = classifier.MAX_ATTEMPTS
+    classifier._http = FakeHTTP([FakeResponse(429, headers={'Retry-After': '3600'})] * attempts)
+
+    assert classifier._post_with_retry('groq', GROQ_CONFIG, PAYLOAD) is None
+    assert classifier._http.calls == attempts
+    backoffs = [delay for delay in sleeps if delay > 0]
+    assert backoffs == [classifier.MAX_BACKOFF] * (attempts - 1)
+
+def test_post_with_retry_does_not_retry_client_errors(classifier, sleeps):
+    """Errors outside RETRY_STATUS_CODES fail straight away."""
+    classifier._http = FakeHTTP([FakeResponse(401)])
+
+    assert classifier._post_with_retry('groq', GROQ_CONFIG, PAYLOAD) is None
+    assert classifier._http.calls == 1
+    assert not [delay for delay in sleeps if delay > 0]
+
+def test_batch_prompt_numbers_every_column(classifier):
+    """The batch prompt lists each column with its index, name and first samples."""
+    prompt = classifier._create_batch_classification_prompt([
+        ('shop', ["Joe's Pizza", 'The Cafe', 'McDonalds', 'Starbucks'], 'Business Name'),
+        ('contact', ['555-123-4567'], 'Phone Number'),
+    ])
+
+    assert '1. name="shop" samples=["Joe\'s Pizza", "The Cafe", "McDonalds"] current="Business Name"' in prompt
+    assert '2. name="contact" samples=["555-123-4567"] current="Phone Number"' in prompt
+
+def test_batch_response_skips_only_malformed_items(classifier):
+    """An item with a bad index or confidence loses its own column, not the ones after it."""
+    response = '''Here you go: {"results": [
+        {"index": "first", "category": "Email", "confidence": 0.9, "reasoning": "bad index"},
+        {"index": 2, "category": "Phone Number", "confidence": "high", "reasoning": "bad confidence"},
+        {"index": 3, "category": "Location", "confidence": 0.8, "reasoning": "addresses"},
+        {"index": 4, "category": "Not a category", "confidence": 0.8, "reasoning": "unknown"},
+        {"index": 5, "category": "Hours", "confidence": 0.7, "reasoning": "opening times"}
+    ]}'''
+
+    parsed = classifier._parse_ai_batch_response(response, 5)
+
+    assert sorted(parsed) == [3, 5]
+    assert parsed[3].category == 'Location'
+    assert parsed[5].confidence == 0.7
+
+def test_batch_response_with_missing_results_keeps_the_rest(classifier):
+    """A response with fewer results than columns still returns the ones it has."""
+    response = '{"results": [{"index": 2, "category": "Email", "confidence": 0.95, "reasoning": "addresses"}]}'
+
+    parsed = classifier._parse_ai_batch_response(response, 3)
+
+    assert list(parsed) == [2]
+    assert parsed[2].category == 'Email'
+
+def test_result_cache_persists_to_sqlite(tmp_path):
+    """Results written by one cache are read back from disk by a new one."""
+    path = str(tmp_path / 'ai_classifier.sqlite')
+    key = AIResultCache.make_key('contact', ['555-123-4567', '(555) 987-6543'], 'Phone Number')
+    result = AIClassificationResult(category='Phone Number', confidence=0.95, reasoning='Phone formats')
+
+    AIResultCache(path).set_many({key: result})
+
+    cache = AIResultCache(path)
+    assert cache.get(key) == result
+    assert cache.get(AIResultCache.make_key('contact', ['555-123-4567'], 'Email')) is None
+
+def run_race(classifier, delays):
+    """Race fake APIs that answer after delays[api_name] seconds; None means an empty answer."""
+    cancelled = []
+
+    async def query(api_name, api_config):
+        delay, answer = delays[api_name]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(api_name)
+            raise
+        return answer
+
+    async def race():
+        result = await classifier._race_apis(query)
+        # Let cancelled tasks run their handlers
+        await asyncio.sleep(0)
+        return result
+
+    for api_config in classifier.ai_apis.values():
+        api_config['enabled'] = True
+    return asyncio.run(race()), cancelled
+
+def test_race_returns_first_usable_answer_and_cancels_the_rest(classifier):
+    """An empty answer is skipped; the first usable one wins and slower APIs are cancelled."""
+    result, cancelled = run_race(classifier, {
+        'openrouter': (0.01, None),
+        'groq': (0.02, {'answer': 'groq'}),
+        'huggingface': (5, {'answer': 'huggingface'}),
+    })
+
+    assert result == {'answer': 'groq'}
+    assert cancelled == ['huggingface']
+
+def test_race_gives_up_at_the_deadline(classifier):
+    """No answer within RACE_TIMEOUT returns None and cancels every request."""
+    classifier.RACE_TIMEOUT = 0.05
+    result, cancelled = run_race(classifier, {api_name: (5, {'answer': api_name}) for api_name in classifier.ai_apis})
+
+    assert result is None
+    assert sorted(cancelled) == sorted(classifier.ai_apis)
+
+class FakeBatchAPI:
+    """Stands in for the Groq files/batches endpoints, recording every request."""
+
+    def __init__(self):
+        self.requests = []
+
+    def __call__(self, method, url, api_config, **kwargs):
+        self.requests.append((method, url.rsplit('/', 1)[-1]))
+        if url.endswith('/files'):
+            return {'id': 'file-new'}
+        if url.endswith('/batches'):
+            return {'id': 'batch-new'}
+        return {'status': 'completed', 'output_file_id': f'output-of-{url.rsplit("/", 1)[-1]}'}
+
+def run_batch_job(classifier, monkeypatch, job_id_path, columns):
+    """Run a batch job against FakeBatchAPI; returns the requests made and the output file downloaded."""
+    api = FakeBatchAPI()
+    downloads = []
+    monkeypatch.setattr(classifier, '_batch_api_request', api)
+    monkeypatch.setattr(classifier, '_download_batch_results',
+                        lambda base_url, api_config, output_file_id, column_names: downloads.append(output_file_id) or {})
+    classifier._run_batch_job(columns, job_id_path, max_wait=1, poll_interval=0)
+    return api.requests, downloads
+
+def test_batch_job_resumes_only_for_the_same_column_data(classifier, monkeypatch, tmp_path):
+    """A saved job is resumed for identical columns, and replaced when the samples differ."""
+    job_id_path = str(tmp_path / 'batch.json')
+    columns = [('name', ["Joe's Pizza", 'The Cafe'], 'Business Name', 0.5),
+               ('phone', ['555-123-4567', '555-987-6543'], 'Phone Number', 0.5)]
+    column_keys = [AIResultCache.make_key(column, samples, category) for column, samples, category, _ in columns]
+
+    with open(job_id_path, 'w') as f:
+        json.dump({'batch_id': 'batch-saved', 'column_keys': column_keys}, f)
+    requests_made, downloads = run_batch_job(classifier, monkeypatch, job_id_path, columns)
+    assert requests_made == [('get', 'batch-saved')]
+    assert downloads == ['output-of-batch-saved']
+    assert not os.path.exists(job_id_path)
+
+    # Same headers, different data: the saved job must not be reused
+    with open(job_id_path, 'w') as f:
+        json.dump({'batch_id': 'batch-saved', 'column_keys': column_keys}, f)
+    other_columns = [('name', ['Local Pharmacy', 'Starbucks'], 'Business Name', 0.5),
+                     ('phone', ['555-111-2222', '555-444-3333'], 'Phone Number', 0.5)]
+    requests_made, downloads = run_batch_job(classifier, monkeypatch, job_id_path, other_columns)
+    assert requests_made == [('post', 'files'), ('post', 'batches'), ('get', 'batch-new')]
+    assert downloads == ['output-of-batch-new']
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Tests for the Column Classifier
+"""
+
+import pandas as pd
+import sys
+import os
+
+# Add backend directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from column_classifier import ColumnClassifier
+
+SCORED_CATEGORIES = [
+    'Business Name', 'Phone Number', 'Email', 'Category', 'Location',
+    'Social Links', 'Review', 'Hours', 'Price'
+]
+
+def test_all_scores_lists_every_category():
+    """all_scores keeps the same keys whether or not scoring stopped early."""
+    df = pd.DataFrame({
+        # Capped at 1.0 by its name and content, so later categories are skipped
+        'email': ['info@joespizza.com', 'contact@coffeebean.com', 'hello@starbucks.com'],
+        'notes': ['Great pizza', 'Friendly staff', 'Open late'],
+    })
+
+    results = ColumnClassifier().classify_columns(df)
+
+    for column in df.columns:
+        assert list(results[column]['all_scores']) == SCORED_CATEGORIES
+
+    email_scores = results['email']['all_scores']
+    assert results['email']['suggested_category'] == 'Email'
+    assert email_scores['Email'] == 1.0
+    assert email_scores['Price'] is None
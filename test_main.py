@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the Data Cleaner API in main.py
+"""
+
+import asyncio
+import sys
+import os
+import tempfile
+import time
+
+import pandas as pd
+from fastapi.testclient import TestClient
+
+# Add backend directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+
+client = TestClient(main.app)
+
+def test_upload_keeps_csv_values_as_pandas_reads_them():
+    """Duplicate headers are renamed and timestamps are written back unchanged."""
+    data = (
+        b"name,when,name\n"
+        b"Joe's Pizza,2024-01-05 10:00,Pizza Palace\n"
+        b"The Cafe,2024-01-06 11:30,Coffee Bean\n"
+    )
+
+    response = client.post('/upload-file', files={'file': ('shops.csv', data)})
+    assert response.status_code == 200
+    result = response.json()
+    assert list(result['columns']) == ['name', 'when', 'name.1']
+    assert result['preview_data'][0]['when'] == '2024-01-05 10:00'
+
+    session_id = result['session_id']
+    response = client.post('/process-columns', json={'session_id': session_id, 'selected_columns': ['when', 'name.1']})
+    assert response.status_code == 200
+    download = client.get(f'/download/{session_id}')
+    assert download.text.splitlines()[1] == '2024-01-05 10:00,Pizza Palace'
+
+    client.delete(f'/session/{session_id}')
+
+def add_test_session(session_id: str, df: pd.DataFrame) -> None:
+    """Register a session the way /upload-file does."""
+    main.sessions[session_id] = main.Session(filename=f'{session_id}.csv', column_analysis={},
+                                             last_access=time.monotonic())
+    main.cache_session_dataframe(session_id, df)
+
+def test_least_recently_used_sessions_spill_to_disk(monkeypatch):
+    """Sessions past MAX_LOADED_SESSIONS are pickled and reloaded on use."""
+    monkeypatch.setattr(main, 'MAX_LOADED_SESSIONS', 2)
+    frames = {f'spill-{i}': pd.DataFrame({'name': [f'Shop {i}'], 'phone': ['555-123-4567']}) for i in range(3)}
+    for session_id, df in frames.items():
+        add_test_session(session_id, df)
+
+    try:
+        spilled = main.sessions['spill-0']
+        assert list(main.loaded_dataframes) == ['spill-1', 'spill-2']
+        assert spilled.dataframe_file is not None and os.path.exists(spilled.dataframe_file)
+
+        pd.testing.assert_frame_equal(main.get_session_dataframe('spill-0'), frames['spill-0'])
+        assert list(main.loaded_dataframes) == ['spill-2', 'spill-0']
+    finally:
+        for session_id in frames:
+            main.remove_session(session_id)
+
+def test_remove_session_deletes_temporary_files(monkeypatch):
+    """A removed session leaves no spilled DataFrame or output file behind."""
+    monkeypatch.setattr(main, 'MAX_LOADED_SESSIONS', 0)
+    add_test_session('remove-me', pd.DataFrame({'name': ['Shop']}))
+    session_data = main.sessions['remove-me']
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.csv') as output_file:
+        output_file.write(b'name\nShop\n')
+    session_data.output_file = output_file.name
+    temporary_files = [session_data.dataframe_file, session_data.output_file]
+    assert all(os.path.exists(path) for path in temporary_files)
+
+    main.remove_session('remove-me')
+
+    assert 'remove-me' not in main.sessions
+    assert 'remove-me' not in main.loaded_dataframes
+    assert not any(os.path.exists(path) for path in temporary_files)
+
+def test_sweeper_removes_expired_sessions(monkeypatch):
+    """Sessions idle for longer than SESSION_TTL_SECONDS are swept, recent ones kept."""
+    add_test_session('idle', pd.DataFrame({'name': ['Shop']}))
+    # Move the clock past the TTL; it keeps ticking so the event loop still works
+    monotonic = time.monotonic
+    monkeypatch.setattr(time, 'monotonic', lambda: monotonic() + main.SESSION_TTL_SECONDS + 1)
+    monkeypatch.setattr(main, 'SESSION_SWEEP_INTERVAL_SECONDS', 0)
+    add_test_session('active', pd.DataFrame({'name': ['Shop']}))
+
+    async def sweep_once():
+        sweeper = asyncio.create_task(main.sweep_sessions())
+        await asyncio.sleep(0.01)
+        sweeper.cancel()
+
+    try:
+        asyncio.run(sweep_once())
+        assert 'idle' not in main.sessions
+        assert 'active' in main.sessions
+    finally:
+        for session_id in ('idle', 'active'):
+            if session_id in main.sessions:
+                main.remove_session(session_id)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for the Data Cleaner API in main_robust.py
+"""
+
+import io
+import sys
+import os
+import time
+
+# Add backend directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main_robust
+
+def test_spilled_session_data_reloads_and_is_removed(monkeypatch):
+    """Column data past MAX_LOADED_SESSIONS is pickled, reloaded on use and deleted with its session."""
+    monkeypatch.setattr(main_robust, 'MAX_LOADED_SESSIONS', 1)
+    column_data = {
+        'first': {'name': ['Shop A', 'Shop B'], 'phone': ['555-123-4567', '']},
+        'second': {'name': ['Shop C'], 'phone': ['555-987-6543']},
+    }
+    for session_id, data in column_data.items():
+        main_robust.sessions[session_id] = {'filename': f'{session_id}.csv', 'last_access': time.monotonic()}
+        main_robust.cache_session_data(session_id, data)
+
+    try:
+        data_file = main_robust.sessions['first']['data_file']
+        assert list(main_robust.loaded_data) == ['second']
+        assert os.path.exists(data_file)
+
+        assert main_robust.get_session_data('first') == column_data['first']
+        assert list(main_robust.loaded_data) == ['first']
+
+        main_robust.remove_session('first')
+        assert not os.path.exists(data_file)
+    finally:
+        for session_id in column_data:
+            if session_id in main_robust.sessions:
+                main_robust.remove_session(session_id)
+
+def test_csv_columns_match_the_csv_module(monkeypatch):
+    """pyarrow, when installed, parses to the same text values as csv.DictReader."""
+    files = [
+        b"name,phone\nJoe's Pizza,555-123-4567\nThe Cafe,\n",
+        # A quoted header spanning two lines
+        b'"shop\nname",rating\nThe Cafe,4\n',
+    ]
+    for data in files:
+        parsed = main_robust.parse_csv_columns(io.BytesIO(data))
+        monkeypatch.setattr(main_robust, 'PYARROW_AVAILABLE', False)
+        assert parsed == main_robust.parse_csv_columns(io.BytesIO(data))
+        monkeypatch.undo()
+
+    assert parsed == {'shop\nname': ['The Cafe'], 'rating': ['4']}
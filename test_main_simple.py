@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for the Data Cleaner API in main_simple.py
+"""
+
+import gzip
+import io
+import sys
+import os
+import zlib
+
+import httpx
+import pandas as pd
+from fastapi.testclient import TestClient
+
+# Add backend directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main_simple
+
+client = TestClient(main_simple.app)
+
+CSV_DATA = b"name,phone\nJoe's Pizza,555-123-4567\nThe Cafe,(555) 987-6543\n"
+
+def post_gzip_upload(compressed_body):
+    """POST a multipart upload of CSV_DATA whose body is replaced by compressed_body(body)."""
+    request = httpx.Request('POST', 'http://testserver/upload-file', files={'file': ('shops.csv', CSV_DATA)})
+    return client.post(
+        '/upload-file',
+        content=compressed_body(request.read()),
+        headers={'Content-Type': request.headers['Content-Type'], 'Content-Encoding': 'gzip'}
+    )
+
+def test_gzip_upload_is_decompressed():
+    """A gzip-encoded upload is parsed like a plain one."""
+    response = post_gzip_upload(gzip.compress)
+    assert response.status_code == 200
+    assert response.json()['columns'] == ['name', 'phone']
+    main_simple.sessions.pop(response.json()['session_id'])
+
+def test_invalid_gzip_upload_is_rejected():
+    """A body that is not gzip data is a client error."""
+    response = post_gzip_upload(lambda body: b'not gzip ' + body)
+    assert response.status_code == 400
+
+def test_truncated_gzip_upload_is_rejected():
+    """A gzip stream cut off before its end is a client error, not a missing field."""
+    response = post_gzip_upload(lambda body: gzip.compress(body)[:-20])
+    assert response.status_code == 400
+    assert response.json()['detail'] == "Request body is not valid gzip data"
+
+def test_read_csv_file_keeps_every_value_as_text(monkeypatch):
+    """pyarrow, when installed, reads the same text values as the pandas fallback."""
+    files = [
+        b"name,phone,rating\nJoe's Pizza,555-123-4567,4\nThe Cafe,,5\n",
+        # A quoted header spanning two lines
+        b'"shop\nname",rating\nThe Cafe,4\n',
+    ]
+    for data in files:
+        df = main_simple.read_csv_file(io.BytesIO(data), nrows=10)
+        monkeypatch.setattr(main_simple, 'PYARROW_AVAILABLE', False)
+        pd.testing.assert_frame_equal(df, main_simple.read_csv_file(io.BytesIO(data), nrows=10))
+        monkeypatch.undo()
+
+    assert df.to_dict('list') == {'shop\nname': ['The Cafe'], 'rating': ['4']}
+
+def test_gzip_bomb_upload_is_rejected():
+    """A small gzip body that inflates past the largest tier limit is refused with 413."""
+    boundary = 'upload-boundary'
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    chunks = [compressor.compress(
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="big.csv"\r\n\r\nname\r\n'.encode()
+    )]
+    zeros = b'0' * (1 << 20)
+    for _ in range(main_simple.MAX_DECOMPRESSED_BODY_BYTES // len(zeros) + 1):
+        chunks.append(compressor.compress(zeros))
+    chunks.append(compressor.compress(f'\r\n--{boundary}--\r\n'.encode()))
+    chunks.append(compressor.flush())
+    body = b''.join(chunks)
+    assert len(body) < 1 << 20
+
+    response = client.post(
+        '/upload-file?is_premium=true',
+        content=body,
+        headers={'Content-Type': f'multipart/form-data; boundary={boundary}', 'Content-Encoding': 'gzip'}
+    )
+    assert response.status_code == 413